@@ -74,10 +74,7 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
     return db_user
 
 
-async def get_current_user(
-    token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> Optional[models.User]:
+def get_user_from_token(db: Session, token: Optional[str]) -> Optional[models.User]:
     if not token:
         return None
     try:
@@ -87,8 +84,15 @@ async def get_current_user(
             return None
     except JWTError:
         return None
-    user = get_user_by_id(db, user_id)
-    return user
+    return get_user_by_id(db, user_id)
+
+
+def get_current_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Optional[models.User]:
+    # Plain def: FastAPI runs the user lookup on its threadpool instead of the event loop
+    return get_user_from_token(db, token)
 
 
 async def get_current_user_required(
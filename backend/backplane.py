@@ -0,0 +1,217 @@
+"""
+Broadcast backplane so several uvicorn workers can serve the same WebSocket rooms.
+
+A PUT handled by one worker has to reach viewers connected to every other worker, viewer
+counts have to be summed across workers, and controller heartbeats recorded by one worker
+must be visible to all of them.
+
+- InProcessBackplane (default): everything stays in this process. Use with a single worker.
+- SQLiteBackplane: a small bus database shared by all workers on the host. Events are
+  appended to a table and each worker tails it; presence and heartbeats live in tables too.
+
+Select with BACKPLANE=memory|sqlite (and BACKPLANE_DB_PATH for the bus file).
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+from realtime import encode_message
+
+
+BACKPLANE = os.getenv("BACKPLANE", "memory")
+BACKPLANE_DB_PATH = os.getenv("BACKPLANE_DB_PATH", "./scoreboard_bus.db")
+BACKPLANE_POLL_SECONDS = float(os.getenv("BACKPLANE_POLL_SECONDS", "0.05"))
+# Presence rows not refreshed within this window belong to a dead worker and are ignored
+PRESENCE_TTL_SECONDS = 30
+# Bus events are only needed until every worker has tailed them
+EVENT_RETENTION_SECONDS = 60
+
+Deliver = Callable[[str, dict], Awaitable[None]]
+
+
+class InProcessBackplane:
+    """Single-process backplane: publishing delivers straight to this worker's rooms"""
+
+    # Nothing stored here is read by another worker
+    shared = False
+
+    def __init__(self):
+        self.deliver: Optional[Deliver] = None
+        self.presence: Dict[str, int] = {}
+        self.heartbeats: Dict[str, datetime] = {}
+
+    async def start(self, deliver: Deliver):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    async def publish(self, room: str, envelope: dict):
+        if self.deliver:
+            await self.deliver(room, envelope)
+
+    async def set_presence(self, room: str, count: int):
+        if count:
+            self.presence[room] = count
+        else:
+            self.presence.pop(room, None)
+
+    async def viewer_count(self, room: str) -> int:
+        return self.presence.get(room, 0)
+
+    async def record_heartbeat(self, game_id: str, at: datetime):
+        self.heartbeats[game_id] = at
+
+    async def get_heartbeat(self, game_id: str) -> Optional[datetime]:
+        return self.heartbeats.get(game_id)
+
+    async def clear_heartbeat(self, game_id: str):
+        self.heartbeats.pop(game_id, None)
+
+
+class SQLiteBackplane:
+    """Multi-worker backplane backed by a shared SQLite bus file"""
+
+    shared = True
+
+    def __init__(self, path: str = BACKPLANE_DB_PATH, poll_seconds: float = BACKPLANE_POLL_SECONDS):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.deliver: Optional[Deliver] = None
+        self.presence: Dict[str, int] = {}
+        self.last_event_id = 0
+        self.conn: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        self.task: Optional[asyncio.Task] = None
+
+    def _execute(self, sql: str, params=(), fetch: bool = False):
+        with self.lock:
+            cursor = self.conn.execute(sql, params)
+            rows = cursor.fetchall() if fetch else None
+            self.conn.commit()
+            return rows
+
+    async def _run(self, sql: str, params=(), fetch: bool = False):
+        return await asyncio.to_thread(self._execute, sql, params, fetch)
+
+    def _open(self):
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS bus_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin TEXT NOT NULL,
+                room TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bus_presence (
+                worker TEXT NOT NULL,
+                room TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (worker, room)
+            );
+            CREATE TABLE IF NOT EXISTS bus_heartbeats (
+                game_id TEXT PRIMARY KEY,
+                beat_at REAL NOT NULL
+            );
+        """)
+        row = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM bus_events").fetchone()
+        self.last_event_id = row[0]
+
+    async def start(self, deliver: Deliver):
+        self.deliver = deliver
+        await asyncio.to_thread(self._open)
+        self.task = asyncio.create_task(self._tail())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        if self.conn:
+            await self._run("DELETE FROM bus_presence WHERE worker = ?", (self.worker_id,))
+            self.conn.close()
+
+    async def _tail(self):
+        last_housekeeping = 0.0
+        while True:
+            try:
+                rows = await self._run(
+                    "SELECT id, origin, room, payload FROM bus_events WHERE id > ? ORDER BY id",
+                    (self.last_event_id,), fetch=True,
+                )
+                for event_id, origin, room, payload in rows:
+                    self.last_event_id = event_id
+                    # Our own events were already delivered locally when published
+                    if origin != self.worker_id and self.deliver:
+                        await self.deliver(room, json.loads(payload))
+
+                now = time.time()
+                if now - last_housekeeping > PRESENCE_TTL_SECONDS / 3:
+                    last_housekeeping = now
+                    await self._run("DELETE FROM bus_events WHERE created_at < ?", (now - EVENT_RETENTION_SECONDS,))
+                    await self._run("UPDATE bus_presence SET updated_at = ? WHERE worker = ?", (now, self.worker_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Backplane poll failed: {e}")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def publish(self, room: str, envelope: dict):
+        await self._run(
+            "INSERT INTO bus_events (origin, room, payload, created_at) VALUES (?, ?, ?, ?)",
+            (self.worker_id, room, encode_message(envelope), time.time()),
+        )
+        if self.deliver:
+            await self.deliver(room, envelope)
+
+    async def set_presence(self, room: str, count: int):
+        if count:
+            await self._run(
+                "INSERT OR REPLACE INTO bus_presence (worker, room, count, updated_at) VALUES (?, ?, ?, ?)",
+                (self.worker_id, room, count, time.time()),
+            )
+        else:
+            await self._run("DELETE FROM bus_presence WHERE worker = ? AND room = ?", (self.worker_id, room))
+
+    async def viewer_count(self, room: str) -> int:
+        rows = await self._run(
+            "SELECT COALESCE(SUM(count), 0) FROM bus_presence WHERE room = ? AND updated_at > ?",
+            (room, time.time() - PRESENCE_TTL_SECONDS), fetch=True,
+        )
+        return rows[0][0]
+
+    async def record_heartbeat(self, game_id: str, at: datetime):
+        await self._run(
+            "INSERT OR REPLACE INTO bus_heartbeats (game_id, beat_at) VALUES (?, ?)",
+            (game_id, at.timestamp()),
+        )
+
+    async def get_heartbeat(self, game_id: str) -> Optional[datetime]:
+        rows = await self._run("SELECT beat_at FROM bus_heartbeats WHERE game_id = ?", (game_id,), fetch=True)
+        return datetime.fromtimestamp(rows[0][0]) if rows else None
+
+    async def clear_heartbeat(self, game_id: str):
+        await self._run("DELETE FROM bus_heartbeats WHERE game_id = ?", (game_id,))
+
+
+def create_backplane(kind: str = BACKPLANE):
+    if kind == "sqlite":
+        return SQLiteBackplane()
+    if kind == "memory":
+        return InProcessBackplane()
+    raise ValueError(f"Unknown BACKPLANE '{kind}' (expected 'memory' or 'sqlite')")
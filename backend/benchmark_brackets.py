@@ -0,0 +1,123 @@
+"""
+Benchmark bracket creation (POST /api/brackets) across bracket sizes: the old layout, which
+flushed every match to get its id and looked up each bye's next match, against brackets.py,
+which lays the bracket out in memory and writes it with one insert.
+
+Each size is built twice per method on a fresh throwaway database in a temp directory (never
+scoreboard.db): full, and with a quarter of the slots left as byes. The batch layout is
+checked for the right number of matches and next-match links, and the time and number of SQL
+statements of the whole transaction, commit included, are reported.
+
+Usage: python benchmark_brackets.py [--sizes 8,16,32,64,128,256,512,1024] [--skip-legacy]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+import brackets
+import models
+from database import Base, make_engine
+
+
+def legacy(db, bracket_id: str, num_teams: int, team_ids: list):
+    """The match layout of main.build_bracket before brackets.py"""
+    size = brackets.bracket_size(num_teams)
+    num_rounds = size.bit_length() - 1
+    match_number = 0
+    matches_by_round = {}
+    for round_num in range(num_rounds, 0, -1):
+        matches_by_round[round_num] = []
+        for _ in range(2 ** (round_num - 1)):
+            match = models.BracketMatch(bracket_id=bracket_id, round_number=num_rounds - round_num + 1,
+                                        match_number=match_number)
+            db.add(match)
+            db.flush()
+            matches_by_round[round_num].append(match)
+            match_number += 1
+    for round_num in range(num_rounds, 1, -1):
+        for i, match in enumerate(matches_by_round[round_num]):
+            match.next_match_id = matches_by_round[round_num - 1][i // 2].id
+    first_round_matches = matches_by_round[num_rounds]
+    slots = [team_ids[i] if i < len(team_ids) and team_ids[i] not in brackets.EMPTY_SLOTS else None
+             for i in range(size)]
+    for i, match in enumerate(first_round_matches):
+        match.team1_id, match.team2_id = slots[i * 2], slots[i * 2 + 1]
+        if bool(match.team1_id) != bool(match.team2_id):
+            match.winner_id = match.team1_id or match.team2_id
+            match.team1_score = match.team2_score = 0
+            if match.next_match_id:
+                next_match = db.query(models.BracketMatch).filter(models.BracketMatch.id == match.next_match_id).first()
+                if first_round_matches.index(match) % 2 == 0:
+                    next_match.team1_id = match.winner_id
+                else:
+                    next_match.team2_id = match.winner_id
+
+
+def batch(db, bracket_id: str, num_teams: int, team_ids: list):
+    brackets.insert_matches(db, brackets.build_matches(bracket_id, num_teams, team_ids))
+
+
+METHODS = {"legacy": legacy, "batch": batch}
+
+
+def check(matches: list, size: int, byes: int):
+    assert len(matches) == size - 1, f"{len(matches)} matches for {size} slots"
+    numbers = {match["id"]: match["match_number"] for match in matches}
+    feeds = [numbers[match["next_match_id"]] for match in matches if match["next_match_id"]]
+    assert sorted(feeds) == sorted(list(range(size // 2, size - 1)) * 2), "every later match is fed by two"
+    assert sum(1 for match in matches[:size // 2] if match["winner_id"]) == byes, "byes advanced"
+
+
+def run(size: int, methods: list):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = Session()
+        league = models.League(name="Bench", sport="football", season="2025")
+        db.add(league)
+        db.flush()
+        teams = [models.Team(league_id=league.id, name=f"T{i}") for i in range(size)]
+        db.add_all(teams)
+        db.commit()
+        team_ids = [team.id for team in teams]
+
+        for label, num_teams in (("full", size), ("byes", size - size // 4)):
+            # The top seeds get the byes
+            byes = size - num_teams
+            seeded = [slot for i in range(byes) for slot in (team_ids[i], "BYE")] + team_ids[byes:num_teams]
+            check(brackets.build_matches("check", num_teams, seeded), size, byes)
+            for name in methods:
+                bracket = models.Bracket(league_id=league.id, name=f"{name} {label}", num_teams=num_teams)
+                db.add(bracket)
+                db.flush()
+                statements.clear()
+                started = time.perf_counter()
+                METHODS[name](db, bracket.id, num_teams, seeded)
+                db.commit()
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"{size:5} slots {label:>4} {name:>6}: {size - 1:5} matches | "
+                      f"{len(statements):5} statements | {elapsed:8.1f} ms")
+        db.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="8,16,32,64,128,256,512,1024")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+    methods = ["batch"] if args.skip_legacy else ["legacy", "batch"]
+    for size in (int(size) for size in args.sizes.split(",")):
+        run(size, methods)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark commits/sec of the SQLite engine with the old default settings vs the tuned
+WAL/pragma/pool configuration in database.py.
+
+Each run works on a fresh throwaway database in a temp directory (never scoreboard.db):
+a scorer loop commits one score update per transaction, then several threads do the same
+concurrently while readers poll the game, counting "database is locked" failures.
+
+Usage: python benchmark_db.py [--commits 500] [--threads 4]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import models
+from database import Base, make_engine, sqlite_pragmas
+
+CONFIGS = {
+    # What database.py used to do: rollback journal, synchronous=FULL, default page cache
+    "default": ["PRAGMA foreign_keys=ON"],
+    "tuned": sqlite_pragmas(),
+}
+
+
+def setup(Session) -> str:
+    db = Session()
+    league = models.League(name="Bench", sport="football", season="2025")
+    db.add(league)
+    db.flush()
+    home = models.Team(league_id=league.id, name="Home")
+    away = models.Team(league_id=league.id, name="Away")
+    db.add_all([home, away])
+    db.flush()
+    game = models.Game(league_id=league.id, home_team_id=home.id, away_team_id=away.id, status="live")
+    db.add(game)
+    db.commit()
+    game_id = game.id
+    db.close()
+    return game_id
+
+
+def score(Session, game_id: str, commits: int, errors: list):
+    db = Session()
+    for i in range(commits):
+        try:
+            db.query(models.Game).filter(models.Game.id == game_id).update({"home_score": i})
+            db.commit()
+        except OperationalError:
+            db.rollback()
+            errors.append(1)
+    db.close()
+
+
+def watch(Session, game_id: str, stop: threading.Event, reads: list):
+    db = Session()
+    while not stop.is_set():
+        try:
+            db.query(models.Game).filter(models.Game.id == game_id).first()
+            db.rollback()
+            reads.append(1)
+        except OperationalError:
+            db.rollback()
+    db.close()
+
+
+def run(name: str, pragmas: list, commits: int, threads: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", pragmas=pragmas)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        game_id = setup(Session)
+
+        errors = []
+        started = time.perf_counter()
+        score(Session, game_id, commits, errors)
+        single = commits / (time.perf_counter() - started)
+
+        errors = []
+        reads = []
+        stop = threading.Event()
+        readers = [threading.Thread(target=watch, args=(Session, game_id, stop, reads)) for _ in range(threads)]
+        writers = [threading.Thread(target=score, args=(Session, game_id, commits // threads, errors)) for _ in range(threads)]
+        for thread in readers:
+            thread.start()
+        started = time.perf_counter()
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        stop.set()
+        for thread in readers:
+            thread.join()
+        engine.dispose()
+
+    concurrent = (commits // threads * threads - len(errors)) / elapsed
+    print(f"{name:>8}: {single:8.0f} commits/s single writer | {concurrent:8.0f} commits/s "
+          f"with {threads} writers + {threads} readers ({len(reads)} reads, {len(errors)} locked errors)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commits", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+    for name, pragmas in CONFIGS.items():
+        run(name, pragmas, args.commits, args.threads)
+
+
+if __name__ == "__main__":
+    main()
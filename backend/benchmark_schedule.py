@@ -0,0 +1,127 @@
+"""
+Benchmark the schedule generator in scheduling.py across league sizes.
+
+For each size it builds a double round robin and a weighted schedule (two conferences of
+four-team divisions: division 2 / conference 1 / other 0 meetings), checks that every pair
+met as often as the spec asks, and reports games, rounds, the worst home/away imbalance of
+any team, venue breaks (a team at home, or away, in two consecutive rounds) and the time.
+
+With --insert the generated double round robin is also written to a fresh throwaway
+database (never scoreboard.db) with the same executemany insert as the bulk endpoint.
+
+Usage: python benchmark_schedule.py [--sizes 8,16,32,64,128,256] [--insert]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections import Counter
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+import models
+import scheduling
+import schemas
+from database import Base, make_engine
+
+
+def make_groups(team_ids: list) -> scheduling.Groups:
+    half = len(team_ids) // 2
+    return {team_id: ("East" if index < half else "West", f"D{index // 4}")
+            for index, team_id in enumerate(team_ids)}
+
+
+def expected_meetings(a: str, b: str, groups: scheduling.Groups, other: int, conference: int, division: int) -> int:
+    if groups[a] == groups[b]:
+        return division
+    if groups[a][0] == groups[b][0]:
+        return conference
+    return other
+
+
+def stats(schedule: list, team_ids: list) -> dict:
+    home = Counter()
+    away = Counter()
+    breaks = 0
+    last = {}
+    for pairings in schedule:
+        for h, a in pairings:
+            home[h] += 1
+            away[a] += 1
+            breaks += (last.get(h) == 1) + (last.get(a) == 0)
+            last[h], last[a] = 1, 0
+        # A bye does not break a team's home/away pattern
+    return {
+        "games": sum(len(pairings) for pairings in schedule),
+        "rounds": len(schedule),
+        "imbalance": max(abs(home[t] - away[t]) for t in team_ids),
+        "breaks": breaks,
+    }
+
+
+def check(schedule: list, team_ids: list, groups: scheduling.Groups, counts: tuple):
+    met = Counter(frozenset(pairing) for pairings in schedule for pairing in pairings)
+    for i, a in enumerate(team_ids):
+        for b in team_ids[i + 1:]:
+            expected = expected_meetings(a, b, groups, *counts)
+            assert met[frozenset((a, b))] == expected, f"{a} v {b}: {met[frozenset((a, b))]} != {expected}"
+        busy = [sum(a in pairing for pairing in pairings) for pairings in schedule]
+        assert max(busy) <= 1, f"{a} plays twice in one round"
+
+
+def run(size: int, do_insert: bool):
+    team_ids = [models.generate_uuid() for _ in range(size)]
+    groups = make_groups(team_ids)
+    specs = {
+        "double": schemas.ScheduleSpec(double=True),
+        "weighted": schemas.ScheduleSpec(other_meetings=0, conference_meetings=1, division_meetings=2),
+    }
+    for name, spec in specs.items():
+        started = time.perf_counter()
+        schedule = scheduling.build_schedule(spec, team_ids, groups)
+        elapsed = (time.perf_counter() - started) * 1000
+        check(schedule, team_ids, groups, scheduling.meeting_counts(spec))
+        result = stats(schedule, team_ids)
+        print(f"{size:5} teams {name:>8}: {result['games']:6} games in {result['rounds']:4} rounds "
+              f"| imbalance {result['imbalance']} | {result['breaks']:6} breaks | {elapsed:8.1f} ms")
+
+    if do_insert:
+        insert_games(team_ids, specs["double"])
+
+
+def insert_games(team_ids: list, spec: schemas.ScheduleSpec):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = Session()
+        league = models.League(name="Bench", sport="football", season="2025")
+        db.add(league)
+        db.flush()
+        db.add_all([models.Team(id=team_id, league_id=league.id, name=team_id[:8]) for team_id in team_ids])
+        db.commit()
+
+        started = time.perf_counter()
+        rows = [{**game, "id": models.generate_uuid(), "share_code": models.generate_share_code(),
+                 "league_id": league.id} for game in scheduling.generate_games(spec, team_ids)]
+        db.execute(insert(models.Game), rows)
+        db.commit()
+        elapsed = (time.perf_counter() - started) * 1000
+        db.close()
+        engine.dispose()
+    print(f"{'':17}insert: {len(rows):6} games generated and committed in {elapsed:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="8,16,32,64,128,256")
+    parser.add_argument("--insert", action="store_true")
+    args = parser.parse_args()
+    for size in (int(size) for size in args.sizes.split(",")):
+        run(size, args.insert)
+
+
+if __name__ == "__main__":
+    main()
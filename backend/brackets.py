@@ -0,0 +1,84 @@
+"""
+Single elimination bracket layout for POST /api/brackets.
+
+A bracket of n teams is padded to the next power of two, size, and has size - 1 matches over
+log2(size) rounds. Matches are numbered round by round, first round first, so round r starts
+at match size - size / 2^(r-1) and holds size / 2^r matches. Match k feeds match
+size / 2 + k // 2 (the final, k = size - 2, feeds nothing), in slot 1 when k is even and slot 2
+when it is odd.
+
+team_ids fill the first round slots in order, two per match; missing entries, "BYE", "TBD"
+and "" leave a slot empty. A first round match with exactly one team is a bye: the team is
+the winner and already sits in its slot of the next match.
+
+The whole bracket is laid out in memory with its ids generated up front and linked by that
+arithmetic, then written with one executemany insert, so building a 1024 team bracket costs
+the same handful of statements as an 8 team one (python benchmark_brackets.py).
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+import models
+
+EMPTY_SLOTS = ("BYE", "TBD", "")
+
+
+def bracket_size(num_teams: int) -> int:
+    """Next power of two >= num_teams"""
+    size = 1
+    while size < num_teams:
+        size *= 2
+    return size
+
+
+def next_match_index(size: int, index: int) -> Optional[int]:
+    """Number of the match the winner of match index advances to; None for the final"""
+    following = size // 2 + index // 2
+    return following if following < size - 1 else None
+
+
+def build_matches(bracket_id: str, num_teams: int, team_ids: List[Optional[str]]) -> List[dict]:
+    """Rows of every match of a bracket, in match_number order"""
+    size = bracket_size(num_teams)
+    slots = [team_ids[i] if i < len(team_ids) and team_ids[i] not in EMPTY_SLOTS else None for i in range(size)]
+    ids = [models.generate_uuid() for _ in range(size - 1)]
+
+    matches = []
+    for round_number in range(1, size.bit_length()):
+        for _ in range(size >> round_number):
+            index = len(matches)
+            following = next_match_index(size, index)
+            matches.append({
+                "id": ids[index],
+                "bracket_id": bracket_id,
+                "round_number": round_number,
+                "match_number": index,
+                "team1_id": None,
+                "team2_id": None,
+                "team1_score": 0,
+                "team2_score": 0,
+                "winner_id": None,
+                "next_match_id": ids[following] if following is not None else None,
+            })
+
+    # Seed the first round and advance the teams with a bye
+    for index in range(size // 2):
+        team1, team2 = slots[2 * index], slots[2 * index + 1]
+        match = matches[index]
+        match["team1_id"], match["team2_id"] = team1, team2
+        if bool(team1) != bool(team2):
+            match["winner_id"] = team1 or team2
+            following = next_match_index(size, index)
+            if following is not None:
+                matches[following]["team1_id" if index % 2 == 0 else "team2_id"] = team1 or team2
+    return matches
+
+
+def insert_matches(db: Session, matches: List[dict]):
+    """Write a bracket's matches in one statement. The final goes first so every next_match_id
+    refers to a row already written (foreign keys are enforced). Does not commit."""
+    # Through the table: an ORM bulk insert splits the rows by which columns are None
+    db.execute(insert(models.BracketMatch.__table__), matches[::-1])
@@ -0,0 +1,128 @@
+"""
+Check that the hot lookups the API runs are served by an index.
+
+Builds the schema from models.py in a throwaway database in a temp directory (never
+scoreboard.db), runs EXPLAIN QUERY PLAN for each query below and fails if SQLite plans a
+full table scan for any of them. Exits non-zero on failure so it can gate a deploy.
+
+Usage: python check_query_plans.py [--verbose]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from sqlalchemy import select, text, or_, tuple_
+
+import models
+from database import Base, make_engine
+from standings import standings_order
+
+ID = "00000000-0000-0000-0000-000000000000"
+CODE = "ABCD1234"
+
+# (description, statement) - filters copied from the corresponding handlers in main.py
+QUERIES = [
+    ("league by share code", select(models.League).where(models.League.share_code == CODE)),
+    ("leagues of owner", select(models.League).where(models.League.owner_id == ID)),
+    ("seasons of league", select(models.Season).where(models.Season.league_id == ID)
+        .order_by(models.Season.created_at.desc())),
+    ("current season of league", select(models.Season).where(
+        models.Season.league_id == ID, models.Season.is_current == True)),
+    ("record types of league", select(models.RecordType).where(models.RecordType.league_id == ID)
+        .order_by(models.RecordType.sort_order, models.RecordType.created_at)),
+    ("records of team", select(models.TeamRecord).where(models.TeamRecord.team_id == ID)),
+    ("records of record type", select(models.TeamRecord).where(models.TeamRecord.record_type_id == ID)),
+    ("season stats of team", select(models.TeamSeasonStats).where(models.TeamSeasonStats.team_id == ID)),
+    ("stats of seasons", select(models.TeamSeasonStats).where(models.TeamSeasonStats.season_id.in_([ID, ID]))),
+    ("teams of league", select(models.Team).where(models.Team.league_id == ID)),
+    ("league standings", select(models.Team).where(models.Team.league_id == ID)
+        .order_by(*standings_order(models.Team))),
+    ("season standings", select(models.TeamSeasonStats).where(models.TeamSeasonStats.season_id == ID)
+        .order_by(*standings_order(models.TeamSeasonStats))),
+    ("record type standings", select(models.TeamRecord).where(models.TeamRecord.record_type_id == ID)
+        .order_by(*standings_order(models.TeamRecord))),
+    ("league ratings", select(models.TeamRating).where(
+        models.TeamRating.league_id == ID, models.TeamRating.season_id.is_(None))),
+    ("season ratings", select(models.TeamRating).where(
+        models.TeamRating.league_id == ID, models.TeamRating.season_id == ID)),
+    ("ratings of teams", select(models.TeamRating).where(
+        models.TeamRating.team_id.in_([ID, ID]), models.TeamRating.season_id == ID)),
+    ("games of league", select(models.Game).where(models.Game.league_id == ID)),
+    ("league games page", select(models.Game).where(models.Game.league_id == ID)
+        .order_by(models.Game.scheduled_at, models.Game.id).limit(51)),
+    ("league games next page", select(models.Game).where(
+        models.Game.league_id == ID, tuple_(models.Game.scheduled_at, models.Game.id) > tuple_("2025-09-01 00:00:00", ID))
+        .order_by(models.Game.scheduled_at, models.Game.id).limit(51)),
+    ("games of season", select(models.Game).where(models.Game.season_id == ID)),
+    ("games of team", select(models.Game).where(
+        or_(models.Game.home_team_id == ID, models.Game.away_team_id == ID))),
+    ("games of record type", select(models.Game).where(models.Game.record_type_id == ID)),
+    ("live games", select(models.Game).where(models.Game.status == "live")),
+    ("live games with a running clock", select(models.Game).where(
+        models.Game.status == "live", models.Game.timer_running == True)),
+    ("game by share code", select(models.Game).where(models.Game.share_code == CODE)),
+    ("brackets of league", select(models.Bracket).where(models.Bracket.league_id == ID)),
+    ("bracket by share code", select(models.Bracket).where(models.Bracket.share_code == CODE)),
+    ("matches of bracket", select(models.BracketMatch).where(models.BracketMatch.bracket_id == ID)),
+    ("matches of brackets", select(models.BracketMatch).where(models.BracketMatch.bracket_id.in_([ID, ID]))),
+    ("matches of game", select(models.BracketMatch).where(models.BracketMatch.game_id == ID)),
+    ("matches of team", select(models.BracketMatch).where(or_(
+        models.BracketMatch.team1_id == ID, models.BracketMatch.team2_id == ID,
+        models.BracketMatch.winner_id == ID))),
+    ("standalone games of owner", select(models.StandaloneGame).where(models.StandaloneGame.owner_id == ID)
+        .order_by(models.StandaloneGame.created_at.desc())),
+    ("live standalone games", select(models.StandaloneGame).where(
+        models.StandaloneGame.status == "live", models.StandaloneGame.last_heartbeat != None)),
+    ("standalone game by share code", select(models.StandaloneGame).where(models.StandaloneGame.share_code == CODE)),
+    ("scoreboard by share code", select(models.Scoreboard).where(models.Scoreboard.share_code == CODE)),
+    ("players of scoreboard", select(models.ScoreboardPlayer).where(models.ScoreboardPlayer.scoreboard_id == ID)),
+    ("pending invites of user", select(models.Invite).where(
+        models.Invite.to_user_id == ID, models.Invite.status == "pending")
+        .order_by(models.Invite.created_at.desc())),
+    ("invites sent by user", select(models.Invite).where(models.Invite.from_user_id == ID)),
+]
+
+
+def full_scans(plan: list, sorted_by_index: bool = False) -> list:
+    """Plan lines that read a whole table rather than searching an index (or, for queries
+    whose ORDER BY has a matching index, that sort instead of reading in index order)"""
+    return [detail for detail in plan
+            if (detail.startswith("SCAN ") and "USING" not in detail and "SUBQUERY" not in detail)
+            or (sorted_by_index and detail.startswith("USE TEMP B-TREE"))]
+
+
+def check(verbose: bool = False) -> int:
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{os.path.join(tmp, 'plans.db')}")
+        Base.metadata.create_all(bind=engine)
+        with engine.connect() as conn:
+            for description, statement in QUERIES:
+                sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+                plan = [row[3] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+                scans = full_scans(plan, sorted_by_index=description.endswith(("standings", "page")))
+                if scans:
+                    failures += 1
+                    print(f"  ✗ {description}: {'; '.join(scans)}")
+                elif verbose:
+                    print(f"  ✓ {description}: {'; '.join(plan)}")
+        engine.dispose()
+
+    if failures:
+        print(f"\n{failures} of {len(QUERIES)} queries do a full table scan")
+    else:
+        print(f"All {len(QUERIES)} queries use an index")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verbose", action="store_true", help="print the plan of every query")
+    args = parser.parse_args()
+    sys.exit(1 if check(args.verbose) else 0)
+
+
+if __name__ == "__main__":
+    main()
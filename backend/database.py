@@ -1,22 +1,98 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+try:
+    import aiosqlite
+    import greenlet
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+except ImportError:  # aiosqlite/greenlet not installed
+    aiosqlite = None
+
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./scoreboard.db")
+
+# SQLite tuning. WAL lets viewers read while a scorer commits, and with synchronous=NORMAL a
+# commit no longer waits on an fsync (a power loss can only drop the latest commits, never
+# corrupt the file). busy_timeout makes writers queue up instead of failing with
+# "database is locked".
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-64000"))  # negative = KiB, so ~64 MB
+
+# Connections are reused from a pool rather than opened per request
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Async handlers talk to SQLite through aiosqlite so queries and commits never block the event
+# loop that serves every WebSocket room. ASYNC_DB=0 (or a missing aiosqlite) falls back to
+# running the same work on a thread.
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB", "1") == "1" and aiosqlite is not None
+
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./scoreboard.db"
+def sqlite_pragmas(journal_mode: str = SQLITE_JOURNAL_MODE, synchronous: str = SQLITE_SYNCHRONOUS,
+                   busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS, mmap_size: int = SQLITE_MMAP_SIZE,
+                   cache_size: int = SQLITE_CACHE_SIZE) -> list:
+    """PRAGMA statements run on every new SQLite connection"""
+    return [
+        "PRAGMA foreign_keys=ON",
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA busy_timeout={busy_timeout_ms}",
+        f"PRAGMA mmap_size={mmap_size}",
+        f"PRAGMA cache_size={cache_size}",
+        "PRAGMA temp_store=MEMORY",
+    ]
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
 
-# Enable foreign key support for SQLite
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+def make_engine(url: str = SQLALCHEMY_DATABASE_URL, pragmas: list = None):
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        poolclass=QueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    install_pragmas(engine, sqlite_pragmas() if pragmas is None else pragmas)
+    return engine
+
+
+def install_pragmas(engine, statements: list):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+
+def make_async_engine(url: str = SQLALCHEMY_DATABASE_URL):
+    async_engine = create_async_engine(
+        url.replace("sqlite://", "sqlite+aiosqlite://", 1),
+        connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    install_pragmas(async_engine.sync_engine, sqlite_pragmas())
+    return async_engine
+
+
+engine = make_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = make_async_engine() if ASYNC_DB_ENABLED else None
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False) if async_engine else None
+
 Base = declarative_base()
 
 
@@ -26,3 +102,32 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+class ThreadedSession:
+    """Stand-in for AsyncSession without aiosqlite: run_sync() runs on a worker thread"""
+
+    def __init__(self):
+        self.session = SessionLocal()
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await asyncio.to_thread(fn, self.session, *args, **kwargs)
+
+    async def close(self):
+        await asyncio.to_thread(self.session.close)
+
+
+@asynccontextmanager
+async def async_session():
+    """Session for async code. Do the database work in a plain sync function taking a Session
+    and call it with ``await db.run_sync(fn, ...)``; its I/O then happens off the event loop."""
+    db = AsyncSessionLocal() if AsyncSessionLocal else ThreadedSession()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def get_async_db():
+    async with async_session() as db:
+        yield db
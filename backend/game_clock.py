@@ -0,0 +1,121 @@
+"""
+Server-side game clock engine.
+
+The running game clock is owned by one GameClock task per live game instead of being
+extrapolated by every display. While a clock runs it broadcasts compact `clock` messages
+({"type": "clock", "id", "game_time", "seconds", "running"}) to the game room every
+CLOCK_TICK_SECONDS, aligned to the displayed second, and when it reaches 0:00 it stops
+the timer and persists that itself (via the on_expire callback) without any client
+having to call the update API.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+CLOCK_TICK_SECONDS = float(os.getenv("CLOCK_TICK_SECONDS", "1.0"))
+# Wake slightly after a second boundary so the reading has already rolled over
+TICK_SLACK_SECONDS = 0.01
+
+
+def clock_reading(timer_running, timer_started_at, timer_started_seconds) -> Optional[dict]:
+    """Current game_time/timer_running for a running timer, or None if there is nothing to compute"""
+    if not (timer_running and timer_started_at and timer_started_seconds is not None):
+        return None
+    # Ensure timer_started_at is treated as UTC (remove any timezone info for comparison)
+    started_at = timer_started_at.replace(tzinfo=None)
+    elapsed_seconds = int((datetime.utcnow() - started_at).total_seconds())
+    # Sanity check: elapsed time should be positive and reasonable (< 24 hours)
+    if elapsed_seconds < 0 or elapsed_seconds > 86400:
+        return None
+    remaining = max(0, timer_started_seconds - elapsed_seconds)
+    # If time ran out, the timer stops
+    return {"game_time": format_clock(remaining), "timer_running": remaining > 0}
+
+
+def format_clock(seconds: int) -> str:
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class GameClock:
+    def __init__(self, game_id: str, room: str, started_at: datetime, started_seconds: int):
+        self.game_id = game_id
+        self.room = room
+        self.started_at = started_at.replace(tzinfo=None)
+        self.started_seconds = started_seconds
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def key(self) -> Tuple[datetime, int]:
+        return self.started_at, self.started_seconds
+
+    def elapsed(self) -> float:
+        return (datetime.utcnow() - self.started_at).total_seconds()
+
+    def remaining(self) -> int:
+        return max(0, self.started_seconds - int(self.elapsed()))
+
+
+class GameClockScheduler:
+    def __init__(self, manager, tick_seconds: float = CLOCK_TICK_SECONDS):
+        self.manager = manager
+        self.tick_seconds = tick_seconds
+        self.clocks: Dict[str, GameClock] = {}
+        # Called with (game id, timer_started_at) once a clock hits 0:00, to persist the stopped timer
+        self.on_expire: Optional[Callable[[str, datetime], Awaitable[None]]] = None
+
+    def sync(self, game_id: str, share_code: str, timer_running, timer_started_at, timer_started_seconds):
+        """Start, restart or stop a game's clock to match its (just updated) timer fields"""
+        if clock_reading(timer_running, timer_started_at, timer_started_seconds) is None:
+            self.stop(game_id)
+            return
+        clock = GameClock(game_id, f"game:{share_code}", timer_started_at, timer_started_seconds)
+        existing = self.clocks.get(game_id)
+        if existing and existing.key == clock.key:
+            return
+        self.stop(game_id)
+        self.clocks[game_id] = clock
+        clock.task = asyncio.create_task(self._run(clock))
+
+    def observe(self, game_id: str, data: dict):
+        """Drop a local clock that a game_state from another worker has stopped or replaced"""
+        clock = self.clocks.get(game_id)
+        if clock is None:
+            return
+        started_at = data.get("timer_started_at")
+        if isinstance(started_at, str):
+            started_at = datetime.fromisoformat(started_at)
+        if not data.get("timer_running") or started_at is None or \
+                (started_at.replace(tzinfo=None), data.get("timer_started_seconds")) != clock.key:
+            self.stop(game_id)
+
+    def stop(self, game_id: str):
+        clock = self.clocks.pop(game_id, None)
+        if clock and clock.task and clock.task is not asyncio.current_task():
+            clock.task.cancel()
+
+    def stop_all(self):
+        for game_id in list(self.clocks):
+            self.stop(game_id)
+
+    async def _run(self, clock: GameClock):
+        while True:
+            remaining = clock.remaining()
+            await self.manager.broadcast(clock.room, {
+                "type": "clock",
+                "id": clock.game_id,
+                "game_time": format_clock(remaining),
+                "seconds": remaining,
+                "running": remaining > 0,
+            })
+            if remaining <= 0:
+                self.clocks.pop(clock.game_id, None)
+                if self.on_expire:
+                    await self.on_expire(clock.game_id, clock.started_at)
+                return
+            # Sleep to the next tick boundary, but never past the moment the clock expires
+            elapsed = clock.elapsed()
+            next_tick = (int(elapsed / self.tick_seconds) + 1) * self.tick_seconds
+            await asyncio.sleep(min(next_tick, clock.started_seconds) - elapsed + TICK_SLACK_SECONDS)
@@ -0,0 +1,153 @@
+"""
+Controller heartbeat supervisor.
+
+Every heartbeat pushes a controller's deadline out to now + HEARTBEAT_TIMEOUT_SECONDS. Deadlines
+sit in a timing wheel with one slot per second, so each tick only looks at the controllers
+due in that second rather than scanning every game. When a deadline passes, on_timeout fires
+exactly once for it; the next heartbeat re-arms the controller.
+
+Liveness itself is purely in memory. Heartbeats are persisted (on_persist, batched once per
+slot) only when a controller is first armed and then at most every persist_seconds, so a
+steady stream of pings from a healthy controller costs little or no SQL. With a shared
+backplane another worker re-checks a timed-out controller against the persisted heartbeat, so
+persist_interval() keeps it fresh enough for that (see there).
+
+Keys are opaque (main.py uses ("game", id) and ("standalone", id)).
+"""
+
+import asyncio
+import math
+import os
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+
+# If no heartbeat for this long, trigger tech difficulties
+HEARTBEAT_TIMEOUT_SECONDS = float(os.getenv("HEARTBEAT_TIMEOUT_SECONDS", "10"))
+# How often controller sockets are asked to ping (sent to them in auth_ok)
+CONTROLLER_PING_SECONDS = float(os.getenv("CONTROLLER_PING_SECONDS", "5"))
+# Minimum gap between persisted heartbeats of one controller
+HEARTBEAT_PERSIST_SECONDS = float(os.getenv("HEARTBEAT_PERSIST_SECONDS", "60"))
+WHEEL_SLOT_SECONDS = 1.0
+
+
+def persist_interval(shared: bool, timeout: float = HEARTBEAT_TIMEOUT_SECONDS,
+                     ping_seconds: float = CONTROLLER_PING_SECONDS, slot_seconds: float = WHEEL_SLOT_SECONDS) -> float:
+    """Gap between persisted heartbeats: HEARTBEAT_PERSIST_SECONDS, unless other workers read them
+    (shared). Then a controller still pinging must never look timed out from the stored value,
+    whose age is at most ping gap + persist gap + one batch slot, so that has to fit the timeout."""
+    if not shared:
+        return HEARTBEAT_PERSIST_SECONDS
+    return min(HEARTBEAT_PERSIST_SECONDS, max(timeout - ping_seconds - slot_seconds, 0.0))
+
+
+class HeartbeatSupervisor:
+    def __init__(self, timeout: float = HEARTBEAT_TIMEOUT_SECONDS, slot_seconds: float = WHEEL_SLOT_SECONDS,
+                 persist_seconds: float = HEARTBEAT_PERSIST_SECONDS):
+        self.timeout = timeout
+        self.slot_seconds = slot_seconds
+        self.persist_seconds = persist_seconds
+        # Enough slots that a fresh deadline never wraps around onto the slot being processed
+        self.slots: List[Set[Hashable]] = [set() for _ in range(math.ceil(timeout / slot_seconds) + 2)]
+        self.deadlines: Dict[Hashable, float] = {}
+        self.cursor = 0
+        self.task: Optional[asyncio.Task] = None
+        # Called once per missed deadline. Returning a newer heartbeat time (e.g. one another
+        # worker saw) re-arms the key instead of counting it as a timeout.
+        self.on_timeout: Optional[Callable[[Hashable], Awaitable[Optional[float]]]] = None
+        self.timeouts = 0
+        # Called with {key: heartbeat epoch} for the heartbeats due to be written
+        self.on_persist: Optional[Callable[[Dict[Hashable, float]], Awaitable[None]]] = None
+        self.persisted: Dict[Hashable, float] = {}
+        self.pending: Dict[Hashable, float] = {}
+
+    def _tick_of(self, at: float) -> int:
+        return math.ceil(at / self.slot_seconds)
+
+    def beat(self, key: Hashable, at: Optional[float] = None):
+        """Record a heartbeat (epoch seconds, default now) and (re)arm the key's deadline"""
+        at = at if at is not None else time.time()
+        if at - self.persisted.get(key, 0.0) >= self.persist_seconds:
+            self.persisted[key] = at
+            self.pending[key] = at
+        deadline = at + self.timeout
+        previous = self.deadlines.get(key)
+        self.deadlines[key] = deadline
+        if previous is None or self._tick_of(previous) != self._tick_of(deadline):
+            # The old slot entry (if any) is left behind and skipped when its slot comes up
+            self.slots[self._tick_of(deadline) % len(self.slots)].add(key)
+
+    def forget(self, key: Hashable):
+        """Stop supervising a controller that disconnected on purpose"""
+        self.deadlines.pop(key, None)
+        self.persisted.pop(key, None)
+        self.pending.pop(key, None)
+
+    def is_active(self, key: Hashable) -> bool:
+        deadline = self.deadlines.get(key)
+        return deadline is not None and deadline > time.time()
+
+    def last_beat(self, key: Hashable) -> Optional[float]:
+        deadline = self.deadlines.get(key)
+        return deadline - self.timeout if deadline is not None else None
+
+    async def _expire(self, key: Hashable):
+        self.deadlines.pop(key, None)
+        # A controller that comes back is persisted again straight away
+        self.persisted.pop(key, None)
+        self.timeouts += 1
+        if self.on_timeout is None:
+            return
+        try:
+            newer = await self.on_timeout(key)
+        except Exception as e:
+            print(f"Heartbeat timeout handler failed for {key}: {e}")
+            return
+        if newer is not None and newer + self.timeout > time.time():
+            # Already stored wherever it was read from
+            self.persisted[key] = newer
+            self.beat(key, newer)
+
+    async def advance(self, now: Optional[float] = None):
+        """Process every slot whose second has fully passed"""
+        target = math.floor((now if now is not None else time.time()) / self.slot_seconds)
+        if not self.cursor:
+            self.cursor = target
+        while self.cursor <= target:
+            slot = self.slots[self.cursor % len(self.slots)]
+            due = [key for key in slot if key in self.deadlines and self._tick_of(self.deadlines[key]) <= self.cursor]
+            # Keys whose deadline moved to a later slot (or were forgotten) just drop out
+            slot.clear()
+            for key in due:
+                await self._expire(key)
+            self.cursor += 1
+        await self.persist()
+
+    async def persist(self):
+        """Write out the heartbeats queued by beat() in one batch"""
+        if not self.pending or self.on_persist is None:
+            return
+        batch, self.pending = self.pending, {}
+        try:
+            await self.on_persist(batch)
+        except Exception as e:
+            print(f"Heartbeat persist failed: {e}")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.slot_seconds)
+            await self.advance()
+
+    def start(self):
+        self.cursor = math.floor(time.time() / self.slot_seconds)
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        await self.persist()
@@ -0,0 +1,198 @@
+"""
+In-memory authoritative state for live league games, with write-behind to SQLite.
+
+While a game is live, scoring taps, timer toggles and display_state changes are applied to
+a LiveGame snapshot held here instead of the `games` row. Changed columns are flushed in
+one transaction every LIVE_STATE_FLUSH_SECONDS, and immediately when a game leaves the
+live state (e.g. goes final) or the server shuts down. After a crash the `games` rows hold
+the state as of the last flush, and recover() reloads every live game from them on startup.
+
+The store is per process, so it is only enabled by default with the in-memory backplane
+(a single worker). Override with LIVE_STATE=1/0.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy.orm import joinedload
+
+import models
+import revisions
+import schemas
+from backplane import BACKPLANE
+from database import SessionLocal
+
+
+LIVE_STATE_ENABLED = os.getenv("LIVE_STATE", "1" if BACKPLANE == "memory" else "0") == "1"
+LIVE_STATE_FLUSH_SECONDS = float(os.getenv("LIVE_STATE_FLUSH_SECONDS", "0.5"))
+
+# Updates touching these need the database (team joins, records, start/end bookkeeping)
+COLD_FIELDS = {"home_team_id", "away_team_id"}
+
+
+class LiveGame:
+    """Authoritative snapshot of one live game (shaped like schemas.GameWithTeams)"""
+
+    def __init__(self, game: models.Game, owner_id: Optional[str]):
+        self.id = game.id
+        self.league_id = game.league_id
+        self.share_code = game.share_code
+        self.owner_id = owner_id
+        self.data = schemas.GameWithTeams.model_validate(game).model_dump()
+        self.dirty: Set[str] = set()
+
+    def apply(self, updates: dict):
+        for key, value in updates.items():
+            self.data[key] = value
+            self.dirty.add(key)
+        self.data["updated_at"] = datetime.utcnow()
+        self.dirty.add("updated_at")
+
+    def take_dirty(self) -> Optional[dict]:
+        """Column values changed since the last flush (and reset the dirty set)"""
+        if not self.dirty:
+            return None
+        values = {key: self.data[key] for key in self.dirty}
+        self.dirty = set()
+        return values
+
+
+class LiveGameStore:
+    def __init__(self, enabled: bool = LIVE_STATE_ENABLED, flush_seconds: float = LIVE_STATE_FLUSH_SECONDS):
+        self.enabled = enabled
+        self.flush_seconds = flush_seconds
+        self.games: Dict[str, LiveGame] = {}
+        self.by_share_code: Dict[str, str] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.last_flush_ms = 0.0
+        # Held while a write-behind batch is in flight so a cold update can't be overwritten by it
+        self.flush_lock = asyncio.Lock()
+
+    def get(self, game_id: str) -> Optional[LiveGame]:
+        return self.games.get(game_id)
+
+    def get_by_share_code(self, share_code: str) -> Optional[LiveGame]:
+        game_id = self.by_share_code.get(share_code)
+        return self.games.get(game_id) if game_id else None
+
+    def is_hot_update(self, updates: dict) -> bool:
+        """True if an update can be applied in memory without touching the database"""
+        if COLD_FIELDS.intersection(updates):
+            return False
+        return updates.get("status", "live") == "live"
+
+    def track(self, game: models.Game, owner_id: Optional[str]) -> Optional[LiveGame]:
+        """Start serving a (freshly committed, joinedloaded) live game from memory"""
+        if not self.enabled or game.status != "live":
+            return None
+        live = LiveGame(game, owner_id)
+        self.games[game.id] = live
+        self.by_share_code[game.share_code] = game.id
+        return live
+
+    async def release(self, game_id: str) -> Optional[dict]:
+        """Stop tracking a game (before a cold update) and return its unflushed changes, which the
+        caller must write before its own update"""
+        async with self.flush_lock:
+            live = self.games.pop(game_id, None)
+            if live is None:
+                return None
+            self.by_share_code.pop(live.share_code, None)
+            return live.take_dirty()
+
+    def discard(self, game_id: str):
+        """Forget a game without writing it back (e.g. it was deleted)"""
+        live = self.games.pop(game_id, None)
+        if live:
+            self.by_share_code.pop(live.share_code, None)
+
+    def set_league_owner(self, league_id: str, owner_id: Optional[str]):
+        for live in self.games.values():
+            if live.league_id == league_id:
+                live.owner_id = owner_id
+
+    def update_team(self, team: dict):
+        """Keep the embedded team objects of live games in sync with team edits"""
+        for live in self.games.values():
+            for side in ("home_team", "away_team"):
+                if live.data[side]["id"] == team["id"]:
+                    live.data[side] = team
+
+    def recover(self):
+        """Reload every live game from its last flushed row (startup / crash recovery)"""
+        if not self.enabled:
+            return
+        db = SessionLocal()
+        try:
+            games = db.query(models.Game).options(
+                joinedload(models.Game.home_team),
+                joinedload(models.Game.away_team),
+                joinedload(models.Game.league)
+            ).filter(models.Game.status == "live").all()
+            for game in games:
+                self.track(game, game.league.owner_id if game.league else None)
+        finally:
+            db.close()
+
+    def _write(self, rows: List[dict], league_ids: Set[str]):
+        db = SessionLocal()
+        try:
+            for values in rows:
+                columns = {key: value for key, value in values.items() if key != "id"}
+                db.query(models.Game).filter(models.Game.id == values["id"]).update(columns, synchronize_session=False)
+            # The league games list reads the table, so it changes with every flush
+            for league_id in league_ids:
+                revisions.bump_league(db, league_id)
+            db.commit()
+        finally:
+            db.close()
+
+    async def flush(self):
+        """Write all dirty live games back to the games table in a single transaction"""
+        async with self.flush_lock:
+            rows = []
+            league_ids = set()
+            for live in list(self.games.values()):
+                values = live.take_dirty()
+                if values:
+                    values["id"] = live.id
+                    rows.append(values)
+                    league_ids.add(live.league_id)
+            if not rows:
+                return
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(self._write, rows, league_ids)
+            except Exception as e:
+                # Put the changes back so the next flush retries them
+                print(f"Live state flush failed: {e}")
+                for values in rows:
+                    live = self.games.get(values["id"])
+                    if live:
+                        live.dirty.update(key for key in values if key != "id")
+                return
+            self.last_flush_ms = (time.perf_counter() - started) * 1000
+
+    async def _flusher(self):
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    async def start(self):
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self.recover)
+        self.task = asyncio.create_task(self._flusher())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        await self.flush()
@@ -1,20 +1,39 @@
+import asyncio
+import base64
 import json
-import math
 import os
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Depends, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, status
+from fastapi import FastAPI, Depends, Header, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, UploadFile, File, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, insert, or_, tuple_
 from sqlalchemy.orm import Session, joinedload
 
 import models
 import schemas
 import auth
-from database import engine, get_db, Base
+import standings
+import rankings
+import ratings
+import revisions
+import scheduling
+import brackets
+import playoff_odds
+from database import get_db, get_async_db, async_session, async_engine, SessionLocal
+from migrations import migrate_database
+from realtime import ConnectionManager
+from backplane import create_backplane
+from live_state import LiveGameStore
+from game_clock import GameClockScheduler, clock_reading
+from heartbeats import HeartbeatSupervisor, HEARTBEAT_TIMEOUT_SECONDS, CONTROLLER_PING_SECONDS, persist_interval
+from response_cache import ResponseCache, envelope_tags, etag_matches
 
 
 # Create uploads directory for team logos
@@ -24,8 +43,24 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
+    migrate_database()
+    await manager.start()
+    await live_games.start()
+    game_clocks.on_expire = expire_game_clock
+    await recover_game_clocks()
+    heartbeats.on_timeout = controller_timed_out
+    heartbeats.on_persist = persist_heartbeats
+    recover_heartbeats()
+    heartbeats.start()
+    playoff_pictures.on_update = manager.invalidate
     yield
+    await playoff_pictures.stop()
+    await heartbeats.stop()
+    game_clocks.stop_all()
+    await live_games.stop()
+    await manager.stop()
+    if async_engine:
+        await async_engine.dispose()
 
 
 app = FastAPI(title="ScoreKeeper API", version="1.0.0", lifespan=lifespan)
@@ -39,55 +74,55 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Link", "X-Next-Cursor"],
 )
 
 
 # WebSocket connection manager
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
-
-    async def connect(self, websocket: WebSocket, room: str):
-        await websocket.accept()
-        if room not in self.active_connections:
-            self.active_connections[room] = set()
-        self.active_connections[room].add(websocket)
-        # Broadcast updated viewer count
-        await self.broadcast_viewer_count(room)
-
-    def disconnect(self, websocket: WebSocket, room: str):
-        if room in self.active_connections:
-            self.active_connections[room].discard(websocket)
-            if not self.active_connections[room]:
-                del self.active_connections[room]
-
-    def get_viewer_count(self, room: str) -> int:
-        if room in self.active_connections:
-            return len(self.active_connections[room])
-        return 0
-
-    async def broadcast_viewer_count(self, room: str):
-        count = self.get_viewer_count(room)
-        await self.broadcast(room, {"type": "viewer_count", "count": count})
-
-    async def broadcast(self, room: str, message: dict):
-        if room in self.active_connections:
-            dead_connections = set()
-            for connection in self.active_connections[room]:
-                try:
-                    await connection.send_json(message)
-                except:
-                    dead_connections.add(connection)
-            for conn in dead_connections:
-                self.active_connections[room].discard(conn)
+manager = ConnectionManager(create_backplane())
+
+# Authoritative in-memory state for live games, flushed to the games table in batches
+live_games = LiveGameStore()
+
+# One server-side clock task per running game timer (ticks viewers, stops the timer at 0:00)
+game_clocks = GameClockScheduler(manager)
+manager.game_state_hooks.append(lambda room, data: game_clocks.observe(data["id"], data))
+
+# Serialized bodies of the public share-code GETs; every broadcast or invalidation of a room
+# drops the entries built from it, on every worker
+share_responses = ResponseCache()
+manager.delivery_hooks.append(lambda room, envelope: share_responses.invalidate(envelope_tags(room, envelope)))
 
+# Heartbeat tracking for live game controllers lives on the backplane so every worker sees it;
+# the supervisor switches a live game to tech difficulties once its controller goes quiet
+heartbeats = HeartbeatSupervisor(persist_seconds=persist_interval(manager.backplane.shared))
 
-manager = ConnectionManager()
+# Re-seeds the playoff pictures of a league's playoff brackets after its standings move
+playoff_pictures = playoff_odds.PlayoffPictureUpdater()
 
-# Heartbeat tracking for live game controllers
-# Maps game_id (string UUID) -> last heartbeat timestamp
-game_heartbeats: Dict[str, datetime] = {}
-HEARTBEAT_TIMEOUT_SECONDS = 10  # If no heartbeat for 10 seconds, trigger tech difficulties
+
+def cached_share_response(key: str, if_none_match: Optional[str], build: Callable, *args) -> Response:
+    """Serve a share-code GET from share_responses. On a miss, build(*args) returns the JSON body
+    and the tags it depends on (None for a body that must not be stored)."""
+    entry = share_responses.get(key)
+    if entry is None:
+        started = share_responses.begin()
+        body, tags = build(*args)
+        entry = share_responses.put(key, body, tags, started)
+    return share_responses.respond(entry, if_none_match)
+
+
+def league_not_modified(db: Session, league_id: str, if_none_match: Optional[str], response: Response) -> Optional[Response]:
+    """Conditional GET of a league collection: a 304 if the client's copy is current, otherwise
+    None after putting the league's ETag on the response being built (see revisions.py)"""
+    etag = revisions.league_etag(db, league_id)
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": revisions.CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
 
 
 # ============ Auth Endpoints ============
@@ -135,7 +170,7 @@ async def get_current_user_info(
 
 
 @app.put("/api/auth/me", response_model=schemas.User)
-async def update_current_user(
+def update_current_user(
     updates: schemas.UserUpdate,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
@@ -164,7 +199,7 @@ async def update_current_user(
 
 
 @app.put("/api/auth/password")
-async def change_password(
+def change_password(
     password_data: schemas.PasswordChange,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
@@ -181,7 +216,7 @@ async def change_password(
 
 # ============ League Endpoints ============
 @app.post("/api/leagues", response_model=schemas.League)
-async def create_league(
+def create_league(
     league: schemas.LeagueCreate, 
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
@@ -207,7 +242,7 @@ async def create_league(
 
 
 @app.get("/api/leagues", response_model=List[schemas.League])
-async def get_leagues(
+def get_leagues(
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
@@ -226,10 +261,17 @@ async def get_leagues(
 @app.post("/api/leagues/{league_id}/claim")
 async def claim_league(
     league_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(auth.get_current_user_required)
 ):
     """Claim an orphaned league (one with no owner)"""
+    await db.run_sync(commit_league_claim, league_id, current_user)
+    live_games.set_league_owner(league_id, current_user.id)
+    await manager.invalidate([f"league:{league_id}"])
+    return {"message": "League claimed successfully"}
+
+
+def commit_league_claim(db: Session, league_id: str, current_user: models.User):
     league = db.query(models.League).filter(models.League.id == league_id).first()
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
@@ -237,11 +279,10 @@ async def claim_league(
         raise HTTPException(status_code=400, detail="League already has an owner")
     league.owner_id = current_user.id
     db.commit()
-    return {"message": "League claimed successfully"}
 
 
 @app.get("/api/leagues/my", response_model=List[schemas.League])
-async def get_my_leagues(
+def get_my_leagues(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
 ):
@@ -259,14 +300,18 @@ def get_user_leagues(username: str, db: Session = Depends(get_db)):
 
 # NOTE: This route must come BEFORE /api/leagues/{league_id} to avoid path parameter matching "share"
 @app.get("/api/leagues/share/{share_code}", response_model=schemas.LeagueWithTeams)
-def get_league_by_share_code(share_code: str, db: Session = Depends(get_db)):
+def get_league_by_share_code(share_code: str, db: Session = Depends(get_db), if_none_match: Optional[str] = Header(None)):
     """Get a league by its share code (public endpoint)"""
+    return cached_share_response(f"league/{share_code.upper()}", if_none_match, league_share_body, db, share_code.upper())
+
+
+def league_share_body(db: Session, share_code: str) -> Tuple[bytes, Optional[List[str]]]:
     league = db.query(models.League).options(
         joinedload(models.League.teams)
-    ).filter(models.League.share_code == share_code.upper()).first()
+    ).filter(models.League.share_code == share_code).first()
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
-    return league
+    return schemas.LeagueWithTeams.model_validate(league).model_dump_json().encode(), [f"league:{league.id}"]
 
 
 @app.get("/api/leagues/{league_id}", response_model=schemas.LeagueWithTeams)
@@ -295,9 +340,16 @@ def check_league_ownership(db: Session, league_id: str, current_user: Optional[m
 async def update_league(
     league_id: str, 
     league: schemas.LeagueUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    db_league = await db.run_sync(commit_league_update, league_id, league, current_user)
+    await manager.invalidate([f"league:{league_id}"])
+    return db_league
+
+
+def commit_league_update(db: Session, league_id: str, league: schemas.LeagueUpdate,
+                         current_user: Optional[models.User]) -> schemas.League:
     db_league = check_league_ownership(db, league_id, current_user)
     for key, value in league.model_dump(exclude_unset=True).items():
         # Convert dict/list fields to JSON string
@@ -307,19 +359,33 @@ async def update_league(
             value = json.dumps(value)
         elif key == 'mechanics' and value is not None:
             value = json.dumps(value)
+        elif key == 'tiebreakers' and value is not None:
+            unknown = [name for name in value if name not in rankings.TIEBREAKERS]
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown tiebreakers: {', '.join(map(str, unknown))}")
+            value = json.dumps(value)
         setattr(db_league, key, value)
+    revisions.bump_league(db, league_id)
     db.commit()
     db.refresh(db_league)
-    return db_league
+    return schemas.League.model_validate(db_league)
 
 
 @app.delete("/api/leagues/{league_id}", status_code=204)
 async def delete_league(
     league_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
-    db_league = check_league_ownership(db, league_id, current_user)
+    game_ids = await db.run_sync(remove_league, league_id, current_user)
+    forget_deleted_games(game_ids)
+    await manager.invalidate([f"league:{league_id}"])
+    return None
+
+
+def remove_league(db: Session, league_id: str, current_user: Optional[models.User]) -> List[str]:
+    """Delete a league with everything in it; returns the ids of its deleted games"""
+    check_league_ownership(db, league_id, current_user)
     
     try:
         # Get bracket IDs first
@@ -333,6 +399,7 @@ async def delete_league(
         db.query(models.Bracket).filter(models.Bracket.league_id == league_id).delete(synchronize_session=False)
         
         # Delete games
+        game_ids = [row.id for row in db.query(models.Game.id).filter(models.Game.league_id == league_id)]
         db.query(models.Game).filter(models.Game.league_id == league_id).delete(synchronize_session=False)
         
         # Delete team season stats (for all seasons in this league)
@@ -352,8 +419,7 @@ async def delete_league(
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
-    
-    return None
+    return game_ids
 
 
 # ============ Season Endpoints ============
@@ -373,7 +439,7 @@ def get_current_season(league_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/api/seasons", response_model=schemas.Season)
-async def create_season(
+def create_season(
     season: schemas.SeasonCreate,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
@@ -389,8 +455,7 @@ async def create_season(
     # Create the new season as current
     db_season = models.Season(**season.model_dump(), is_current=True)
     db.add(db_season)
-    db.commit()
-    db.refresh(db_season)
+    db.flush()
     
     # Create TeamSeasonStats for all teams in the league
     teams = db.query(models.Team).filter(models.Team.league_id == season.league_id).all()
@@ -400,13 +465,16 @@ async def create_season(
             season_id=db_season.id
         )
         db.add(team_stats)
+    # The current season and its stats rows change the league pages
+    revisions.bump_league(db, season.league_id)
     db.commit()
+    db.refresh(db_season)
     
     return db_season
 
 
 @app.put("/api/seasons/{season_id}", response_model=schemas.Season)
-async def update_season(
+def update_season(
     season_id: str,
     season: schemas.SeasonUpdate,
     db: Session = Depends(get_db),
@@ -429,13 +497,14 @@ async def update_season(
     for key, value in season.model_dump(exclude_unset=True).items():
         setattr(db_season, key, value)
     
+    revisions.bump_league(db, db_season.league_id)
     db.commit()
     db.refresh(db_season)
     return db_season
 
 
 @app.post("/api/seasons/{season_id}/end", response_model=schemas.Season)
-async def end_season(
+def end_season(
     season_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
@@ -449,6 +518,7 @@ async def end_season(
     
     db_season.is_finished = True
     db_season.is_current = False
+    revisions.bump_league(db, db_season.league_id)
     db.commit()
     db.refresh(db_season)
     return db_season
@@ -459,15 +529,11 @@ def get_season_standings(season_id: str, db: Session = Depends(get_db)):
     """Get standings for a specific season"""
     stats = db.query(models.TeamSeasonStats).filter(
         models.TeamSeasonStats.season_id == season_id
-    ).all()
-    
-    # Sort by wins (desc), then losses (asc), then point differential
-    sorted_stats = sorted(stats, key=lambda s: (
-        -s.wins,
-        s.losses,
-        -(s.points_for - s.points_against)
-    ))
-    return sorted_stats
+    ).order_by(*standings.standings_order(models.TeamSeasonStats)).all()
+    season = db.query(models.Season).filter(models.Season.id == season_id).first()
+    if not season:
+        return stats
+    return rankings.ranked_rows(db, season.league_id, stats, season_id=season_id)
 
 
 # ============ Record Type Endpoints ============
@@ -481,7 +547,7 @@ def get_league_record_types(league_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/api/record-types", response_model=schemas.RecordType)
-async def create_record_type(
+def create_record_type(
     record_type: schemas.RecordTypeCreate,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
@@ -511,13 +577,14 @@ async def create_record_type(
             record_type_id=db_record_type.id
         )
         db.add(team_record)
+    revisions.bump_league(db, record_type.league_id)
     db.commit()
     
     return db_record_type
 
 
 @app.put("/api/record-types/{record_type_id}", response_model=schemas.RecordType)
-async def update_record_type(
+def update_record_type(
     record_type_id: str,
     record_type_update: schemas.RecordTypeUpdate,
     db: Session = Depends(get_db),
@@ -534,13 +601,14 @@ async def update_record_type(
     for key, value in update_data.items():
         setattr(db_record_type, key, value)
     
+    revisions.bump_league(db, db_record_type.league_id)
     db.commit()
     db.refresh(db_record_type)
     return db_record_type
 
 
 @app.delete("/api/record-types/{record_type_id}")
-async def delete_record_type(
+def delete_record_type(
     record_type_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
@@ -561,19 +629,39 @@ async def delete_record_type(
     )
     
     db.delete(db_record_type)
+    revisions.bump_league(db, db_record_type.league_id)
     db.commit()
     return {"message": "Record type deleted"}
 
 
 @app.get("/api/leagues/{league_id}/team-records")
-def get_league_team_records(league_id: str, record_type_id: Optional[str] = None, db: Session = Depends(get_db)):
+def get_league_team_records(league_id: str, response: Response, record_type_id: Optional[str] = None,
+                            db: Session = Depends(get_db), if_none_match: Optional[str] = Header(None)):
     """Get team records for a league, optionally filtered by record type"""
+    not_modified = league_not_modified(db, league_id, if_none_match, response)
+    if not_modified:
+        return not_modified
     query = db.query(models.TeamRecord).join(models.Team).filter(models.Team.league_id == league_id)
     
     if record_type_id:
         query = query.filter(models.TeamRecord.record_type_id == record_type_id)
     
-    records = query.all()
+    records = query.options(joinedload(models.TeamRecord.team)).order_by(
+        *standings.standings_order(models.TeamRecord)
+    ).all()
+    
+    # Rank each record type's standings separately, record types in their display order
+    by_record_type = {}
+    for record in records:
+        by_record_type.setdefault(record.record_type_id, []).append(record)
+    position = {rt.id: i for i, rt in enumerate(db.query(models.RecordType.id).filter(
+        models.RecordType.league_id == league_id
+    ).order_by(models.RecordType.sort_order, models.RecordType.created_at).all())}
+    records = [
+        record
+        for rt_id in sorted(by_record_type, key=lambda rt_id: position.get(rt_id, len(position)))
+        for record in rankings.ranked_rows(db, league_id, by_record_type[rt_id], record_type_id=rt_id)
+    ]
     
     # Return as list of dicts with team info
     result = []
@@ -594,9 +682,6 @@ def get_league_team_records(league_id: str, record_type_id: Optional[str] = None
             "points_for": record.points_for,
             "points_against": record.points_against,
         })
-    
-    # Sort by wins desc, losses asc, point diff
-    result.sort(key=lambda r: (-r["wins"], r["losses"], -(r["points_for"] - r["points_against"])))
     return result
 
 
@@ -604,9 +689,15 @@ def get_league_team_records(league_id: str, record_type_id: Optional[str] = None
 @app.post("/api/teams", response_model=schemas.Team)
 async def create_team(
     team: schemas.TeamCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    db_team = await db.run_sync(insert_team, team, current_user)
+    await manager.invalidate([f"league:{db_team.league_id}"])
+    return db_team
+
+
+def insert_team(db: Session, team: schemas.TeamCreate, current_user: Optional[models.User]) -> schemas.Team:
     # Check user owns the league this team belongs to
     check_league_ownership(db, team.league_id, current_user)
     db_team = models.Team(**team.model_dump())
@@ -624,35 +715,116 @@ async def create_team(
             record_type_id=rt.id
         )
         db.add(team_record)
+    revisions.bump_league(db, db_team.league_id)
     db.commit()
-    
-    return db_team
+    return schemas.Team.model_validate(db_team)
 
 
 @app.get("/api/leagues/{league_id}/teams", response_model=List[schemas.Team])
-def get_league_teams(league_id: str, db: Session = Depends(get_db)):
+def get_league_teams(league_id: str, response: Response, db: Session = Depends(get_db),
+                     if_none_match: Optional[str] = Header(None)):
+    not_modified = league_not_modified(db, league_id, if_none_match, response)
+    if not_modified:
+        return not_modified
     return db.query(models.Team).filter(models.Team.league_id == league_id).all()
 
 
 @app.get("/api/leagues/{league_id}/standings", response_model=List[schemas.Team])
-def get_league_standings(league_id: str, db: Session = Depends(get_db)):
-    teams = db.query(models.Team).filter(models.Team.league_id == league_id).all()
-    # Sort by wins (desc), then losses (asc), then point differential
-    sorted_teams = sorted(teams, key=lambda t: (
-        -t.wins,
-        t.losses,
-        -(t.points_for - t.points_against)
-    ))
-    return sorted_teams
+def get_league_standings(league_id: str, response: Response, db: Session = Depends(get_db),
+                         if_none_match: Optional[str] = Header(None)):
+    not_modified = league_not_modified(db, league_id, if_none_match, response)
+    if not_modified:
+        return not_modified
+    teams = db.query(models.Team).filter(
+        models.Team.league_id == league_id
+    ).order_by(*standings.standings_order(models.Team)).all()
+    return rankings.ranked_rows(db, league_id, teams, team_id=lambda team: team.id)
+
+
+@app.get("/api/leagues/{league_id}/playoff-odds")
+def get_playoff_odds(
+    league_id: str,
+    spots: Optional[int] = Query(None, ge=1),
+    simulations: int = Query(playoff_odds.PLAYOFF_SIMULATIONS, ge=100, le=playoff_odds.MAX_PLAYOFF_SIMULATIONS),
+    db: Session = Depends(get_db)
+):
+    """Playoff, seed and division title odds from simulating the rest of the schedule
+    (see playoff_odds.py). spots is the playoff field size, default the largest playoff bracket."""
+    if not db.query(models.League.id).filter(models.League.id == league_id).first():
+        raise HTTPException(status_code=404, detail="League not found")
+    return playoff_odds.odds_report(db, league_id, simulations, spots)
+
+
+@app.get("/api/leagues/{league_id}/ratings", response_model=List[schemas.TeamRating])
+def get_league_ratings(
+    league_id: str,
+    response: Response,
+    season_id: Optional[str] = None,
+    sort: str = Query("elo", pattern="^(elo|srs)$"),
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Elo and SRS power ratings, league-wide or for one season, best first (see ratings.py)"""
+    not_modified = league_not_modified(db, league_id, if_none_match, response)
+    if not_modified:
+        return not_modified
+    return ratings.league_ratings(db, league_id, season_id, sort)
+
+
+@app.post("/api/leagues/{league_id}/ratings/rebuild")
+async def rebuild_league_ratings(
+    league_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[models.User] = Depends(auth.get_current_user)
+):
+    """Recompute the league's ratings from its final games"""
+    return await db.run_sync(rebuild_ratings_for_owner, league_id, current_user)
+
+
+def rebuild_ratings_for_owner(db: Session, league_id: str, current_user: Optional[models.User]) -> dict:
+    check_league_ownership(db, league_id, current_user)
+    result = ratings.rebuild_league(db, league_id)
+    revisions.bump_league(db, league_id)
+    db.commit()
+    return result
+
+
+@app.post("/api/leagues/{league_id}/standings/recompute")
+async def recompute_league_standings(
+    league_id: str,
+    dry_run: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[models.User] = Depends(auth.get_current_user)
+):
+    """Rebuild team, season and record-type standings from the league's final games.
+    With dry_run, only report which counters are out of date."""
+    result = await db.run_sync(recompute_standings_for_owner, league_id, current_user, dry_run)
+    if not dry_run:
+        await manager.invalidate([f"league:{league_id}"])
+        playoff_pictures.schedule(league_id)
+    return result
+
+
+def recompute_standings_for_owner(db: Session, league_id: str, current_user: Optional[models.User], dry_run: bool) -> dict:
+    check_league_ownership(db, league_id, current_user)
+    return standings.recompute_league(db, league_id, dry_run=dry_run)
 
 
 @app.put("/api/teams/{team_id}", response_model=schemas.Team)
 async def update_team(
     team_id: str, 
     team: schemas.TeamUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    db_team = await db.run_sync(commit_team_update, team_id, team, current_user)
+    live_games.update_team(db_team.model_dump())
+    await manager.invalidate([f"league:{db_team.league_id}"])
+    return db_team
+
+
+def commit_team_update(db: Session, team_id: str, team: schemas.TeamUpdate,
+                       current_user: Optional[models.User]) -> schemas.Team:
     db_team = db.query(models.Team).filter(models.Team.id == team_id).first()
     if not db_team:
         raise HTTPException(status_code=404, detail="Team not found")
@@ -660,45 +832,69 @@ async def update_team(
     check_league_ownership(db, db_team.league_id, current_user)
     for key, value in team.model_dump(exclude_unset=True).items():
         setattr(db_team, key, value)
+    revisions.bump_league(db, db_team.league_id)
     db.commit()
     db.refresh(db_team)
-    return db_team
+    return schemas.Team.model_validate(db_team)
 
 
 @app.delete("/api/teams/{team_id}", status_code=204)
 async def delete_team(
     team_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    league_id, game_ids = await db.run_sync(remove_team, team_id, current_user)
+    forget_deleted_games(game_ids)
+    await manager.invalidate([f"league:{league_id}"])
+    return None
+
+
+def remove_team(db: Session, team_id: str, current_user: Optional[models.User]) -> Tuple[str, List[str]]:
+    """Delete a team with its games; returns its league and the ids of the deleted games"""
     db_team = db.query(models.Team).filter(models.Team.id == team_id).first()
     if not db_team:
         raise HTTPException(status_code=404, detail="Team not found")
     # Check user owns the league this team belongs to
     check_league_ownership(db, db_team.league_id, current_user)
     
-    # Delete games involving this team
-    db.query(models.Game).filter(
+    # Delete games involving this team, taking their results out of the opponents' standings
+    team_games = db.query(models.Game).filter(
         (models.Game.home_team_id == team_id) | (models.Game.away_team_id == team_id)
-    ).delete(synchronize_session=False)
+    )
+    standings.remove_game_results(db, team_games.filter(models.Game.status == "final").all())
+    game_ids = [row.id for row in team_games.with_entities(models.Game.id)]
+    team_games.delete(synchronize_session=False)
     
     # Clear team references in bracket matches (set to NULL)
     db.query(models.BracketMatch).filter(models.BracketMatch.team1_id == team_id).update({"team1_id": None})
     db.query(models.BracketMatch).filter(models.BracketMatch.team2_id == team_id).update({"team2_id": None})
     db.query(models.BracketMatch).filter(models.BracketMatch.winner_id == team_id).update({"winner_id": None})
     
+    league_id = db_team.league_id
     db.delete(db_team)
+    revisions.bump_league(db, league_id)
     db.commit()
-    return None
+    return league_id, game_ids
 
 
 @app.post("/api/teams/{team_id}/logo")
 async def upload_team_logo(
     team_id: str, 
     file: UploadFile = File(...), 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    content = await file.read()
+    db_team = await db.run_sync(save_team_logo, team_id, file, content, current_user)
+    live_games.update_team(db_team.model_dump())
+    await manager.invalidate([f"league:{db_team.league_id}"])
+    
+    return {"logo_url": db_team.logo_url}
+
+
+def save_team_logo(db: Session, team_id: str, file: UploadFile, content: bytes,
+                   current_user: Optional[models.User]) -> schemas.Team:
     db_team = db.query(models.Team).filter(models.Team.id == team_id).first()
     if not db_team:
         raise HTTPException(status_code=404, detail="Team not found")
@@ -724,43 +920,53 @@ async def upload_team_logo(
     
     # Save new file
     with open(filepath, "wb") as f:
-        content = await file.read()
         f.write(content)
     
     # Update team with logo URL
     db_team.logo_url = f"/uploads/{filename}"
+    revisions.bump_league(db, db_team.league_id)
     db.commit()
     db.refresh(db_team)
-    
-    return {"logo_url": db_team.logo_url}
+    return schemas.Team.model_validate(db_team)
 
 
 @app.delete("/api/teams/{team_id}/logo", status_code=204)
 async def delete_team_logo(
     team_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    db_team = await db.run_sync(remove_team_logo, team_id, current_user)
+    if db_team:
+        live_games.update_team(db_team.model_dump())
+        await manager.invalidate([f"league:{db_team.league_id}"])
+    
+    return None
+
+
+def remove_team_logo(db: Session, team_id: str, current_user: Optional[models.User]) -> Optional[schemas.Team]:
+    """Delete a team's logo; returns the updated team, or None if it had no logo"""
     db_team = db.query(models.Team).filter(models.Team.id == team_id).first()
     if not db_team:
         raise HTTPException(status_code=404, detail="Team not found")
     # Check user owns the league this team belongs to
     check_league_ownership(db, db_team.league_id, current_user)
     
-    if db_team.logo_url:
-        filename = db_team.logo_url.split("/")[-1]
-        filepath = os.path.join(UPLOAD_DIR, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        db_team.logo_url = None
-        db.commit()
-    
-    return None
+    if not db_team.logo_url:
+        return None
+    filename = db_team.logo_url.split("/")[-1]
+    filepath = os.path.join(UPLOAD_DIR, filename)
+    if os.path.exists(filepath):
+        os.remove(filepath)
+    db_team.logo_url = None
+    revisions.bump_league(db, db_team.league_id)
+    db.commit()
+    return schemas.Team.model_validate(db_team)
 
 
 # ============ Game Endpoints ============
 @app.post("/api/games", response_model=schemas.GameWithTeams)
-async def create_game(
+def create_game(
     game: schemas.GameCreate, 
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
@@ -781,6 +987,7 @@ async def create_game(
     
     db_game = models.Game(**game_data)
     db.add(db_game)
+    revisions.bump_league(db, db_game.league_id)
     db.commit()
     db.refresh(db_game)
     return db.query(models.Game).options(
@@ -789,230 +996,484 @@ async def create_game(
     ).filter(models.Game.id == db_game.id).first()
 
 
+MAX_BULK_GAMES = 5000
+
+
+@app.post("/api/leagues/{league_id}/games/bulk", response_model=schemas.GameBulkResult)
+async def create_games_bulk(
+    league_id: str,
+    bulk: schemas.GameBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[models.User] = Depends(auth.get_current_user)
+):
+    """Create many games (and/or a generated round robin) in one transaction"""
+    return await db.run_sync(insert_games, league_id, bulk, current_user)
+
+
+def insert_games(db: Session, league_id: str, bulk: schemas.GameBulkCreate, current_user: Optional[models.User]) -> dict:
+    check_league_ownership(db, league_id, current_user)
+    teams = db.query(models.Team.id, models.Team.group_1, models.Team.group_2).filter(
+        models.Team.league_id == league_id
+    ).order_by(models.Team.name).all()
+    team_ids = {team.id for team in teams}
+    record_type_ids = {rt.id for rt in db.query(models.RecordType.id).filter(models.RecordType.league_id == league_id)}
+
+    season_id = bulk.season_id
+    if season_id:
+        if not db.query(models.Season.id).filter(models.Season.id == season_id, models.Season.league_id == league_id).first():
+            raise HTTPException(status_code=400, detail="Season not found in this league")
+    else:
+        current_season = db.query(models.Season.id).filter(
+            models.Season.league_id == league_id,
+            models.Season.is_current == True
+        ).first()
+        season_id = current_season.id if current_season else None
+
+    games = [game.model_dump() for game in bulk.games]
+    if bulk.generate:
+        spec_teams = bulk.generate.team_ids or [team.id for team in teams]
+        unknown = [team_id for team_id in spec_teams if team_id not in team_ids]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Teams not in this league: {', '.join(unknown[:10])}")
+        groups = {team.id: (team.group_1, team.group_2) for team in teams}
+        try:
+            games += scheduling.generate_games(bulk.generate, spec_teams, groups)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if not games:
+        raise HTTPException(status_code=400, detail="No games to create")
+    if len(games) > MAX_BULK_GAMES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_GAMES} games per request")
+
+    errors = []
+    for index, game in enumerate(games):
+        if game["home_team_id"] not in team_ids or game["away_team_id"] not in team_ids:
+            errors.append(f"game {index}: team not in this league")
+        elif game["home_team_id"] == game["away_team_id"]:
+            errors.append(f"game {index}: a team cannot play itself")
+        elif game["record_type_id"] and game["record_type_id"] not in record_type_ids:
+            errors.append(f"game {index}: record type not in this league")
+    if errors:
+        raise HTTPException(status_code=400, detail=errors[:20])
+
+    # Keys are generated here so the whole batch is one executemany with no reads back
+    rows = [{**game, "id": models.generate_uuid(), "share_code": models.generate_share_code(),
+             "league_id": league_id, "season_id": season_id} for game in games]
+    db.execute(insert(models.Game), rows)
+    revisions.bump_league(db, league_id)
+    db.commit()
+    return {
+        "created": len(rows),
+        "season_id": season_id,
+        "ids": [row["id"] for row in rows],
+        "share_codes": [row["share_code"] for row in rows],
+    }
+
+
+MAX_GAMES_PAGE = 500
+
+
 @app.get("/api/leagues/{league_id}/games", response_model=List[schemas.GameWithTeams])
-def get_league_games(league_id: str, db: Session = Depends(get_db)):
-    return db.query(models.Game).options(
-        joinedload(models.Game.home_team),
-        joinedload(models.Game.away_team)
-    ).filter(models.Game.league_id == league_id).all()
-
-
-def calculate_live_game_time(game):
-    """Calculate the current game time if timer is running"""
-    if game.timer_running and game.timer_started_at and game.timer_started_seconds is not None:
-        now = datetime.utcnow()
-        # Ensure timer_started_at is treated as UTC (remove any timezone info for comparison)
-        started_at = game.timer_started_at
-        if hasattr(started_at, 'replace'):
-            started_at = started_at.replace(tzinfo=None)
-        elapsed_seconds = int((now - started_at).total_seconds())
-        # Sanity check: elapsed time should be positive and reasonable (< 24 hours)
-        if elapsed_seconds < 0 or elapsed_seconds > 86400:
-            # Something is wrong with the timestamp, don't modify game_time
-            return game
-        current_seconds = max(0, game.timer_started_seconds - elapsed_seconds)
-        mins = current_seconds // 60
-        secs = current_seconds % 60
-        game.game_time = f"{mins}:{secs:02d}"
-        
-        # If time ran out, stop the timer
-        if current_seconds <= 0:
-            game.timer_running = False
-    return game
+def get_league_games(
+    league_id: str,
+    request: Request,
+    response: Response,
+    season_id: Optional[str] = None,
+    game_unit: Optional[int] = None,
+    game_unit_type: Optional[int] = None,
+    game_status: Optional[str] = Query(None, alias="status"),
+    team_id: Optional[str] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_GAMES_PAGE),
+    cursor: Optional[str] = None,
+    normalized: bool = False,
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None)
+):
+    """A league's games in schedule order (scheduled_at, then id; games without a date first).
+
+    Optional filters: season_id, game_unit, game_unit_type, status, team_id (home or away) and
+    scheduled_from (inclusive) / scheduled_to (exclusive). Without limit every matching game is
+    returned. With limit, one page is returned and, if there are more, the next page's cursor is
+    in the X-Next-Cursor header and a Link rel="next" header; pass it back as cursor.
+
+    With normalized=true the body is a schemas.LeagueGames instead: games carry home_team_id and
+    away_team_id, and every team they refer to appears once in the `teams` map."""
+    not_modified = league_not_modified(db, league_id, if_none_match, response)
+    if not_modified:
+        return not_modified
+    game = models.Game
+    query = db.query(game).filter(game.league_id == league_id)
+    if not normalized:
+        query = query.options(joinedload(game.home_team), joinedload(game.away_team))
+    if season_id:
+        query = query.filter(game.season_id == season_id)
+    if game_unit is not None:
+        query = query.filter(game.game_unit == game_unit)
+    if game_unit_type is not None:
+        query = query.filter(game.game_unit_type == game_unit_type)
+    if game_status:
+        query = query.filter(game.status == game_status)
+    if team_id:
+        query = query.filter(or_(game.home_team_id == team_id, game.away_team_id == team_id))
+    if scheduled_from:
+        query = query.filter(game.scheduled_at >= scheduled_from.replace(tzinfo=None))
+    if scheduled_to:
+        query = query.filter(game.scheduled_at < scheduled_to.replace(tzinfo=None))
+    if cursor:
+        after_at, after_id = decode_games_cursor(cursor)
+        if after_at is None:
+            # Undated games sort first (NULL < any date in SQLite)
+            query = query.filter(or_(game.scheduled_at.isnot(None), and_(game.scheduled_at.is_(None), game.id > after_id)))
+        else:
+            query = query.filter(tuple_(game.scheduled_at, game.id) > tuple_(after_at, after_id))
+    # Walks ix_games_league_id_scheduled_at, so a page costs the same however long the league's history
+    query = query.order_by(game.scheduled_at, game.id)
+    if limit is None:
+        games = query.all()
+    else:
+        games = query.limit(limit + 1).all()
+        if len(games) > limit:
+            games = games[:limit]
+            next_cursor = encode_games_cursor(games[-1])
+            response.headers["X-Next-Cursor"] = next_cursor
+            response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+    if normalized:
+        return normalized_games_response(db, games, response)
+    return games
+
+
+def normalized_games_response(db: Session, games: List[models.Game], response: Response) -> Response:
+    """schemas.LeagueGames body for a list of games, with each referenced team serialized once"""
+    team_ids = {team_id for g in games for team_id in (g.home_team_id, g.away_team_id)}
+    teams = db.query(models.Team).filter(models.Team.id.in_(team_ids)).all() if team_ids else []
+    body = schemas.LeagueGames(
+        games=[schemas.GameWithTeamIds.model_validate(g) for g in games],
+        teams={team.id: schemas.Team.model_validate(team) for team in teams},
+    )
+    # Returned as-is, so FastAPI neither re-validates it against response_model nor adds the
+    # headers set on `response` by itself
+    return Response(content=body.model_dump_json(), media_type="application/json", headers=dict(response.headers))
+
+
+def encode_games_cursor(game: models.Game) -> str:
+    """Opaque keyset cursor: the (scheduled_at, id) of the last game of a page"""
+    key = [game.scheduled_at.isoformat() if game.scheduled_at else None, game.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_games_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    try:
+        scheduled_at, game_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return (datetime.fromisoformat(scheduled_at) if scheduled_at else None), str(game_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def game_response(game: models.Game):
+    """Response body for a game loaded from the database, with a running clock brought up to date"""
+    reading = clock_reading(game.timer_running, game.timer_started_at, game.timer_started_seconds)
+    if reading is None:
+        return game
+    # Copy rather than mutate the ORM object, so the overlay can never be flushed back
+    return schemas.GameWithTeams.model_validate(game).model_copy(update=reading)
+
+
+def live_game_response(live) -> dict:
+    """Response body for a game served from the live state store, with the clock brought up to date"""
+    data = dict(live.data)
+    data.update(clock_reading(data["timer_running"], data["timer_started_at"], data["timer_started_seconds"]) or {})
+    return data
+
+
+def team_broadcast_data(team: models.Team) -> dict:
+    return {field: getattr(team, field) for field in TEAM_BROADCAST_FIELDS}
+
+
+GAME_BROADCAST_FIELDS = (
+    "id", "home_score", "away_score", "status", "quarter", "game_time", "down", "distance", "ball_on",
+    "possession", "home_timeouts", "away_timeouts", "play_clock", "display_state",
+    "timer_running", "timer_started_at", "timer_started_seconds",
+)
+TEAM_BROADCAST_FIELDS = ("id", "name", "abbreviation", "color", "color2", "logo_url")
+
+
+def game_broadcast_data(game: models.Game) -> dict:
+    """Snapshot of the live-display fields of a league game, as sent over the game WebSocket"""
+    data = {field: getattr(game, field) for field in GAME_BROADCAST_FIELDS}
+    data.update(clock_reading(game.timer_running, game.timer_started_at, game.timer_started_seconds) or {})
+    data["home_team"] = team_broadcast_data(game.home_team)
+    data["away_team"] = team_broadcast_data(game.away_team)
+    return data
+
+
+def live_game_broadcast_data(data: dict) -> dict:
+    """game_broadcast_data() for a game response dict (see live_game_response)"""
+    snapshot = {field: data[field] for field in GAME_BROADCAST_FIELDS}
+    for side in ("home_team", "away_team"):
+        snapshot[side] = {field: data[side][field] for field in TEAM_BROADCAST_FIELDS}
+    return snapshot
 
 
 @app.get("/api/games/{game_id}", response_model=schemas.GameWithTeams)
 def get_game(game_id: str, db: Session = Depends(get_db)):
+    live = live_games.get(game_id)
+    if live:
+        return live_game_response(live)
     game = db.query(models.Game).options(
         joinedload(models.Game.home_team),
         joinedload(models.Game.away_team)
     ).filter(models.Game.id == game_id).first()
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
-    # Calculate live game time if timer is running
-    calculate_live_game_time(game)
-    return game
+    return game_response(game)
 
 
 @app.get("/api/games/share/{share_code}", response_model=schemas.GameWithTeams)
-def get_game_by_share_code(share_code: str, db: Session = Depends(get_db)):
+def get_game_by_share_code(share_code: str, db: Session = Depends(get_db), if_none_match: Optional[str] = Header(None)):
+    return cached_share_response(f"game/{share_code.upper()}", if_none_match, game_share_body, db, share_code.upper())
+
+
+def game_share_body(db: Session, share_code: str) -> Tuple[bytes, Optional[List[str]]]:
+    # Games in the live state store are already served from memory and change every few seconds
+    live = live_games.get_by_share_code(share_code)
+    if live:
+        return schemas.GameWithTeams.model_validate(live_game_response(live)).model_dump_json().encode(), None
     game = db.query(models.Game).options(
         joinedload(models.Game.home_team),
         joinedload(models.Game.away_team)
-    ).filter(models.Game.share_code == share_code.upper()).first()
+    ).filter(models.Game.share_code == share_code).first()
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
-    # Calculate live game time if timer is running
-    calculate_live_game_time(game)
-    return game
+    body = schemas.GameWithTeams.model_validate(game_response(game)).model_dump_json().encode()
+    # A running clock makes every response different; a live game the store has not picked up
+    # yet may have unflushed changes
+    if clock_reading(game.timer_running, game.timer_started_at, game.timer_started_seconds) is not None or \
+            (live_games.enabled and game.status == "live"):
+        return body, None
+    # Team records are part of the body, so league-wide changes (results, team edits) apply too
+    return body, [f"game:{share_code}", f"league:{game.league_id}"]
 
 
 @app.put("/api/games/{game_id}", response_model=schemas.GameWithTeams)
 async def update_game(
     game_id: str, 
     game_update: schemas.GameUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    return await apply_game_update(db, game_id, game_update.model_dump(exclude_unset=True), current_user)
+
+
+async def apply_game_update(db: AsyncSession, game_id: str, updates: dict, current_user: Optional[models.User]):
+    """Apply a validated GameUpdate (HTTP PUT or controller WebSocket) and broadcast the result"""
+    pending = None
+    live = live_games.get(game_id)
+    if live:
+        # Same rule as check_league_ownership, against the owner cached when the game went live
+        if live.owner_id is not None and (current_user is None or live.owner_id != current_user.id):
+            raise HTTPException(status_code=403, detail="You don't have permission to modify this league")
+        if live_games.is_hot_update(updates):
+            # Fast path: apply in memory, the write-behind flusher persists it
+            live.apply(updates)
+            response_data = live_game_response(live)
+            await manager.broadcast_game_state(f"game:{live.share_code}", live_game_broadcast_data(response_data))
+            sync_game_clock(live.data)
+            return response_data
+        # Status/team changes need the database: write pending changes back first
+        pending = await live_games.release(game_id)
+    
+    game, owner_id, standings_changed = await db.run_sync(commit_game_update, game_id, updates, current_user, pending)
+    
+    # Live games are served from memory from now on
+    live_games.track(game, owner_id)
+    
+    await manager.broadcast_game_state(f"game:{game.share_code}", game_broadcast_data(game))
+    if standings_changed:
+        # Other games and the league page show the teams' records
+        await manager.invalidate([f"league:{game.league_id}"])
+        playoff_pictures.schedule(game.league_id)
+    sync_game_clock({field: getattr(game, field) for field in CLOCK_FIELDS})
+    
+    return game_response(game)
+
+
+def commit_game_update(db: Session, game_id: str, updates: dict, current_user: Optional[models.User],
+                       pending: Optional[dict]):
+    """Database half of apply_game_update: returns the updated game (teams loaded), its league owner
+    and whether the standings moved"""
+    if pending:
+        # Unflushed live-state changes go in first so the update applies on top of them
+        db.query(models.Game).filter(models.Game.id == game_id).update(pending, synchronize_session=False)
+        revisions.bump_league(db, db.query(models.Game.league_id).filter(models.Game.id == game_id).scalar())
+        db.commit()
+    
     db_game = db.query(models.Game).filter(models.Game.id == game_id).first()
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
     # Check user owns the league this game belongs to
-    check_league_ownership(db, db_game.league_id, current_user)
+    db_league = check_league_ownership(db, db_game.league_id, current_user)
     
     old_status = db_game.status
-    old_home_score = db_game.home_score
-    old_away_score = db_game.away_score
+    old_result = standings.game_result(db_game)
     
-    for key, value in game_update.model_dump(exclude_unset=True).items():
+    for key, value in updates.items():
         setattr(db_game, key, value)
     
     # Handle status changes
-    if game_update.status == "live" and old_status != "live":
+    if updates.get("status") == "live" and old_status != "live":
         db_game.started_at = datetime.utcnow()
-    elif game_update.status == "final" and old_status != "final":
+    elif updates.get("status") == "final" and old_status != "final":
         db_game.ended_at = datetime.utcnow()
-        # Update team records
-        home_team = db.query(models.Team).filter(models.Team.id == db_game.home_team_id).first()
-        away_team = db.query(models.Team).filter(models.Team.id == db_game.away_team_id).first()
-        if home_team and away_team:
-            home_team.points_for += db_game.home_score
-            home_team.points_against += db_game.away_score
-            away_team.points_for += db_game.away_score
-            away_team.points_against += db_game.home_score
-            if db_game.home_score > db_game.away_score:
-                home_team.wins += 1
-                away_team.losses += 1
-            elif db_game.away_score > db_game.home_score:
-                away_team.wins += 1
-                home_team.losses += 1
-            else:
-                home_team.ties += 1
-                away_team.ties += 1
     
+    # Going final, corrections to a final game and un-finalizing all move the standings
+    new_result = standings.game_result(db_game)
+    standings.apply_result_change(db, db_game.league_id, old_result, new_result)
+    revisions.bump_league(db, db_game.league_id)
     db.commit()
     
-    # Broadcast update to WebSocket clients
     game = db.query(models.Game).options(
         joinedload(models.Game.home_team),
         joinedload(models.Game.away_team)
     ).filter(models.Game.id == game_id).first()
-    
-    # Calculate live game time if timer is running before broadcasting
-    calculate_live_game_time(game)
-    
-    await manager.broadcast(f"game:{db_game.share_code}", {
-        "type": "game_update",
-        "data": {
-            "id": game.id,
-            "home_score": game.home_score,
-            "away_score": game.away_score,
-            "status": game.status,
-            "quarter": game.quarter,
-            "game_time": game.game_time,
-            "down": game.down,
-            "distance": game.distance,
-            "ball_on": game.ball_on,
-            "possession": game.possession,
-            "home_timeouts": game.home_timeouts,
-            "away_timeouts": game.away_timeouts,
-            "play_clock": game.play_clock,
-            "display_state": game.display_state,
-            "timer_running": game.timer_running,
-            "timer_started_at": game.timer_started_at.isoformat() if game.timer_started_at else None,
-            "timer_started_seconds": game.timer_started_seconds,
-            "home_team": {"id": game.home_team.id, "name": game.home_team.name, "abbreviation": game.home_team.abbreviation, "color": game.home_team.color, "color2": game.home_team.color2, "logo_url": game.home_team.logo_url},
-            "away_team": {"id": game.away_team.id, "name": game.away_team.name, "abbreviation": game.away_team.abbreviation, "color": game.away_team.color, "color2": game.away_team.color2, "logo_url": game.away_team.logo_url}
-        }
-    })
-    
+    return game, db_league.owner_id, old_result != new_result
+
+
+CLOCK_FIELDS = ("id", "share_code", "status", "timer_running", "timer_started_at", "timer_started_seconds")
+
+
+def sync_game_clock(data: dict):
+    """Start/stop the server-side clock of a game to match its timer fields"""
+    running = data["status"] == "live" and data["timer_running"]
+    game_clocks.sync(data["id"], data["share_code"], running, data["timer_started_at"], data["timer_started_seconds"])
+
+
+async def expire_game_clock(game_id: str, started_at: datetime):
+    """Stop a game's timer at 0:00 when its server-side clock runs out"""
+    changes = {"game_time": "0:00", "timer_running": False}
+    live = live_games.get(game_id)
+    if live:
+        # Ignore a clock that was stopped or restarted while it was expiring
+        if not live.data["timer_running"] or not live.data["timer_started_at"] or \
+                live.data["timer_started_at"].replace(tzinfo=None) != started_at:
+            return
+        live.apply(changes)
+        await manager.broadcast_game_state(f"game:{live.share_code}", live_game_broadcast_data(live_game_response(live)))
+        return
+    async with async_session() as db:
+        game = await db.run_sync(commit_expired_timer, game_id, started_at, changes)
+    if game:
+        await manager.broadcast_game_state(f"game:{game.share_code}", game_broadcast_data(game))
+
+
+def commit_expired_timer(db: Session, game_id: str, started_at: datetime, changes: dict) -> Optional[models.Game]:
+    game = db.query(models.Game).options(
+        joinedload(models.Game.home_team),
+        joinedload(models.Game.away_team)
+    ).filter(models.Game.id == game_id).first()
+    if not game or not game.timer_running or not game.timer_started_at or \
+            game.timer_started_at.replace(tzinfo=None) != started_at:
+        return None
+    for key, value in changes.items():
+        setattr(game, key, value)
+    revisions.bump_league(db, game.league_id)
+    db.commit()
     return game
 
 
+async def recover_game_clocks():
+    """Restart the clocks of games whose timer was running when the server went down"""
+    db = SessionLocal()
+    try:
+        games = db.query(models.Game).filter(
+            models.Game.status == "live", models.Game.timer_running == True
+        ).all()
+        for game in games:
+            live = live_games.get(game.id)
+            sync_game_clock(live.data if live else {field: getattr(game, field) for field in CLOCK_FIELDS})
+    finally:
+        db.close()
+
+
 @app.delete("/api/games/{game_id}", status_code=204)
 async def delete_game(
     game_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    league_id, tags, standings_changed = await db.run_sync(remove_game, game_id, current_user)
+    forget_deleted_games([game_id])
+    await manager.invalidate(tags)
+    if standings_changed:
+        playoff_pictures.schedule(league_id)
+    return None
+
+
+def forget_deleted_games(game_ids: List[str]):
+    """Stop serving deleted games from the live store and stop their clocks"""
+    for game_id in game_ids:
+        live_games.discard(game_id)
+        game_clocks.stop(game_id)
+
+
+def remove_game(db: Session, game_id: str, current_user: Optional[models.User]) -> Tuple[str, List[str], bool]:
+    """Delete a game; returns its league, the cache tags of the responses it appeared in and
+    whether the standings moved"""
     db_game = db.query(models.Game).filter(models.Game.id == game_id).first()
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
     # Check user owns the league this game belongs to
     check_league_ownership(db, db_game.league_id, current_user)
+    standings_changed = standings.game_result(db_game) is not None
+    standings.remove_game_results(db, [db_game])
+    league_id = db_game.league_id
+    tags = [f"game:{db_game.share_code}", f"league:{league_id}"]
     db.delete(db_game)
+    revisions.bump_league(db, league_id)
     db.commit()
-    return None
+    return league_id, tags, standings_changed
 
 
 # ============ Heartbeat Endpoints ============
 @app.post("/api/games/{game_id}/heartbeat")
-async def game_heartbeat(game_id: str, db: Session = Depends(get_db)):
+async def game_heartbeat(game_id: str, db: AsyncSession = Depends(get_async_db)):
     """Client sends heartbeat to indicate controller is still active"""
-    db_game = db.query(models.Game).filter(models.Game.id == game_id).first()
-    if not db_game:
-        raise HTTPException(status_code=404, detail="Game not found")
+    # Only the first beat of a controller has to prove the game exists
+    if ("game", game_id) not in heartbeats.deadlines:
+        if not await db.run_sync(row_exists, models.Game, game_id):
+            raise HTTPException(status_code=404, detail="Game not found")
     
-    game_heartbeats[game_id] = datetime.utcnow()
+    # Stored on the backplane by the supervisor's batched persist
+    heartbeats.beat(("game", game_id))
     return {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
 
 
 @app.get("/api/games/{game_id}/heartbeat/check")
-async def check_heartbeat(game_id: str, db: Session = Depends(get_db)):
-    """Check if controller is still active (for display clients)"""
-    db_game = db.query(models.Game).options(
-        joinedload(models.Game.home_team),
-        joinedload(models.Game.away_team)
-    ).filter(models.Game.id == game_id).first()
-    if not db_game:
+async def check_heartbeat(game_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Check if controller is still active (the heartbeat supervisor handles tech difficulties)"""
+    last_beat = heartbeats.last_beat(("game", game_id))
+    if last_beat is not None:
+        # Supervised by this worker: the in-memory deadline is the freshest answer
+        elapsed = time.time() - last_beat
+        return {
+            "active": elapsed < HEARTBEAT_TIMEOUT_SECONDS,
+            "last_heartbeat": datetime.utcfromtimestamp(last_beat).isoformat(),
+            "elapsed_seconds": elapsed
+        }
+    if not live_games.get(game_id) and not await db.run_sync(row_exists, models.Game, game_id):
         raise HTTPException(status_code=404, detail="Game not found")
     
-    last_heartbeat = game_heartbeats.get(game_id)
+    last_heartbeat = await manager.backplane.get_heartbeat(game_id)
     
     if last_heartbeat is None:
         # No heartbeat ever received - controller not active
         return {"active": False, "last_heartbeat": None}
     
     elapsed = (datetime.utcnow() - last_heartbeat).total_seconds()
-    is_active = elapsed < HEARTBEAT_TIMEOUT_SECONDS
-    
-    # If controller went inactive and game is live, trigger tech difficulties
-    if not is_active and db_game.status == "live":
-        # Update display_state to show technical difficulties
-        try:
-            current_state = json.loads(db_game.display_state) if db_game.display_state else {}
-        except:
-            current_state = {}
-        current_state["gameStatus"] = "technical"
-        db_game.display_state = json.dumps(current_state)
-        db.commit()
-        
-        # Broadcast the tech difficulties status
-        await manager.broadcast(f"game:{db_game.share_code}", {
-            "type": "game_update",
-            "data": {
-                "id": db_game.id,
-                "home_score": db_game.home_score,
-                "away_score": db_game.away_score,
-                "status": db_game.status,
-                "quarter": db_game.quarter,
-                "game_time": db_game.game_time,
-                "down": db_game.down,
-                "distance": db_game.distance,
-                "ball_on": db_game.ball_on,
-                "possession": db_game.possession,
-                "home_timeouts": db_game.home_timeouts,
-                "away_timeouts": db_game.away_timeouts,
-                "play_clock": db_game.play_clock,
-                "display_state": db_game.display_state,
-                "home_team": {"id": db_game.home_team.id, "name": db_game.home_team.name, "abbreviation": db_game.home_team.abbreviation, "color": db_game.home_team.color, "color2": db_game.home_team.color2, "logo_url": db_game.home_team.logo_url},
-                "away_team": {"id": db_game.away_team.id, "name": db_game.away_team.name, "abbreviation": db_game.away_team.abbreviation, "color": db_game.away_team.color, "color2": db_game.away_team.color2, "logo_url": db_game.away_team.logo_url}
-            }
-        })
-    
     return {
-        "active": is_active, 
-        "last_heartbeat": last_heartbeat.isoformat() if last_heartbeat else None,
+        "active": elapsed < HEARTBEAT_TIMEOUT_SECONDS, 
+        "last_heartbeat": last_heartbeat.isoformat(),
         "elapsed_seconds": elapsed
     }
 
@@ -1020,18 +1481,123 @@ async def check_heartbeat(game_id: str, db: Session = Depends(get_db)):
 @app.delete("/api/games/{game_id}/heartbeat")
 async def stop_heartbeat(game_id: str):
     """Stop heartbeat tracking when controller disconnects gracefully"""
-    if game_id in game_heartbeats:
-        del game_heartbeats[game_id]
+    heartbeats.forget(("game", game_id))
+    await manager.backplane.clear_heartbeat(game_id)
     return {"status": "ok"}
 
 
+def row_exists(db: Session, model, row_id: str) -> bool:
+    return db.query(model.id).filter(model.id == row_id).first() is not None
+
+
+def heartbeat_epoch(beat_at: datetime) -> float:
+    """A naive UTC heartbeat timestamp as epoch seconds (the supervisor's clock)"""
+    return time.time() - (datetime.utcnow() - beat_at).total_seconds()
+
+
+def set_display_status(display_state: Optional[str], game_status: str) -> str:
+    try:
+        current_state = json.loads(display_state) if display_state else {}
+    except:
+        current_state = {}
+    current_state["gameStatus"] = game_status
+    return json.dumps(current_state)
+
+
+async def controller_timed_out(key) -> Optional[float]:
+    """Heartbeat supervisor callback: put a live game whose controller went quiet into tech difficulties.
+
+    Returns the newer heartbeat time instead if the controller beat on another worker.
+    """
+    kind, game_id = key
+    if kind == "game":
+        last_heartbeat = await manager.backplane.get_heartbeat(game_id)
+        if last_heartbeat and (datetime.utcnow() - last_heartbeat).total_seconds() < heartbeats.timeout:
+            return heartbeat_epoch(last_heartbeat)
+        live = live_games.get(game_id)
+        if live:
+            live.apply({"display_state": set_display_status(live.data["display_state"], "technical")})
+            await manager.broadcast_game_state(f"game:{live.share_code}", live_game_broadcast_data(live_game_response(live)))
+            return None
+    
+    async with async_session() as db:
+        newer, share_code, data = await db.run_sync(commit_controller_lost, kind, game_id)
+    if data:
+        await manager.broadcast_game_state(f"game:{share_code}", data)
+    return newer
+
+
+def commit_controller_lost(db: Session, kind: str, game_id: str) -> Tuple[Optional[float], Optional[str], Optional[dict]]:
+    """Database half of controller_timed_out: (newer heartbeat, share code, game_state to broadcast)"""
+    if kind == "game":
+        db_game = db.query(models.Game).options(
+            joinedload(models.Game.home_team),
+            joinedload(models.Game.away_team)
+        ).filter(models.Game.id == game_id).first()
+        if not db_game or db_game.status != "live":
+            return None, None, None
+        db_game.display_state = set_display_status(db_game.display_state, "technical")
+        revisions.bump_league(db, db_game.league_id)
+        db.commit()
+        return None, db_game.share_code, game_broadcast_data(db_game)
+    
+    db_game = db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).first()
+    if not db_game or db_game.status != "live":
+        return None, None, None
+    if db_game.last_heartbeat and (datetime.utcnow() - db_game.last_heartbeat).total_seconds() < heartbeats.timeout:
+        return heartbeat_epoch(db_game.last_heartbeat), None, None
+    # Controller crashed - set tech difficulties
+    db_game.display_state = set_display_status(db_game.display_state, "tech-difficulties")
+    db.commit()
+    return None, db_game.share_code, standalone_game_to_response(db_game)
+
+
+def write_standalone_heartbeats(db: Session, rows: Dict[str, datetime]):
+    for game_id, beat_at in rows.items():
+        db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).update(
+            {"last_heartbeat": beat_at}, synchronize_session=False
+        )
+    db.commit()
+
+
+async def persist_heartbeats(batch: dict):
+    """Heartbeat supervisor callback: store a batch of heartbeats (backplane / one transaction)"""
+    standalone = {}
+    for (kind, game_id), at in batch.items():
+        beat_at = datetime.utcfromtimestamp(at)
+        if kind == "game":
+            await manager.backplane.record_heartbeat(game_id, beat_at)
+        else:
+            standalone[game_id] = beat_at
+    if standalone:
+        async with async_session() as db:
+            await db.run_sync(write_standalone_heartbeats, standalone)
+
+
+def recover_heartbeats():
+    """Resume supervising live standalone games whose controllers were beating before a restart"""
+    db = SessionLocal()
+    try:
+        games = db.query(models.StandaloneGame.id, models.StandaloneGame.last_heartbeat).filter(
+            models.StandaloneGame.status == "live", models.StandaloneGame.last_heartbeat != None
+        ).all()
+        for game_id, last_heartbeat in games:
+            heartbeats.beat(("standalone", game_id), heartbeat_epoch(last_heartbeat))
+    finally:
+        db.close()
+
+
 # ============ Bracket Endpoints ============
 @app.post("/api/brackets", response_model=schemas.Bracket)
 async def create_bracket(
     bracket: schemas.BracketCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    return await db.run_sync(build_bracket, bracket, current_user)
+
+
+def build_bracket(db: Session, bracket: schemas.BracketCreate, current_user: Optional[models.User]) -> schemas.Bracket:
     # Check user owns the league this bracket belongs to
     check_league_ownership(db, bracket.league_id, current_user)
     # Validate number of teams is even and at least 2
@@ -1039,14 +1605,6 @@ async def create_bracket(
     if num_teams < 2 or num_teams % 2 != 0:
         raise HTTPException(status_code=400, detail="Number of teams must be an even number (2 or more)")
     
-    # Calculate bracket size (next power of 2 >= num_teams)
-    bracket_size = 1
-    while bracket_size < num_teams:
-        bracket_size *= 2
-    
-    # Number of byes needed
-    num_byes = bracket_size - num_teams
-    
     db_bracket = models.Bracket(
         league_id=bracket.league_id,
         name=bracket.name,
@@ -1057,108 +1615,28 @@ async def create_bracket(
         is_playoff=bracket.is_playoff
     )
     db.add(db_bracket)
-    db.commit()
-    db.refresh(db_bracket)
+    db.flush()
     
-    # Create bracket matches based on bracket_size (power of 2)
-    num_rounds = int(math.log2(bracket_size))
-    match_number = 0
-    matches_by_round = {}
-    
-    for round_num in range(num_rounds, 0, -1):
-        matches_in_round = 2 ** (round_num - 1)
-        matches_by_round[round_num] = []
-        for i in range(matches_in_round):
-            match = models.BracketMatch(
-                bracket_id=db_bracket.id,
-                round_number=num_rounds - round_num + 1,
-                match_number=match_number
-            )
-            db.add(match)
-            db.flush()
-            matches_by_round[round_num].append(match)
-            match_number += 1
-    
-    # Link matches to next round
-    for round_num in range(num_rounds, 1, -1):
-        current_matches = matches_by_round[round_num]
-        next_matches = matches_by_round[round_num - 1]
-        for i, match in enumerate(current_matches):
-            match.next_match_id = next_matches[i // 2].id
-    
-    # Seed teams into first round with byes
-    # team_ids format: list of team IDs or None for byes
-    # If team_ids not provided or empty, leave slots empty for manual assignment
-    first_round_matches = matches_by_round[num_rounds]
-    team_ids = bracket.team_ids if bracket.team_ids else []
-    
-    # Create seeding with byes distributed
-    # Byes go to top seeds (first positions)
-    seeded_slots = []
-    for i in range(bracket_size):
-        if i < len(team_ids):
-            seeded_slots.append(team_ids[i])
-        else:
-            seeded_slots.append(None)  # Empty slot or bye
-    
-    # Assign teams to first round matches
-    for i, match in enumerate(first_round_matches):
-        slot1 = seeded_slots[i * 2] if i * 2 < len(seeded_slots) else None
-        slot2 = seeded_slots[i * 2 + 1] if i * 2 + 1 < len(seeded_slots) else None
-        
-        # Handle "BYE" and "TBD" strings as None
-        if slot1 in ("BYE", "TBD", ""):
-            slot1 = None
-        if slot2 in ("BYE", "TBD", ""):
-            slot2 = None
-            
-        match.team1_id = slot1
-        match.team2_id = slot2
-        
-        # If one team has a bye (opponent is None), auto-advance them
-        if slot1 and not slot2:
-            match.winner_id = slot1
-            match.team1_score = 0
-            match.team2_score = 0
-            # Advance to next match
-            if match.next_match_id:
-                next_match = db.query(models.BracketMatch).filter(
-                    models.BracketMatch.id == match.next_match_id
-                ).first()
-                if next_match:
-                    # Determine if this is team1 or team2 in next match
-                    current_match_index = first_round_matches.index(match)
-                    if current_match_index % 2 == 0:
-                        next_match.team1_id = slot1
-                    else:
-                        next_match.team2_id = slot1
-        elif slot2 and not slot1:
-            match.winner_id = slot2
-            match.team1_score = 0
-            match.team2_score = 0
-            # Advance to next match
-            if match.next_match_id:
-                next_match = db.query(models.BracketMatch).filter(
-                    models.BracketMatch.id == match.next_match_id
-                ).first()
-                if next_match:
-                    current_match_index = first_round_matches.index(match)
-                    if current_match_index % 2 == 0:
-                        next_match.team1_id = slot2
-                    else:
-                        next_match.team2_id = slot2
+    # Lay out every match in memory and write them in one insert (see brackets.py).
+    # team_ids: team IDs in seed order, "BYE"/"TBD" for empty slots; teams with a bye advance.
+    brackets.insert_matches(db, brackets.build_matches(db_bracket.id, num_teams, bracket.team_ids or []))
     
+    revisions.bump_league(db, db_bracket.league_id)
     db.commit()
     
-    return db.query(models.Bracket).options(
+    return schemas.Bracket.model_validate(db.query(models.Bracket).options(
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team1),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team2),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.winner)
-    ).filter(models.Bracket.id == db_bracket.id).first()
+    ).filter(models.Bracket.id == db_bracket.id).first())
 
 
 @app.get("/api/leagues/{league_id}/brackets", response_model=List[schemas.Bracket])
-def get_league_brackets(league_id: str, db: Session = Depends(get_db)):
+def get_league_brackets(league_id: str, response: Response, db: Session = Depends(get_db),
+                        if_none_match: Optional[str] = Header(None)):
+    not_modified = league_not_modified(db, league_id, if_none_match, response)
+    if not_modified:
+        return not_modified
     return db.query(models.Bracket).options(
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team1),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team2),
@@ -1179,24 +1657,42 @@ def get_bracket(bracket_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/api/brackets/share/{share_code}", response_model=schemas.Bracket)
-def get_bracket_by_share_code(share_code: str, db: Session = Depends(get_db)):
+def get_bracket_by_share_code(share_code: str, db: Session = Depends(get_db), if_none_match: Optional[str] = Header(None)):
+    return cached_share_response(f"bracket/{share_code.upper()}", if_none_match, bracket_share_body, db, share_code.upper())
+
+
+def bracket_share_body(db: Session, share_code: str) -> Tuple[bytes, Optional[List[str]]]:
     bracket = db.query(models.Bracket).options(
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team1),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team2),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.winner)
-    ).filter(models.Bracket.share_code == share_code.upper()).first()
+    ).filter(models.Bracket.share_code == share_code).first()
     if not bracket:
         raise HTTPException(status_code=404, detail="Bracket not found")
-    return bracket
+    body = schemas.Bracket.model_validate(bracket).model_dump_json().encode()
+    return body, [f"bracket:{share_code}", f"league:{bracket.league_id}"]
 
 
 @app.put("/api/brackets/matches/{match_id}", response_model=schemas.BracketMatch)
 async def update_bracket_match(
     match_id: str, 
     match_update: schemas.BracketMatchUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    match, bracket = await db.run_sync(commit_bracket_match_update, match_id, match_update, current_user)
+    
+    # Broadcast update
+    await manager.broadcast(f"bracket:{bracket.share_code}", {
+        "type": "bracket_update",
+        "data": {"match_id": match_id, "bracket_id": bracket.id}
+    })
+    
+    return match
+
+
+def commit_bracket_match_update(db: Session, match_id: str, match_update: schemas.BracketMatchUpdate,
+                                current_user: Optional[models.User]):
     db_match = db.query(models.BracketMatch).filter(models.BracketMatch.id == match_id).first()
     if not db_match:
         raise HTTPException(status_code=404, detail="Match not found")
@@ -1223,6 +1719,7 @@ async def update_bracket_match(
             else:
                 next_match.team2_id = match_update.winner_id
     
+    revisions.bump_league(db, bracket.league_id if bracket else None)
     db.commit()
     
     # Get bracket for broadcasting
@@ -1233,14 +1730,7 @@ async def update_bracket_match(
         joinedload(models.BracketMatch.team2),
         joinedload(models.BracketMatch.winner)
     ).filter(models.BracketMatch.id == match_id).first()
-    
-    # Broadcast update
-    await manager.broadcast(f"bracket:{bracket.share_code}", {
-        "type": "bracket_update",
-        "data": {"match_id": match_id, "bracket_id": bracket.id}
-    })
-    
-    return match
+    return schemas.BracketMatch.model_validate(match), bracket
 
 
 @app.get("/api/games/{game_id}/bracket-match")
@@ -1273,9 +1763,16 @@ def get_bracket_match_by_game(game_id: str, db: Session = Depends(get_db)):
 async def update_bracket(
     bracket_id: str, 
     bracket_update: schemas.BracketUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    bracket = await db.run_sync(commit_bracket_update, bracket_id, bracket_update, current_user)
+    await manager.invalidate([f"bracket:{bracket.share_code}"])
+    return bracket
+
+
+def commit_bracket_update(db: Session, bracket_id: str, bracket_update: schemas.BracketUpdate,
+                          current_user: Optional[models.User]) -> schemas.Bracket:
     db_bracket = db.query(models.Bracket).filter(models.Bracket.id == bracket_id).first()
     if not db_bracket:
         raise HTTPException(status_code=404, detail="Bracket not found")
@@ -1292,21 +1789,29 @@ async def update_bracket(
                 value = json.dumps(value)
         setattr(db_bracket, key, value)
     
+    revisions.bump_league(db, db_bracket.league_id)
     db.commit()
     
-    return db.query(models.Bracket).options(
+    return schemas.Bracket.model_validate(db.query(models.Bracket).options(
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team1),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.team2),
         joinedload(models.Bracket.matches).joinedload(models.BracketMatch.winner)
-    ).filter(models.Bracket.id == bracket_id).first()
+    ).filter(models.Bracket.id == bracket_id).first())
 
 
 @app.delete("/api/brackets/{bracket_id}", status_code=204)
 async def delete_bracket(
     bracket_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    share_code = await db.run_sync(remove_bracket, bracket_id, current_user)
+    await manager.invalidate([f"bracket:{share_code}"])
+    return None
+
+
+def remove_bracket(db: Session, bracket_id: str, current_user: Optional[models.User]) -> str:
+    """Delete a bracket with its matches; returns its share code"""
     db_bracket = db.query(models.Bracket).filter(models.Bracket.id == bracket_id).first()
     if not db_bracket:
         raise HTTPException(status_code=404, detail="Bracket not found")
@@ -1314,18 +1819,30 @@ async def delete_bracket(
     check_league_ownership(db, db_bracket.league_id, current_user)
     # Delete bracket matches first
     db.query(models.BracketMatch).filter(models.BracketMatch.bracket_id == bracket_id).delete()
+    share_code = db_bracket.share_code
     db.delete(db_bracket)
+    revisions.bump_league(db, db_bracket.league_id)
     db.commit()
-    return None
+    return share_code
 
 
 @app.post("/api/brackets/{bracket_id}/finals-logo")
 async def upload_bracket_finals_logo(
     bracket_id: str, 
     file: UploadFile = File(...), 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    content = await file.read()
+    logo_url, share_code = await db.run_sync(save_bracket_finals_logo, bracket_id, file, content, current_user)
+    await manager.invalidate([f"bracket:{share_code}"])
+    
+    return {"finals_logo_url": logo_url}
+
+
+def save_bracket_finals_logo(db: Session, bracket_id: str, file: UploadFile, content: bytes,
+                             current_user: Optional[models.User]) -> Tuple[str, str]:
+    """Store a bracket's finals logo; returns its URL and the bracket's share code"""
     db_bracket = db.query(models.Bracket).filter(models.Bracket.id == bracket_id).first()
     if not db_bracket:
         raise HTTPException(status_code=404, detail="Bracket not found")
@@ -1351,41 +1868,51 @@ async def upload_bracket_finals_logo(
     
     # Save new file
     with open(filepath, "wb") as f:
-        content = await file.read()
         f.write(content)
     
     # Update bracket with logo URL
     logo_url = f"/uploads/{filename}"
     db_bracket.finals_logo_url = logo_url
+    revisions.bump_league(db, db_bracket.league_id)
     db.commit()
     db.refresh(db_bracket)
     
     print(f"Saved finals_logo_url: {db_bracket.finals_logo_url}")
     
-    return {"finals_logo_url": logo_url}
+    return logo_url, db_bracket.share_code
 
 
 @app.delete("/api/brackets/{bracket_id}/finals-logo", status_code=204)
 async def delete_bracket_finals_logo(
     bracket_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    share_code = await db.run_sync(remove_bracket_finals_logo, bracket_id, current_user)
+    if share_code:
+        await manager.invalidate([f"bracket:{share_code}"])
+    
+    return None
+
+
+def remove_bracket_finals_logo(db: Session, bracket_id: str, current_user: Optional[models.User]) -> Optional[str]:
+    """Delete a bracket's finals logo; returns the bracket's share code, or None if it had no logo"""
     db_bracket = db.query(models.Bracket).filter(models.Bracket.id == bracket_id).first()
     if not db_bracket:
         raise HTTPException(status_code=404, detail="Bracket not found")
     # Check user owns the league this bracket belongs to
     check_league_ownership(db, db_bracket.league_id, current_user)
     
-    if db_bracket.finals_logo_url:
-        filename = db_bracket.finals_logo_url.split("/")[-1]
-        filepath = os.path.join(UPLOAD_DIR, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        db_bracket.finals_logo_url = None
-        db.commit()
-    
-    return None
+    if not db_bracket.finals_logo_url:
+        return None
+    filename = db_bracket.finals_logo_url.split("/")[-1]
+    filepath = os.path.join(UPLOAD_DIR, filename)
+    if os.path.exists(filepath):
+        os.remove(filepath)
+    db_bracket.finals_logo_url = None
+    revisions.bump_league(db, db_bracket.league_id)
+    db.commit()
+    return db_bracket.share_code
 
 
 # ============ Scoreboard Endpoints ============
@@ -1433,31 +1960,52 @@ def get_scoreboard(scoreboard_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/api/scoreboards/share/{share_code}", response_model=schemas.Scoreboard)
-def get_scoreboard_by_share_code(share_code: str, db: Session = Depends(get_db)):
+def get_scoreboard_by_share_code(share_code: str, db: Session = Depends(get_db), if_none_match: Optional[str] = Header(None)):
+    return cached_share_response(f"scoreboard/{share_code.upper()}", if_none_match, scoreboard_share_body, db, share_code.upper())
+
+
+def scoreboard_share_body(db: Session, share_code: str) -> Tuple[bytes, Optional[List[str]]]:
     scoreboard = db.query(models.Scoreboard).options(
         joinedload(models.Scoreboard.players)
-    ).filter(models.Scoreboard.share_code == share_code.upper()).first()
+    ).filter(models.Scoreboard.share_code == share_code).first()
     if not scoreboard:
         raise HTTPException(status_code=404, detail="Scoreboard not found")
-    return scoreboard
+    return schemas.Scoreboard.model_validate(scoreboard).model_dump_json().encode(), [f"scoreboard:{share_code}"]
 
 
 @app.put("/api/scoreboards/{scoreboard_id}", response_model=schemas.Scoreboard)
-def update_scoreboard(scoreboard_id: str, scoreboard: schemas.ScoreboardUpdate, db: Session = Depends(get_db)):
+async def update_scoreboard(scoreboard_id: str, scoreboard: schemas.ScoreboardUpdate, db: AsyncSession = Depends(get_async_db)):
+    db_scoreboard = await db.run_sync(commit_scoreboard_update, scoreboard_id, scoreboard)
+    await manager.invalidate([f"scoreboard:{db_scoreboard.share_code}"])
+    return db_scoreboard
+
+
+def commit_scoreboard_update(db: Session, scoreboard_id: str, scoreboard: schemas.ScoreboardUpdate) -> schemas.Scoreboard:
     db_scoreboard = db.query(models.Scoreboard).filter(models.Scoreboard.id == scoreboard_id).first()
     if not db_scoreboard:
         raise HTTPException(status_code=404, detail="Scoreboard not found")
     for key, value in scoreboard.model_dump(exclude_unset=True).items():
         setattr(db_scoreboard, key, value)
     db.commit()
-    db.refresh(db_scoreboard)
-    return db.query(models.Scoreboard).options(
+    return schemas.Scoreboard.model_validate(db.query(models.Scoreboard).options(
         joinedload(models.Scoreboard.players)
-    ).filter(models.Scoreboard.id == scoreboard_id).first()
+    ).filter(models.Scoreboard.id == scoreboard_id).first())
 
 
 @app.post("/api/scoreboards/{scoreboard_id}/players", response_model=schemas.ScoreboardPlayer)
-async def add_scoreboard_player(scoreboard_id: str, player: schemas.ScoreboardPlayerCreate, db: Session = Depends(get_db)):
+async def add_scoreboard_player(scoreboard_id: str, player: schemas.ScoreboardPlayerCreate, db: AsyncSession = Depends(get_async_db)):
+    db_player, share_code = await db.run_sync(insert_scoreboard_player, scoreboard_id, player)
+    
+    # Broadcast update
+    await manager.broadcast(f"scoreboard:{share_code}", {
+        "type": "player_added",
+        "data": {"id": db_player.id, "name": db_player.name, "score": db_player.score, "color": db_player.color}
+    })
+    
+    return db_player
+
+
+def insert_scoreboard_player(db: Session, scoreboard_id: str, player: schemas.ScoreboardPlayerCreate):
     scoreboard = db.query(models.Scoreboard).filter(models.Scoreboard.id == scoreboard_id).first()
     if not scoreboard:
         raise HTTPException(status_code=404, detail="Scoreboard not found")
@@ -1469,18 +2017,23 @@ async def add_scoreboard_player(scoreboard_id: str, player: schemas.ScoreboardPl
     db.add(db_player)
     db.commit()
     db.refresh(db_player)
+    return schemas.ScoreboardPlayer.model_validate(db_player), scoreboard.share_code
+
+
+@app.put("/api/scoreboards/players/{player_id}", response_model=schemas.ScoreboardPlayer)
+async def update_scoreboard_player(player_id: str, player: schemas.ScoreboardPlayerUpdate, db: AsyncSession = Depends(get_async_db)):
+    db_player, share_code = await db.run_sync(commit_scoreboard_player_update, player_id, player)
     
     # Broadcast update
-    await manager.broadcast(f"scoreboard:{scoreboard.share_code}", {
-        "type": "player_added",
+    await manager.broadcast(f"scoreboard:{share_code}", {
+        "type": "player_updated",
         "data": {"id": db_player.id, "name": db_player.name, "score": db_player.score, "color": db_player.color}
     })
     
     return db_player
 
 
-@app.put("/api/scoreboards/players/{player_id}", response_model=schemas.ScoreboardPlayer)
-async def update_scoreboard_player(player_id: str, player: schemas.ScoreboardPlayerUpdate, db: Session = Depends(get_db)):
+def commit_scoreboard_player_update(db: Session, player_id: str, player: schemas.ScoreboardPlayerUpdate):
     db_player = db.query(models.ScoreboardPlayer).filter(models.ScoreboardPlayer.id == player_id).first()
     if not db_player:
         raise HTTPException(status_code=404, detail="Player not found")
@@ -1492,18 +2045,24 @@ async def update_scoreboard_player(player_id: str, player: schemas.ScoreboardPla
     
     # Get scoreboard for share code
     scoreboard = db.query(models.Scoreboard).filter(models.Scoreboard.id == db_player.scoreboard_id).first()
+    return schemas.ScoreboardPlayer.model_validate(db_player), scoreboard.share_code
+
+
+@app.delete("/api/scoreboards/players/{player_id}", status_code=204)
+async def delete_scoreboard_player(player_id: str, db: AsyncSession = Depends(get_async_db)):
+    share_code = await db.run_sync(remove_scoreboard_player, player_id)
     
     # Broadcast update
-    await manager.broadcast(f"scoreboard:{scoreboard.share_code}", {
-        "type": "player_updated",
-        "data": {"id": db_player.id, "name": db_player.name, "score": db_player.score, "color": db_player.color}
-    })
+    if share_code:
+        await manager.broadcast(f"scoreboard:{share_code}", {
+            "type": "player_removed",
+            "data": {"id": player_id}
+        })
     
-    return db_player
+    return None
 
 
-@app.delete("/api/scoreboards/players/{player_id}", status_code=204)
-async def delete_scoreboard_player(player_id: str, db: Session = Depends(get_db)):
+def remove_scoreboard_player(db: Session, player_id: str) -> Optional[str]:
     db_player = db.query(models.ScoreboardPlayer).filter(models.ScoreboardPlayer.id == player_id).first()
     if not db_player:
         raise HTTPException(status_code=404, detail="Player not found")
@@ -1512,35 +2071,44 @@ async def delete_scoreboard_player(player_id: str, db: Session = Depends(get_db)
     
     db.delete(db_player)
     db.commit()
-    
-    # Broadcast update
-    if scoreboard:
-        await manager.broadcast(f"scoreboard:{scoreboard.share_code}", {
-            "type": "player_removed",
-            "data": {"id": player_id}
-        })
-    
-    return None
+    return scoreboard.share_code if scoreboard else None
 
 
 @app.delete("/api/scoreboards/{scoreboard_id}", status_code=204)
-def delete_scoreboard(scoreboard_id: str, db: Session = Depends(get_db)):
+async def delete_scoreboard(scoreboard_id: str, db: AsyncSession = Depends(get_async_db)):
+    share_code = await db.run_sync(remove_scoreboard, scoreboard_id)
+    await manager.invalidate([f"scoreboard:{share_code}"])
+    return None
+
+
+def remove_scoreboard(db: Session, scoreboard_id: str) -> str:
+    """Delete a scoreboard with its players; returns its share code"""
     db_scoreboard = db.query(models.Scoreboard).filter(models.Scoreboard.id == scoreboard_id).first()
     if not db_scoreboard:
         raise HTTPException(status_code=404, detail="Scoreboard not found")
     # Delete players first
     db.query(models.ScoreboardPlayer).filter(models.ScoreboardPlayer.scoreboard_id == scoreboard_id).delete()
+    share_code = db_scoreboard.share_code
     db.delete(db_scoreboard)
     db.commit()
-    return None
+    return share_code
 
 
 @app.post("/api/scoreboards/{scoreboard_id}/logo")
 async def upload_scoreboard_logo(
     scoreboard_id: str, 
     file: UploadFile = File(...), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
+    content = await file.read()
+    logo_url, share_code = await db.run_sync(save_scoreboard_logo, scoreboard_id, file, content)
+    await manager.invalidate([f"scoreboard:{share_code}"])
+    
+    return {"logo_url": logo_url}
+
+
+def save_scoreboard_logo(db: Session, scoreboard_id: str, file: UploadFile, content: bytes) -> Tuple[str, str]:
+    """Store a scoreboard's logo; returns its URL and the scoreboard's share code"""
     db_scoreboard = db.query(models.Scoreboard).filter(models.Scoreboard.id == scoreboard_id).first()
     if not db_scoreboard:
         raise HTTPException(status_code=404, detail="Scoreboard not found")
@@ -1564,35 +2132,42 @@ async def upload_scoreboard_logo(
     
     # Save new file
     with open(filepath, "wb") as f:
-        content = await file.read()
         f.write(content)
     
     # Update scoreboard with logo URL
     logo_url = f"/uploads/{filename}"
     db_scoreboard.logo_url = logo_url
     db.commit()
-    
-    return {"logo_url": logo_url}
+    return logo_url, db_scoreboard.share_code
 
 
 @app.delete("/api/scoreboards/{scoreboard_id}/logo", status_code=204)
 async def delete_scoreboard_logo(
     scoreboard_id: str, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
+    share_code = await db.run_sync(remove_scoreboard_logo, scoreboard_id)
+    if share_code:
+        await manager.invalidate([f"scoreboard:{share_code}"])
+    
+    return None
+
+
+def remove_scoreboard_logo(db: Session, scoreboard_id: str) -> Optional[str]:
+    """Delete a scoreboard's logo; returns its share code, or None if it had no logo"""
     db_scoreboard = db.query(models.Scoreboard).filter(models.Scoreboard.id == scoreboard_id).first()
     if not db_scoreboard:
         raise HTTPException(status_code=404, detail="Scoreboard not found")
     
-    if db_scoreboard.logo_url:
-        filename = db_scoreboard.logo_url.split("/")[-1]
-        filepath = os.path.join(UPLOAD_DIR, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        db_scoreboard.logo_url = None
-        db.commit()
-    
-    return None
+    if not db_scoreboard.logo_url:
+        return None
+    filename = db_scoreboard.logo_url.split("/")[-1]
+    filepath = os.path.join(UPLOAD_DIR, filename)
+    if os.path.exists(filepath):
+        os.remove(filepath)
+    db_scoreboard.logo_url = None
+    db.commit()
+    return db_scoreboard.share_code
 
 
 # ============ Standalone Games ============
@@ -1648,7 +2223,7 @@ def standalone_game_to_response(game: models.StandaloneGame) -> dict:
 
 
 @app.post("/api/standalone-games", response_model=schemas.StandaloneGame)
-async def create_standalone_game(
+def create_standalone_game(
     game: schemas.StandaloneGameCreate,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
@@ -1678,7 +2253,7 @@ async def create_standalone_game(
 
 
 @app.get("/api/standalone-games", response_model=List[schemas.StandaloneGame])
-async def get_standalone_games(
+def get_standalone_games(
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
@@ -1692,13 +2267,19 @@ async def get_standalone_games(
 
 
 @app.get("/api/standalone-games/share/{share_code}", response_model=schemas.StandaloneGame)
-def get_standalone_game_by_share_code(share_code: str, db: Session = Depends(get_db)):
+def get_standalone_game_by_share_code(share_code: str, db: Session = Depends(get_db), if_none_match: Optional[str] = Header(None)):
+    return cached_share_response(f"standalone/{share_code.upper()}", if_none_match, standalone_share_body, db, share_code.upper())
+
+
+def standalone_share_body(db: Session, share_code: str) -> Tuple[bytes, Optional[List[str]]]:
     db_game = db.query(models.StandaloneGame).filter(
-        models.StandaloneGame.share_code == share_code.upper()
+        models.StandaloneGame.share_code == share_code
     ).first()
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
-    return standalone_game_to_response(db_game)
+    body = schemas.StandaloneGame.model_validate(standalone_game_to_response(db_game)).model_dump_json().encode()
+    # Standalone games broadcast to the same game room as league games
+    return body, [f"game:{share_code}"]
 
 
 @app.get("/api/standalone-games/{game_id}", response_model=schemas.StandaloneGame)
@@ -1713,9 +2294,23 @@ def get_standalone_game(game_id: str, db: Session = Depends(get_db)):
 async def update_standalone_game(
     game_id: str,
     game: schemas.StandaloneGameUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    return await apply_standalone_game_update(db, game_id, game.model_dump(exclude_unset=True), current_user)
+
+
+async def apply_standalone_game_update(db: AsyncSession, game_id: str, updates: dict, current_user: Optional[models.User]):
+    """Apply a validated StandaloneGameUpdate (HTTP PUT or controller WebSocket) and broadcast the result"""
+    response_data = await db.run_sync(commit_standalone_game_update, game_id, updates, current_user)
+    
+    # Broadcast update via WebSocket
+    await manager.broadcast_game_state(f"game:{response_data['share_code']}", response_data)
+    
+    return response_data
+
+
+def commit_standalone_game_update(db: Session, game_id: str, updates: dict, current_user: Optional[models.User]) -> dict:
     db_game = db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).first()
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
@@ -1724,55 +2319,34 @@ async def update_standalone_game(
     if db_game.owner_id and current_user and db_game.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to update this game")
     
-    for key, value in game.model_dump(exclude_unset=True).items():
+    for key, value in updates.items():
         setattr(db_game, key, value)
     
     db_game.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(db_game)
-    
-    # Broadcast update via WebSocket
-    response_data = standalone_game_to_response(db_game)
-    await manager.broadcast(f"game:{db_game.share_code}", {
-        "type": "game_update",
-        "data": response_data
-    })
-    
-    return response_data
+    return standalone_game_to_response(db_game)
 
 
 @app.post("/api/standalone-games/{game_id}/heartbeat")
-async def standalone_game_heartbeat(game_id: str, db: Session = Depends(get_db)):
-    db_game = db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).first()
-    if not db_game:
-        raise HTTPException(status_code=404, detail="Game not found")
-    db_game.last_heartbeat = datetime.utcnow()
-    db.commit()
+async def standalone_game_heartbeat(game_id: str, db: AsyncSession = Depends(get_async_db)):
+    if ("standalone", game_id) not in heartbeats.deadlines:
+        if not await db.run_sync(row_exists, models.StandaloneGame, game_id):
+            raise HTTPException(status_code=404, detail="Game not found")
+    # last_heartbeat is written in batches by the heartbeat supervisor
+    heartbeats.beat(("standalone", game_id))
     return {"status": "ok"}
 
 
 @app.get("/api/standalone-games/{game_id}/heartbeat")
-async def check_standalone_game_heartbeat(game_id: str, db: Session = Depends(get_db)):
-    db_game = db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).first()
-    if not db_game:
+async def check_standalone_game_heartbeat(game_id: str, db: AsyncSession = Depends(get_async_db)):
+    rows = await db.run_sync(lambda session: session.query(models.StandaloneGame.last_heartbeat).filter(
+        models.StandaloneGame.id == game_id
+    ).all())
+    if not rows:
         raise HTTPException(status_code=404, detail="Game not found")
-    
-    if db_game.last_heartbeat:
-        time_since = datetime.utcnow() - db_game.last_heartbeat
-        if time_since.total_seconds() > 10 and db_game.status == 'live':
-            # Controller crashed - set tech difficulties
-            display_state = json.loads(db_game.display_state) if db_game.display_state else {}
-            display_state['gameStatus'] = 'tech-difficulties'
-            db_game.display_state = json.dumps(display_state)
-            db.commit()
-            
-            response_data = standalone_game_to_response(db_game)
-            await manager.broadcast(f"game:{db_game.share_code}", {
-                "type": "game_update",
-                "data": response_data
-            })
-    
-    return {"status": "ok", "last_heartbeat": db_game.last_heartbeat}
+    # Tech difficulties on a missed heartbeat are handled by the heartbeat supervisor
+    return {"status": "ok", "last_heartbeat": rows[0].last_heartbeat}
 
 
 @app.post("/api/standalone-games/{game_id}/logo/{team}")
@@ -1780,13 +2354,25 @@ async def upload_standalone_game_logo(
     game_id: str,
     team: str,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
     """Upload logo for home or away team in a standalone game"""
     if team not in ['home', 'away']:
         raise HTTPException(status_code=400, detail="Team must be 'home' or 'away'")
     
+    content = await file.read()
+    logo_url, response_data = await db.run_sync(save_standalone_game_logo, game_id, team, file, content, current_user)
+    
+    # Broadcast update via WebSocket
+    await manager.broadcast_game_state(f"game:{response_data['share_code']}", response_data)
+    
+    return {"logo_url": logo_url}
+
+
+def save_standalone_game_logo(db: Session, game_id: str, team: str, file: UploadFile, content: bytes,
+                              current_user: Optional[models.User]) -> Tuple[str, dict]:
+    """Store a standalone game team's logo; returns its URL and the game_state to broadcast"""
     db_game = db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).first()
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
@@ -1815,7 +2401,6 @@ async def upload_standalone_game_logo(
     
     # Save new file
     with open(filepath, "wb") as f:
-        content = await file.read()
         f.write(content)
     
     # Update game with logo URL
@@ -1828,23 +2413,22 @@ async def upload_standalone_game_logo(
     db_game.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(db_game)
-    
-    # Broadcast update via WebSocket
-    response_data = standalone_game_to_response(db_game)
-    await manager.broadcast(f"game:{db_game.share_code}", {
-        "type": "game_update",
-        "data": response_data
-    })
-    
-    return {"logo_url": logo_url}
+    return logo_url, standalone_game_to_response(db_game)
 
 
 @app.delete("/api/standalone-games/{game_id}", status_code=204)
 async def delete_standalone_game(
     game_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[models.User] = Depends(auth.get_current_user)
 ):
+    share_code = await db.run_sync(remove_standalone_game, game_id, current_user)
+    await manager.invalidate([f"game:{share_code}"])
+    return None
+
+
+def remove_standalone_game(db: Session, game_id: str, current_user: Optional[models.User]) -> str:
+    """Delete a standalone game; returns its share code"""
     db_game = db.query(models.StandaloneGame).filter(models.StandaloneGame.id == game_id).first()
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
@@ -1853,21 +2437,115 @@ async def delete_standalone_game(
     if db_game.owner_id and current_user and db_game.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this game")
     
+    share_code = db_game.share_code
     db.delete(db_game)
     db.commit()
-    return None
+    return share_code
 
 
 # ============ WebSocket Endpoints ============
+def authenticate_game_controller(share_code: str, token: Optional[str]) -> dict:
+    """Resolve the game behind a share code and check the token's user may control it"""
+    db = SessionLocal()
+    try:
+        current_user = auth.get_user_from_token(db, token)
+        db_game = db.query(models.Game).filter(models.Game.share_code == share_code).first()
+        if db_game:
+            check_league_ownership(db, db_game.league_id, current_user)
+            return {"kind": "game", "game_id": db_game.id, "user": current_user}
+        standalone = db.query(models.StandaloneGame).filter(models.StandaloneGame.share_code == share_code).first()
+        if standalone:
+            if standalone.owner_id and (current_user is None or standalone.owner_id != current_user.id):
+                raise HTTPException(status_code=403, detail="Not authorized to update this game")
+            return {"kind": "standalone", "game_id": standalone.id, "user": current_user}
+        raise HTTPException(status_code=404, detail="Game not found")
+    finally:
+        db.close()
+
+
+async def handle_controller_update(controller: dict, data) -> None:
+    """Validate and apply one controller mutation, same rules as the PUT endpoints"""
+    if controller["kind"] == "game":
+        updates = schemas.GameUpdate.model_validate(data).model_dump(exclude_unset=True)
+        apply_update = apply_game_update
+    else:
+        updates = schemas.StandaloneGameUpdate.model_validate(data).model_dump(exclude_unset=True)
+        apply_update = apply_standalone_game_update
+    # Sessions connect lazily, so hot (in-memory) updates never touch the database
+    async with async_session() as db:
+        await apply_update(db, controller["game_id"], updates, controller["user"])
+
+
 @app.websocket("/ws/game/{share_code}")
 async def game_websocket(websocket: WebSocket, share_code: str):
+    """Viewers receive game_update messages. Controllers additionally authenticate with
+    {"type": "auth", "token": ...} and send {"type": "update", "ref": ..., "data": {...}}
+    (same fields as PUT), answered by {"type": "ack", "ref": ..., "seq": ...} or
+    {"type": "nack", "ref": ..., "status": ..., "detail": ...}. An authenticated controller's
+    {"type": "ping"} messages (every ping_interval seconds, given in auth_ok) are its heartbeat."""
     room = f"game:{share_code.upper()}"
     await manager.connect(websocket, room)
+    controller = None
     try:
         while True:
             data = await websocket.receive_text()
-            # Handle any client messages if needed
-    except WebSocketDisconnect:
+            try:
+                message = json.loads(data)
+            except ValueError:
+                continue
+            if not isinstance(message, dict):
+                continue
+            message_type = message.get("type")
+            # Clients that detect a gap in game_update seq numbers ask for a full snapshot
+            if message_type == "resync":
+                manager.send_snapshot(websocket, room)
+            elif message_type == "auth":
+                try:
+                    controller = await asyncio.to_thread(authenticate_game_controller, share_code.upper(), message.get("token"))
+                    heartbeats.beat((controller["kind"], controller["game_id"]))
+                    manager.send_personal(websocket, room, {
+                        "type": "auth_ok", "game_id": controller["game_id"], "ping_interval": CONTROLLER_PING_SECONDS
+                    })
+                except HTTPException as e:
+                    controller = None
+                    manager.send_personal(websocket, room, {"type": "auth_error", "status": e.status_code, "detail": e.detail})
+                except Exception as e:
+                    # e.g. the database is locked: report it and keep the socket open
+                    print(f"Controller auth failed for {room}: {e}")
+                    controller = None
+                    manager.send_personal(websocket, room, {"type": "auth_error", "status": 500, "detail": "Internal server error"})
+            elif message_type == "ping":
+                # Controller liveness lives in the heartbeat supervisor; no database access here
+                if controller is not None:
+                    heartbeats.beat((controller["kind"], controller["game_id"]))
+                manager.send_personal(websocket, room, {"type": "pong"})
+            elif message_type == "update":
+                ref = message.get("ref")
+                if controller is None:
+                    manager.send_personal(websocket, room, {"type": "nack", "ref": ref, "status": 401, "detail": "Not authenticated"})
+                    continue
+                heartbeats.beat((controller["kind"], controller["game_id"]))
+                try:
+                    await handle_controller_update(controller, message.get("data"))
+                except ValidationError as e:
+                    manager.send_personal(websocket, room, {"type": "nack", "ref": ref, "status": 422, "detail": e.errors(include_url=False, include_context=False)})
+                except HTTPException as e:
+                    manager.send_personal(websocket, room, {"type": "nack", "ref": ref, "status": e.status_code, "detail": e.detail})
+                except Exception as e:
+                    # One failed write (e.g. a database error) must not take the controller down
+                    print(f"Controller update failed for {room}: {e}")
+                    manager.send_personal(websocket, room, {"type": "nack", "ref": ref, "status": 500, "detail": "Internal server error"})
+                else:
+                    manager.send_personal(websocket, room, {"type": "ack", "ref": ref, "seq": manager.get_game_seq(room)})
+    except (WebSocketDisconnect, RuntimeError) as e:
+        # RuntimeError: the socket was already closed by the manager (slow consumer eviction)
+        if controller is not None and getattr(e, "code", None) == 1000:
+            # The controller closed the page normally: stop supervising instead of flagging a crash
+            heartbeats.forget((controller["kind"], controller["game_id"]))
+            if controller["kind"] == "game":
+                await manager.backplane.clear_heartbeat(controller["game_id"])
+    finally:
+        # Every exit path leaves the room, so the writer task and viewer count don't leak
         manager.disconnect(websocket, room)
         await manager.broadcast_viewer_count(room)
 
@@ -1879,7 +2557,8 @@ async def bracket_websocket(websocket: WebSocket, share_code: str):
     try:
         while True:
             data = await websocket.receive_text()
-    except WebSocketDisconnect:
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the socket was already closed by the manager (slow consumer eviction)
         manager.disconnect(websocket, room)
         await manager.broadcast_viewer_count(room)
 
@@ -1891,14 +2570,27 @@ async def scoreboard_websocket(websocket: WebSocket, share_code: str):
     try:
         while True:
             data = await websocket.receive_text()
-    except WebSocketDisconnect:
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the socket was already closed by the manager (slow consumer eviction)
         manager.disconnect(websocket, room)
         await manager.broadcast_viewer_count(room)
 
 
+@app.get("/api/realtime/stats")
+def get_realtime_stats():
+    """Per-room viewer counts and broadcast fan-out latency"""
+    return manager.get_stats()
+
+
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Hit rate, size and eviction counters of the share-code response cache"""
+    return share_responses.get_stats()
+
+
 # ============ Invite Endpoints ============
 @app.post("/api/invites")
-async def create_invite(
+def create_invite(
     invite: schemas.InviteCreate,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
@@ -1944,7 +2636,7 @@ async def create_invite(
 
 
 @app.get("/api/invites/pending")
-async def get_pending_invites(
+def get_pending_invites(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
 ):
@@ -1971,7 +2663,7 @@ async def get_pending_invites(
 
 
 @app.put("/api/invites/{invite_id}")
-async def respond_to_invite(
+def respond_to_invite(
     invite_id: str,
     update: schemas.InviteUpdate,
     db: Session = Depends(get_db),
@@ -1995,7 +2687,7 @@ async def respond_to_invite(
 
 
 @app.delete("/api/invites/{invite_id}")
-async def delete_invite(
+def delete_invite(
     invite_id: str,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(auth.get_current_user_required)
@@ -0,0 +1,13 @@
+"""
+Migration script to add the foreign key, share_code and composite indexes declared in models.py.
+
+Superseded by the versioned migrations in migrations.py, which the server applies on startup.
+Kept so existing instructions still work: running it brings ./scoreboard.db fully up to date.
+
+Usage: python migrate_add_indexes.py
+"""
+
+from migrations import migrate_database
+
+if __name__ == "__main__":
+    migrate_database()
@@ -1,31 +1,13 @@
 """
 Migration script to add is_finished column to leagues table.
-Run this script once to update the database schema.
-"""
 
-import sqlite3
-import os
+Superseded by the versioned migrations in migrations.py, which the server applies on startup.
+Kept so existing instructions still work: running it brings ./scoreboard.db fully up to date.
 
-# Get the database path
-db_path = os.path.join(os.path.dirname(__file__), 'scoreboard.db')
+Usage: python migrate_add_is_finished.py
+"""
 
-def migrate():
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Check if column already exists
-    cursor.execute("PRAGMA table_info(leagues)")
-    columns = [col[1] for col in cursor.fetchall()]
-    
-    if 'is_finished' not in columns:
-        print("Adding is_finished column to leagues table...")
-        cursor.execute("ALTER TABLE leagues ADD COLUMN is_finished BOOLEAN DEFAULT 0")
-        conn.commit()
-        print("Migration complete!")
-    else:
-        print("Column is_finished already exists, skipping migration.")
-    
-    conn.close()
+from migrations import migrate_database
 
 if __name__ == "__main__":
-    migrate()
+    migrate_database()
@@ -0,0 +1,220 @@
+"""
+Versioned schema migrations.
+
+The database records the schema version it is at in a one-row `schema_version` table.
+migrate_database() runs on every startup:
+
+- version is current: a single SELECT and nothing else, so no table reflection on a warm DB
+- no tables at all: create_all() builds the current schema and stamps the latest version
+- otherwise: every pending migration runs, in order, inside one BEGIN IMMEDIATE transaction,
+  so a failed migration leaves the database exactly as it was and a second worker starting
+  at the same time waits, then sees the new version and does nothing
+
+To change the schema, update models.py and append a function to MIGRATIONS; its version is
+its position in the list. `python migrations.py [path/to/scoreboard.db]` applies them without
+starting the server. Migrations must be non-destructive (never drop a table, column or row;
+only an index that another one makes redundant) and should tolerate a database that already
+has the change, since databases from before versioning were patched by hand with the old
+migrate_*.py scripts.
+"""
+
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, event, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+import models  # registers every table on Base.metadata
+import ratings
+from database import Base, engine as default_engine
+
+# Kept out of Base.metadata so create_all() and the models never see it
+version_metadata = MetaData()
+schema_version = Table(
+    "schema_version", version_metadata,
+    Column("version", Integer, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def add_missing_tables_and_columns(conn: Connection):
+    """Bring a pre-versioning database up to the models: create missing tables, add missing columns"""
+    Base.metadata.create_all(bind=conn)
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(conn.dialect)}"
+            for fk in column.foreign_keys:
+                ddl += f" REFERENCES {fk.column.table.name}({fk.column.name})"
+                if fk.ondelete:
+                    ddl += f" ON DELETE {fk.ondelete}"
+            default = column.default.arg if column.default is not None and column.default.is_scalar else None
+            if isinstance(default, bool):
+                ddl += f" DEFAULT {int(default)}"
+            elif isinstance(default, (int, str)):
+                ddl += f" DEFAULT {default!r}"
+            conn.exec_driver_sql(ddl)
+            print(f"  Added {table.name}.{column.name}")
+
+
+def create_default_seasons(conn: Connection):
+    """Give every league without a season a current one holding its games and team stats"""
+    leagues = conn.execute(text(
+        "SELECT id, season FROM leagues WHERE id NOT IN (SELECT league_id FROM seasons)"
+    )).all()
+    now = datetime.utcnow()
+    for league_id, season_name in leagues:
+        season_id = str(uuid.uuid4())
+        conn.execute(text(
+            "INSERT INTO seasons (id, league_id, name, is_current, is_finished, created_at, updated_at) "
+            "VALUES (:id, :league_id, :name, 1, 0, :now, :now)"
+        ), {"id": season_id, "league_id": league_id, "name": season_name or "Season 1", "now": now})
+        conn.execute(text("UPDATE games SET season_id = :season_id WHERE league_id = :league_id AND season_id IS NULL"),
+                     {"season_id": season_id, "league_id": league_id})
+        # Carry each team's current totals over as its stats for the season
+        teams = conn.execute(text(
+            "SELECT id, wins, losses, ties, points_for, points_against FROM teams WHERE league_id = :league_id"
+        ), {"league_id": league_id}).all()
+        if teams:
+            conn.execute(text(
+                "INSERT INTO team_season_stats (id, team_id, season_id, wins, losses, ties, points_for, points_against, created_at) "
+                "VALUES (:id, :team_id, :season_id, :wins, :losses, :ties, :pf, :pa, :now)"
+            ), [{"id": str(uuid.uuid4()), "team_id": team_id, "season_id": season_id, "wins": wins or 0,
+                 "losses": losses or 0, "ties": ties or 0, "pf": pf or 0, "pa": pa or 0, "now": now}
+                for team_id, wins, losses, ties, pf, pa in teams])
+    if leagues:
+        print(f"  Created default seasons for {len(leagues)} leagues")
+
+
+def add_indexes(conn: Connection):
+    """Create the indexes declared in models.py, skipping any whose columns are already indexed
+    (e.g. SQLite's autoindex on a UNIQUE share_code column)"""
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue  # Created with its indexes by a later migration
+        existing = inspector.get_indexes(table.name)
+        covered = {tuple(ix["column_names"]) for ix in existing}
+        covered |= {tuple(uc["column_names"]) for uc in inspector.get_unique_constraints(table.name)}
+        # The inspector leaves out expression indexes (e.g. the standings ones), so names come from SQLite
+        names = set(conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?", (table.name,)
+        ).scalars())
+        for index in table.indexes:
+            if index.name in names or tuple(col.name for col in index.columns) in covered:
+                continue
+            index.create(bind=conn)
+            print(f"  Created index {index.name}")
+    conn.exec_driver_sql("ANALYZE")
+
+
+# Single-column indexes superseded by a composite index with the same leading column, or
+# on a column with only a few values
+REDUNDANT_INDEXES = ("ix_teams_league_id", "ix_games_league_id", "ix_games_status", "ix_standalone_games_status")
+
+
+def drop_redundant_indexes(conn: Connection):
+    """Drop the REDUNDANT_INDEXES (they only cost writes) and create their replacements"""
+    for name in REDUNDANT_INDEXES:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+    add_indexes(conn)
+
+
+def build_team_ratings(conn: Connection):
+    """Create team_ratings and rate every league from its existing final games"""
+    add_missing_tables_and_columns(conn)
+    leagues = conn.execute(text("SELECT id FROM leagues")).scalars().all()
+    with Session(bind=conn) as db:
+        for league_id in leagues:
+            ratings.rebuild_league(db, league_id)
+        db.flush()
+    if leagues:
+        print(f"  Rated {len(leagues)} leagues")
+
+
+# Append only; a migration's version is its 1-based position
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("add tables and columns missing from models", add_missing_tables_and_columns),
+    ("default season for every league", create_default_seasons),
+    ("foreign key and lookup indexes", add_indexes),
+    ("standings order indexes", add_indexes),
+    ("league tiebreakers column", add_missing_tables_and_columns),
+    ("league revision column", add_missing_tables_and_columns),
+    ("league schedule index", add_indexes),
+    ("team ratings table", build_team_ratings),
+    ("drop redundant indexes", drop_redundant_indexes),
+]
+LATEST_VERSION = len(MIGRATIONS)
+
+
+def current_version(conn: Connection) -> int:
+    """Recorded schema version, or 0 for a database that has never been versioned"""
+    try:
+        return conn.execute(select(schema_version.c.version)).scalar() or 0
+    except OperationalError:  # no schema_version table yet
+        return 0
+
+
+def migration_engine(url) -> Engine:
+    """Single connection engine whose transactions also cover DDL. pysqlite otherwise commits
+    before CREATE/ALTER, and BEGIN IMMEDIATE takes the write lock up front so two workers
+    starting together migrate one after the other."""
+    migrate_engine = create_engine(url, poolclass=NullPool)
+
+    @event.listens_for(migrate_engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(migrate_engine, "begin")
+    def begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return migrate_engine
+
+
+def migrate_database(engine: Engine = default_engine) -> int:
+    """Apply pending migrations and return the schema version the database is now at"""
+    with engine.connect() as conn:
+        if current_version(conn) == LATEST_VERSION:
+            return LATEST_VERSION
+
+    started = time.perf_counter()
+    migrate_engine = migration_engine(engine.url)
+    try:
+        with migrate_engine.begin() as conn:
+            version = current_version(conn)
+            if version == LATEST_VERSION:
+                return version  # another worker got here first
+            if version > LATEST_VERSION:
+                raise RuntimeError(f"Database schema version {version} is newer than this code ({LATEST_VERSION})")
+            version_metadata.create_all(bind=conn)
+            if not set(inspect(conn).get_table_names()) & set(Base.metadata.tables):
+                print("Creating database schema...")
+                Base.metadata.create_all(bind=conn)
+            else:
+                for number, (description, migration) in enumerate(MIGRATIONS[version:], start=version + 1):
+                    print(f"Migration {number}: {description}")
+                    migration(conn)
+            conn.execute(schema_version.delete())
+            conn.execute(schema_version.insert().values(version=LATEST_VERSION, applied_at=datetime.utcnow()))
+    finally:
+        migrate_engine.dispose()
+    print(f"Database schema at version {LATEST_VERSION} ({time.perf_counter() - started:.2f}s)")
+    return LATEST_VERSION
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from database import make_engine
+        migrate_database(make_engine(f"sqlite:///{sys.argv[1]}"))
+    else:
+        migrate_database()
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -32,7 +32,7 @@ class League(Base):
     __tablename__ = "leagues"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    owner_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    owner_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
     name = Column(String(100), nullable=False)
     sport = Column(String(50), nullable=False)
     season = Column(String(50), nullable=False)
@@ -45,6 +45,8 @@ class League(Base):
     game_unit_label_3 = Column(String(50))  # Extra unit, e.g., "Preseason Week"
     penalties = Column(Text)  # JSON array of penalty names, e.g., ["Holding", "False Start", "Offsides"]
     mechanics = Column(Text)  # JSON object of enabled mechanics, e.g., {"downs": true, "play_clock": true}
+    tiebreakers = Column(Text)  # JSON array of tiebreaker names in order, e.g., ["head_to_head", "point_diff"] (null = default)
+    revision = Column(Integer, default=0)  # Bumped by every write to the league's games, teams, brackets or records (see revisions.py)
     is_finished = Column(Boolean, default=False)  # Whether league is finished (locks editing)
     share_code = Column(String(8), unique=True, default=generate_share_code, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -60,6 +62,10 @@ class League(Base):
 
 class Season(Base):
     __tablename__ = "seasons"
+    __table_args__ = (
+        # Season lists and the current-season lookup per league
+        Index("ix_seasons_league_id_is_current", "league_id", "is_current"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     league_id = Column(String, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
@@ -77,6 +83,9 @@ class Season(Base):
 class RecordType(Base):
     """Different record types per league (e.g., Overall, Conference, Division)"""
     __tablename__ = "record_types"
+    __table_args__ = (
+        Index("ix_record_types_league_id_sort_order", "league_id", "sort_order"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     league_id = Column(String, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
@@ -94,8 +103,8 @@ class TeamRecord(Base):
     __tablename__ = "team_records"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
-    record_type_id = Column(String, ForeignKey("record_types.id", ondelete="CASCADE"), nullable=False)
+    team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
+    record_type_id = Column(String, ForeignKey("record_types.id", ondelete="CASCADE"), nullable=False, index=True)
     wins = Column(Integer, default=0)
     losses = Column(Integer, default=0)
     ties = Column(Integer, default=0)
@@ -106,14 +115,19 @@ class TeamRecord(Base):
     team = relationship("Team", back_populates="records")
     record_type = relationship("RecordType", back_populates="team_records")
 
+    __table_args__ = (
+        # Standings of a record type, kept in standings order (see standings.standings_order)
+        Index("ix_team_records_standings", record_type_id, wins.desc(), losses, points_against - points_for),
+    )
+
 
 class TeamSeasonStats(Base):
     """Track team stats per season - allows teams to persist across seasons with separate records"""
     __tablename__ = "team_season_stats"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
-    season_id = Column(String, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False)
+    team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
+    season_id = Column(String, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False, index=True)
     wins = Column(Integer, default=0)
     losses = Column(Integer, default=0)
     ties = Column(Integer, default=0)
@@ -124,6 +138,33 @@ class TeamSeasonStats(Base):
     team = relationship("Team", back_populates="season_stats")
     season = relationship("Season", back_populates="team_stats")
 
+    __table_args__ = (
+        # Season standings, kept in standings order (see standings.standings_order)
+        Index("ix_team_season_stats_standings", season_id, wins.desc(), losses, points_against - points_for),
+    )
+
+
+class TeamRating(Base):
+    """Power ratings of a team over the league's games (season_id NULL) or one season's (see ratings.py)"""
+    __tablename__ = "team_ratings"
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
+    league_id = Column(String, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    season_id = Column(String, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=True)
+    elo = Column(Float, default=1500.0)
+    srs = Column(Float, default=0.0)  # Simple Rating System: mov + sos
+    mov = Column(Float, default=0.0)  # Average margin of victory
+    sos = Column(Float, default=0.0)  # Strength of schedule: average SRS of opponents
+    games = Column(Integer, default=0)
+    margin = Column(Integer, default=0)  # Total points for minus points against
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # A league's ratings table for one scope
+        Index("ix_team_ratings_league_id_season_id", league_id, season_id),
+    )
+
 
 class Team(Base):
     __tablename__ = "teams"
@@ -151,15 +192,29 @@ class Team(Base):
     season_stats = relationship("TeamSeasonStats", back_populates="team", cascade="all, delete-orphan")
     records = relationship("TeamRecord", back_populates="team", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # League standings, kept in standings order (see standings.standings_order); also
+        # serves every other lookup of a league's teams
+        Index("ix_teams_standings", league_id, wins.desc(), losses, points_against - points_for),
+    )
+
 
 class Game(Base):
     __tablename__ = "games"
 
+    __table_args__ = (
+        # A league's schedule in (scheduled_at, id) order, for keyset pagination; also serves
+        # every other lookup of a league's games
+        Index("ix_games_league_id_scheduled_at", "league_id", "scheduled_at", "id"),
+        # Live games with a running clock (clock and live state recovery on startup)
+        Index("ix_games_status_timer_running", "status", "timer_running"),
+    )
+
     id = Column(String, primary_key=True, default=generate_uuid)
     league_id = Column(String, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
-    season_id = Column(String, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=True)  # Link to season
-    home_team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
-    away_team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    season_id = Column(String, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=True, index=True)  # Link to season
+    home_team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
+    away_team_id = Column(String, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
     home_score = Column(Integer, default=0)
     away_score = Column(Integer, default=0)
     status = Column(String(20), default="scheduled")  # scheduled, live, final
@@ -169,11 +224,11 @@ class Game(Base):
     time_tbd = Column(Boolean, default=False)  # True if time is TBD (only date is set)
     game_unit = Column(Integer)  # e.g., 1 for "Week 1", 2 for "Week 2"
     game_unit_type = Column(Integer, default=1)  # 1=primary, 2=secondary, 3=extra
-    record_type_id = Column(String, ForeignKey("record_types.id", ondelete="SET NULL"), nullable=True)  # Which record this game counts towards
+    record_type_id = Column(String, ForeignKey("record_types.id", ondelete="SET NULL"), nullable=True, index=True)  # Which record this game counts towards
     counts_towards_record = Column(Boolean, default=True)  # If false, game doesn't affect any record
     started_at = Column(DateTime)
     ended_at = Column(DateTime)
-    share_code = Column(String(8), default=generate_share_code, unique=True)
+    share_code = Column(String(8), default=generate_share_code, unique=True, index=True)
     # Game state fields for live display
     down = Column(Integer, default=1)
     distance = Column(Integer, default=10)
@@ -202,7 +257,7 @@ class Bracket(Base):
     __tablename__ = "brackets"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    league_id = Column(String, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    league_id = Column(String, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     bracket_type = Column(String(20), default="single_elimination")  # single_elimination, double_elimination
     layout = Column(String(20), default="one_sided")  # one_sided, two_sided
@@ -214,7 +269,7 @@ class Bracket(Base):
     playoff_picture = Column(Text)  # JSON string of playoff picture data (seeds, records, etc.)
     is_finalized = Column(Boolean, default=False)  # If true, locks editing of playoff picture
     finals_logo_url = Column(String(500))  # Optional logo for the finals/championship round
-    share_code = Column(String(8), default=generate_share_code, unique=True)
+    share_code = Column(String(8), default=generate_share_code, unique=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -226,17 +281,17 @@ class BracketMatch(Base):
     __tablename__ = "bracket_matches"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    bracket_id = Column(String, ForeignKey("brackets.id", ondelete="CASCADE"), nullable=False)
+    bracket_id = Column(String, ForeignKey("brackets.id", ondelete="CASCADE"), nullable=False, index=True)
     round_number = Column(Integer, nullable=False)
     match_number = Column(Integer, nullable=False)
-    team1_id = Column(String, ForeignKey("teams.id", ondelete="SET NULL"))
-    team2_id = Column(String, ForeignKey("teams.id", ondelete="SET NULL"))
+    team1_id = Column(String, ForeignKey("teams.id", ondelete="SET NULL"), index=True)
+    team2_id = Column(String, ForeignKey("teams.id", ondelete="SET NULL"), index=True)
     team1_score = Column(Integer, default=0)
     team2_score = Column(Integer, default=0)
-    winner_id = Column(String, ForeignKey("teams.id", ondelete="SET NULL"))
+    winner_id = Column(String, ForeignKey("teams.id", ondelete="SET NULL"), index=True)
     status = Column(String(20), default="pending")  # pending, live, completed
     next_match_id = Column(String, ForeignKey("bracket_matches.id", ondelete="SET NULL"))
-    game_id = Column(String, ForeignKey("games.id", ondelete="SET NULL"))  # Link to league game
+    game_id = Column(String, ForeignKey("games.id", ondelete="SET NULL"), index=True)  # Link to league game
     is_bye = Column(Boolean, default=False)  # True if this match has a BYE slot
     bye_slot = Column(Integer)  # 1 or 2 to indicate which team slot is the BYE
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -251,6 +306,12 @@ class BracketMatch(Base):
 class StandaloneGame(Base):
     """Standalone football game not tied to a league - stores team info directly"""
     __tablename__ = "standalone_games"
+    __table_args__ = (
+        # A user's games, newest first
+        Index("ix_standalone_games_owner_id_created_at", "owner_id", "created_at"),
+        # Live games that have a controller heartbeat (the heartbeat sweep)
+        Index("ix_standalone_games_status_last_heartbeat", "status", "last_heartbeat"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     owner_id = Column(String, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
@@ -284,7 +345,7 @@ class StandaloneGame(Base):
     scheduled_at = Column(DateTime)
     started_at = Column(DateTime)
     ended_at = Column(DateTime)
-    share_code = Column(String(8), default=generate_share_code, unique=True)
+    share_code = Column(String(8), default=generate_share_code, unique=True, index=True)
     down = Column(Integer, default=1)
     distance = Column(Integer, default=10)
     ball_on = Column(Integer, default=25)
@@ -311,7 +372,7 @@ class Scoreboard(Base):
     name = Column(String(100), nullable=False)
     description = Column(Text)
     logo_url = Column(String(500))  # Optional logo for display
-    share_code = Column(String(8), default=generate_share_code, unique=True)
+    share_code = Column(String(8), default=generate_share_code, unique=True, index=True)
     is_public = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -323,7 +384,7 @@ class ScoreboardPlayer(Base):
     __tablename__ = "scoreboard_players"
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    scoreboard_id = Column(String, ForeignKey("scoreboards.id"), nullable=False)
+    scoreboard_id = Column(String, ForeignKey("scoreboards.id"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     score = Column(Integer, default=0)
     color = Column(String(7), default="#3B82F6")
@@ -335,9 +396,13 @@ class ScoreboardPlayer(Base):
 class Invite(Base):
     """Invites sent from one user to another for sharing access to resources"""
     __tablename__ = "invites"
+    __table_args__ = (
+        # A user's pending invites, newest first
+        Index("ix_invites_to_user_id_status_created_at", "to_user_id", "status", "created_at"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    from_user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    from_user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     to_user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     resource_type = Column(String(50), nullable=False)  # 'league', 'game', 'bracket', 'scoreboard'
     resource_id = Column(String, nullable=False)
@@ -0,0 +1,527 @@
+"""
+Monte Carlo playoff odds over a league's remaining schedule.
+
+The odds cover the league's current season: its TeamSeasonStats records, and its final and
+remaining games by Game.season_id. A league without a current season falls back to the Team
+totals and all of its games. Every counted game that is not final yet (scheduled or live) is
+played out PLAYOFF_SIMULATIONS times at once with NumPy. Each team's strength is its point differential per game, shrunk
+towards average early in the season (PRIOR_GAMES); a game's home win probability is a
+logistic curve of the strength gap plus HOME_EDGE_POINTS, scaled by MARGIN_SCALE_POINTS.
+
+The simulations run in batches of arrays: a (sims x games) matrix of outcomes is scattered
+into a (sims x teams x teams) head-to-head win matrix on top of the final games, from which
+win percentages, head-to-head, division, conference and common-opponent records all follow
+by array arithmetic. Each simulated season is then ranked within its conference like
+/standings (win pct, then the league's tiebreaker chain, then the standings index order) with
+one lexsort. Tied groups are split in passes: every group is split by the first tiebreaker
+that separates it and the subgroups still level start the chain again in the next pass, as
+in rankings.break_ties. Simulated games score no points, so the point tiebreakers use the
+points so far.
+
+The result is per-team seed, division title and playoff probabilities. Conferences are
+group_1 (teams without one form a single "default" group, as on the bracket page), and a
+playoff field of N teams takes the top ceil(N / conferences) of each conference, the same
+split the bracket page uses. Clinched/eliminated flags are exact bounds, not simulated:
+a team has clinched when too few conference rivals can still finish level with it, and is
+eliminated when enough rivals are already out of its reach (once a conference has no games
+left, its seeds decide).
+
+Results are cached per league together with a fingerprint of everything they were computed
+from (season, records, final results, remaining games, groups and tiebreakers), so each final,
+correction, schedule change or new season invalidates them on every worker. PlayoffPictureUpdater
+re-seeds the playoff_picture of a league's unfinalized playoff brackets in the background
+after its standings move.
+"""
+
+import asyncio
+import json
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+import models
+import rankings
+import revisions
+import standings
+from database import SessionLocal
+
+PLAYOFF_SIMULATIONS = int(os.getenv("PLAYOFF_SIMULATIONS", "10000"))
+MAX_PLAYOFF_SIMULATIONS = 100000
+HOME_EDGE_POINTS = float(os.getenv("PLAYOFF_HOME_EDGE_POINTS", "2.0"))
+MARGIN_SCALE_POINTS = float(os.getenv("PLAYOFF_MARGIN_SCALE_POINTS", "10.0"))
+PRIOR_GAMES = 3
+# Upper bound on sims x teams x teams per batch, which bounds memory to a few tens of MB
+BATCH_CELLS = 2_000_000
+DEFAULT_CONFERENCE = "default"
+
+# league id -> (fingerprint, state, result)
+_cache: Dict[str, Tuple[int, "SeasonState", "SimulationResult"]] = {}
+
+
+class SeasonState:
+    """A league's standings, final results and remaining schedule as arrays indexed by team"""
+
+    def __init__(self, teams: list, chain: List[str], finals: List[tuple], remaining: List[tuple],
+                 season_id: Optional[str] = None):
+        self.season_id = season_id
+        self.team_ids = [team.id for team in teams]  # standings index order
+        self.index = {team_id: i for i, team_id in enumerate(self.team_ids)}
+        self.groups = {team.id: (team.group_1, team.group_2) for team in teams}
+        self.totals = {team.id: {counter: getattr(team, counter) or 0 for counter in standings.COUNTERS} for team in teams}
+        self.chain = chain
+        self.finals = [game for game in finals if game[0] in self.index and game[1] in self.index]
+        self.remaining = [game for game in remaining if game[0] in self.index and game[1] in self.index and game[0] != game[1]]
+
+        self.conferences: List[str] = []
+        for team in teams:
+            conference = team.group_1 or DEFAULT_CONFERENCE
+            if conference not in self.conferences:
+                self.conferences.append(conference)
+        self.conference = [team.group_1 or DEFAULT_CONFERENCE for team in teams]
+        self.division = [team.group_2 or None for team in teams]
+
+        # Current seeds: each conference ranked on its own by the exact ranking rules
+        results = rankings.ResultsTable(self.groups, self.finals)
+        self.current_seed = {}
+        for conference in self.conferences:
+            members = [team_id for i, team_id in enumerate(self.team_ids) if self.conference[i] == conference]
+            for seed, team_id in enumerate(rankings.rank(members, self.totals, chain, results), 1):
+                self.current_seed[team_id] = seed
+
+    def fingerprint(self, sims: int) -> int:
+        return hash((
+            sims, self.season_id, tuple(self.chain),
+            tuple((team_id, self.groups[team_id], tuple(self.totals[team_id].values())) for team_id in self.team_ids),
+            frozenset(Counter(self.finals).items()),
+            frozenset(Counter(self.remaining).items()),
+        ))
+
+
+class SimulationResult:
+    def __init__(self, sims: int, seed_counts: np.ndarray, division_titles: np.ndarray, wins: np.ndarray, elapsed_ms: float):
+        self.sims = sims
+        self.seed_counts = seed_counts  # [team, seed - 1] -> simulations finishing there
+        self.division_titles = division_titles  # [team] -> simulations winning the division
+        self.wins = wins  # [team] -> total wins over all simulations
+        self.elapsed_ms = elapsed_ms
+
+
+def load_state(db: Session, league_id: str) -> SeasonState:
+    """State of the league's current season (of all its games when it has none)"""
+    team = models.Team
+    season_id = db.query(models.Season.id).filter(
+        models.Season.league_id == league_id, models.Season.is_current == True
+    ).limit(1).scalar()
+    game = models.Game
+    counted = [
+        game.league_id == league_id,
+        game.status != "final",
+        or_(game.counts_towards_record.is_(None), game.counts_towards_record == True),
+    ]
+    if season_id:
+        stats = models.TeamSeasonStats
+        # Teams added since the season started may not have a stats row yet
+        counters = [func.coalesce(getattr(stats, counter), 0).label(counter) for counter in standings.COUNTERS]
+        wins, losses, _, points_for, points_against = counters
+        query = select(team.id, team.group_1, team.group_2, *counters).outerjoin(
+            stats, and_(stats.team_id == team.id, stats.season_id == season_id)
+        ).order_by(wins.desc(), losses, points_against - points_for)
+        counted.append(game.season_id == season_id)
+    else:
+        query = select(team.id, team.group_1, team.group_2, *(getattr(team, counter) for counter in standings.COUNTERS)) \
+            .order_by(*standings.standings_order(team))
+    teams = db.execute(query.where(team.league_id == league_id)).all()
+    league = db.query(models.League.tiebreakers).filter(models.League.id == league_id).first()
+    chain = rankings.parse_tiebreakers(league.tiebreakers if league else None)
+    remaining = db.execute(select(game.home_team_id, game.away_team_id).where(*counted)).all()
+    return SeasonState(teams, chain, [tuple(row) for row in rankings.scope_games(db, league_id, season_id)],
+                       [tuple(row) for row in remaining], season_id)
+
+
+def win_probabilities(state: SeasonState, home: np.ndarray, away: np.ndarray) -> np.ndarray:
+    played = np.array([sum(state.totals[t][c] for c in ("wins", "losses", "ties")) for t in state.team_ids], dtype=float)
+    diff = np.array([state.totals[t]["points_for"] - state.totals[t]["points_against"] for t in state.team_ids], dtype=float)
+    strength = diff / (played + PRIOR_GAMES)
+    return 1.0 / (1.0 + np.exp(-(strength[home] - strength[away] + HOME_EDGE_POINTS) / MARGIN_SCALE_POINTS))
+
+
+def pct(wins, ties, games):
+    """Win pct with ties as half a win, 0 for no games (rankings.win_pct over arrays)"""
+    return np.divide(wins + ties / 2, games, out=np.zeros(np.broadcast(wins, games).shape), where=games > 0)
+
+
+def simulate(state: SeasonState, sims: int, rng: Optional[np.random.Generator] = None) -> SimulationResult:
+    started = time.perf_counter()
+    rng = rng or np.random.default_rng()
+    n = len(state.team_ids)
+    index = state.index
+    column = lambda counter: np.array([state.totals[t][counter] for t in state.team_ids], dtype=float)
+    wins0, losses0, ties0 = column("wins"), column("losses"), column("ties")
+
+    # Head-to-head from final games: won[i, j] = wins of i over j, tied[i, j] = ties between them
+    won = np.zeros((n, n), dtype=np.float32)
+    tied = np.zeros((n, n), dtype=np.float32)
+    for home_id, away_id, home_score, away_score in state.finals:
+        h, a = index[home_id], index[away_id]
+        home_score, away_score = home_score or 0, away_score or 0
+        if home_score > away_score:
+            won[h, a] += 1
+        elif home_score < away_score:
+            won[a, h] += 1
+        else:
+            tied[h, a] += 1
+            tied[a, h] += 1
+
+    home = np.array([index[h] for h, _ in state.remaining], dtype=np.int32)
+    away = np.array([index[a] for _, a in state.remaining], dtype=np.int32)
+    home_win = win_probabilities(state, home, away)
+    left = np.bincount(home, minlength=n) + np.bincount(away, minlength=n)
+    meetings = won + won.T + tied
+    np.add.at(meetings, (home, away), 1)
+    np.add.at(meetings, (away, home), 1)
+    games = wins0 + losses0 + ties0 + left
+
+    tiebreaks = Tiebreaks(state, tied, meetings, column("points_for") - column("points_against"), column("points_for"))
+    conference = tiebreaks.conference
+    sizes = np.bincount(conference, minlength=len(state.conferences))
+    offset = np.concatenate(([0], np.cumsum(sizes)[:-1]))[conference]
+    max_seed = int(sizes.max()) if n else 0
+    divisions = defaultdict(list)
+    for i in range(n):
+        if state.division[i]:
+            divisions[tiebreaks.division[i]].append(i)
+
+    seed_counts = np.zeros(n * max_seed, dtype=np.int64)
+    division_titles = np.zeros(n, dtype=np.int64)
+    total_wins = np.zeros(n)
+    batch = max(1, min(sims, BATCH_CELLS // max(n * n, 1)))
+    done = 0
+    while done < sims and n:
+        size = min(batch, sims - done)
+        done += size
+        home_won = rng.random((size, len(home))) < home_win
+        # Scatter each simulated result into its sim's head-to-head matrix
+        cells = np.where(home_won, home * n + away, away * n + home) + (np.arange(size, dtype=np.int32) * n * n)[:, None]
+        head_to_head = won + np.bincount(cells.ravel(), minlength=size * n * n).reshape(size, n, n).astype(np.float32)
+        winners = np.where(home_won, home, away) + (np.arange(size, dtype=np.int32) * n)[:, None]
+        wins = wins0 + np.bincount(winners.ravel(), minlength=size * n).reshape(size, n)
+        win_pct = pct(wins, ties0, games)
+        total_wins += wins.sum(axis=0)
+
+        # Conference, then win pct, then standings index order; tiebreak() reorders the ties
+        order = np.lexsort((np.broadcast_to(np.arange(n), (size, n)), -win_pct, np.broadcast_to(conference, (size, n))), axis=-1)
+        level = (conference[order[:, 1:]] == conference[order[:, :-1]]) & \
+            (np.take_along_axis(win_pct, order[:, 1:], axis=1) == np.take_along_axis(win_pct, order[:, :-1], axis=1))
+        tiebreaks.tiebreak(order, level, head_to_head)
+
+        position = np.empty_like(order)
+        np.put_along_axis(position, order, np.broadcast_to(np.arange(n), (size, n)), axis=1)
+        seed = position - offset
+        seed_counts += np.bincount((np.arange(n) * max_seed + seed).ravel(), minlength=n * max_seed)
+        for members in divisions.values():
+            members = np.array(members)
+            champions = members[np.argmin(position[:, members], axis=1)]
+            division_titles += np.bincount(champions, minlength=n)
+
+    return SimulationResult(sims, seed_counts.reshape(n, max_seed), division_titles, total_wins,
+                            round((time.perf_counter() - started) * 1000, 1))
+
+
+def runs(level: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Runs of level neighbours in each row: level[r, p] says slots p and p + 1 of row r are tied.
+    Returns the row, first slot and length of every run of two or more slots."""
+    edges = np.diff(np.pad(level.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends - starts + 1
+
+
+class Tiebreaks:
+    """The tiebreaker chain over arrays: values for many tied groups of k teams at once, each
+    group a row of a (groups x k) array of team indices"""
+
+    def __init__(self, state: SeasonState, tied: np.ndarray, meetings: np.ndarray, point_diff: np.ndarray,
+                 points_for: np.ndarray):
+        n = len(state.team_ids)
+        self.chain = state.chain
+        self.tied = tied
+        self.meetings = meetings
+        self.played = meetings > 0
+        self.point_diff = point_diff
+        self.points_for = points_for
+        self.conference = np.array([state.conferences.index(c) for c in state.conference])
+        self.has_conference = np.array([bool(state.groups[t][0]) for t in state.team_ids])
+        labels: Dict[tuple, int] = {}
+        # Teams without a division get a label of their own, so they never share one
+        self.division = np.array([labels.setdefault((state.conference[i], state.division[i]), len(labels))
+                                  if state.division[i] else -1 - i for i in range(n)])
+        same_conference = (self.conference[:, None] == self.conference[None, :]) & self.has_conference[:, None]
+        np.fill_diagonal(same_conference, False)
+        same_division = same_conference & (self.division[:, None] == self.division[None, :])
+        self.within = {"conference": same_conference.astype(np.float32), "division": same_division.astype(np.float32)}
+        self.head_to_head = None
+        self.records = {}
+
+    def tiebreak(self, order: np.ndarray, level: np.ndarray, head_to_head: np.ndarray):
+        """Reorder the tied runs of each simulation's order (rows of team indices, level marks
+        neighbours on equal win pct) in place, the way rankings.break_ties would: a group is
+        split by the first tiebreaker that separates it and its subgroups still level start
+        over at the top of the chain. Nothing separates a group keeps its incoming order."""
+        self.head_to_head = head_to_head
+        self.records = {}
+        rows, starts, lengths = runs(level)
+        while len(rows):
+            found = []
+            for k in np.unique(lengths):
+                pick = lengths == k
+                group_rows, group_starts = rows[pick], starts[pick]
+                slots = group_starts[:, None] + np.arange(k)
+                members = order[group_rows[:, None], slots]
+                values, split = self.split(group_rows, members)
+                # Best value first; equal values keep the incoming (standings index) order
+                resort = np.lexsort((np.broadcast_to(np.arange(k), members.shape), -values), axis=-1)
+                order[group_rows[:, None], slots] = np.take_along_axis(members, resort, axis=1)
+                values = np.take_along_axis(values, resort, axis=1)
+                sub_rows, sub_starts, sub_lengths = runs((values[:, 1:] == values[:, :-1]) & split[:, None])
+                found.append((group_rows[sub_rows], group_starts[sub_rows] + sub_starts, sub_lengths))
+            rows, starts, lengths = (np.concatenate(parts) for parts in zip(*found))
+
+    def split(self, rows: np.ndarray, members: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Value of the first tiebreaker that separates each group, and which groups were separated"""
+        chosen = np.zeros(members.shape)
+        open_ = np.ones(len(members), dtype=bool)
+        for name in self.chain:
+            found = self.values(name, rows, members)
+            if found is None:
+                continue
+            values, applies = found
+            splits = open_ & applies & (values != values[:, :1]).any(axis=1)
+            chosen[splits] = values[splits]
+            open_ &= ~splits
+            if not open_.any():
+                break
+        return chosen, ~open_
+
+    def values(self, name: str, rows: np.ndarray, members: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(values, applies): each member's value for one tiebreaker (higher is better) and
+        whether the tiebreaker applies to the group (rankings.tiebreaker_values)"""
+        everywhere = np.ones(len(members), dtype=bool)
+        if name == "head_to_head":
+            pair = (members[:, :, None], members[:, None, :])
+            wins = self.head_to_head[(rows[:, None, None],) + pair].sum(axis=2)
+            return pct(wins, self.tied[pair].sum(axis=2), self.meetings[pair].sum(axis=2)), everywhere
+        if name in ("division", "conference"):
+            labels = self.division[members] if name == "division" else self.conference[members]
+            applies = (labels == labels[:, :1]).all(axis=1) & self.has_conference[members].all(axis=1)
+            return self.record(name)[rows[:, None], members], applies
+        if name == "common_opponents":
+            common = self.played[members].all(axis=1)
+            common[np.arange(len(members))[:, None], members] = False
+            against = common[:, None, :]
+            wins = (self.head_to_head[rows[:, None], members] * against).sum(axis=2)
+            values = pct(wins, (self.tied[members] * against).sum(axis=2), (self.meetings[members] * against).sum(axis=2))
+            return values, common.any(axis=1)
+        if name == "point_diff":
+            return self.point_diff[members], everywhere
+        if name == "points_for":
+            return self.points_for[members], everywhere
+        return None
+
+    def record(self, name: str) -> np.ndarray:
+        """(sims x teams) win pct within the conference or division, for the current batch"""
+        if name not in self.records:
+            within = self.within[name]
+            self.records[name] = pct(np.einsum("bij,ij->bi", self.head_to_head, within),
+                                     (self.tied * within).sum(axis=1), (self.meetings * within).sum(axis=1))
+        return self.records[name]
+
+
+def league_odds(db: Session, league_id: str, sims: int = PLAYOFF_SIMULATIONS) -> Tuple[SeasonState, SimulationResult]:
+    """Current state and simulation of a league, reusing the cached run while its inputs are unchanged"""
+    state = load_state(db, league_id)
+    fingerprint = state.fingerprint(sims)
+    cached = _cache.get(league_id)
+    if cached and cached[0] == fingerprint:
+        return cached[1], cached[2]
+    result = simulate(state, sims)
+    _cache[league_id] = (fingerprint, state, result)
+    return state, result
+
+
+def conference_spots(state: SeasonState, spots: int) -> int:
+    """Playoff places per conference for a field of `spots` teams"""
+    return math.ceil(spots / max(len(state.conferences), 1))
+
+
+def clinch_status(state: SeasonState, spots: int) -> Dict[str, Optional[str]]:
+    """team id -> "clinched", "eliminated" or None, from the best and worst possible finishes"""
+    left = Counter()
+    for home_id, away_id in state.remaining:
+        left[home_id] += 1
+        left[away_id] += 1
+    best, worst = {}, {}
+    for team_id, totals in state.totals.items():
+        games = totals["wins"] + totals["losses"] + totals["ties"] + left[team_id]
+        worst[team_id] = rankings.win_pct(totals["wins"], totals["losses"] + left[team_id], totals["ties"]) if games else 0.0
+        best[team_id] = rankings.win_pct(totals["wins"] + left[team_id], totals["losses"], totals["ties"]) if games else 0.0
+    places = conference_spots(state, spots)
+    finished = set(state.conferences)
+    for i, team_id in enumerate(state.team_ids):
+        if left[team_id]:
+            finished.discard(state.conference[i])
+    status = {}
+    for i, team_id in enumerate(state.team_ids):
+        rivals = [other for j, other in enumerate(state.team_ids) if j != i and state.conference[j] == state.conference[i]]
+        if state.conference[i] in finished:
+            # Nothing left to play: the tiebreakers have settled the seeds
+            status[team_id] = "clinched" if state.current_seed[team_id] <= places else "eliminated"
+        elif sum(best[other] >= worst[team_id] for other in rivals) < places:
+            status[team_id] = "clinched"
+        elif sum(worst[other] > best[team_id] for other in rivals) >= places:
+            status[team_id] = "eliminated"
+        else:
+            status[team_id] = None
+    return status
+
+
+def odds_report(db: Session, league_id: str, sims: int = PLAYOFF_SIMULATIONS, spots: Optional[int] = None) -> dict:
+    """Response of GET /api/leagues/{id}/playoff-odds. spots defaults to the size of the league's
+    largest playoff bracket; without either there are no playoff odds, only seeds."""
+    state, result = league_odds(db, league_id, sims)
+    if spots is None:
+        spots = db.query(models.Bracket.num_teams).filter(
+            models.Bracket.league_id == league_id, models.Bracket.is_playoff == True
+        ).order_by(models.Bracket.num_teams.desc()).limit(1).scalar()
+    status = clinch_status(state, spots) if spots else {}
+    places = conference_spots(state, spots) if spots else 0
+    teams = []
+    for i, team_id in enumerate(state.team_ids):
+        seeds = result.seed_counts[i] / result.sims
+        size = state.conference.count(state.conference[i])
+        teams.append({
+            "team_id": team_id,
+            "conference": state.conference[i],
+            "division": state.division[i],
+            "seed": state.current_seed[team_id],
+            **{counter: state.totals[team_id][counter] for counter in ("wins", "losses", "ties")},
+            "projected_wins": round(float(result.wins[i]) / result.sims, 2),
+            "seed_odds": [round(float(p), 4) for p in seeds[:size]],
+            "division_odds": round(float(result.division_titles[i]) / result.sims, 4) if state.division[i] else None,
+            "playoff_odds": round(float(seeds[:places].sum()), 4) if spots else None,
+            "clinched": status.get(team_id) == "clinched",
+            "eliminated": status.get(team_id) == "eliminated",
+        })
+    teams.sort(key=lambda team: (state.conferences.index(team["conference"]), team["seed"]))
+    return {
+        "league_id": league_id,
+        "simulations": result.sims,
+        "remaining_games": len(state.remaining),
+        "spots": spots,
+        "elapsed_ms": result.elapsed_ms,
+        "teams": teams,
+    }
+
+
+def playoff_picture(state: SeasonState, result: SimulationResult, spots: int, existing: Optional[list]) -> list:
+    """Bracket playoff_picture entries ({team_id, seed, conference, status}, as the bracket page
+    edits them) plus playoff_odds. Clinched/eliminated marks set by hand are kept unless the
+    bounds say otherwise."""
+    manual = {entry.get("team_id"): entry.get("status") for entry in existing or [] if isinstance(entry, dict)}
+    status = clinch_status(state, spots)
+    places = conference_spots(state, spots)
+    picture = []
+    for i, team_id in enumerate(state.team_ids):
+        seed = state.current_seed[team_id]
+        if status[team_id]:
+            team_status = status[team_id]
+        elif manual.get(team_id) in ("clinched", "eliminated"):
+            team_status = manual[team_id]
+        else:
+            team_status = "in" if seed <= places else "bubble"
+        picture.append({
+            "team_id": team_id,
+            "seed": seed,
+            "conference": state.conference[i],
+            "status": team_status,
+            "playoff_odds": round(float(result.seed_counts[i][:places].sum()) / result.sims, 4),
+        })
+    picture.sort(key=lambda entry: (state.conferences.index(entry["conference"]), entry["seed"]))
+    return picture
+
+
+def update_playoff_pictures(league_id: str) -> List[str]:
+    """Re-seed the league's unfinalized playoff brackets; returns the cache tags of those that changed"""
+    db = SessionLocal()
+    try:
+        brackets = db.query(models.Bracket).filter(
+            models.Bracket.league_id == league_id,
+            models.Bracket.is_playoff == True,
+            or_(models.Bracket.is_finalized.is_(None), models.Bracket.is_finalized == False),
+        ).all()
+        if not brackets:
+            return []
+        state, result = league_odds(db, league_id)
+        tags = []
+        for bracket in brackets:
+            try:
+                existing = json.loads(bracket.playoff_picture) if bracket.playoff_picture else None
+            except ValueError:
+                existing = None
+            picture = json.dumps(playoff_picture(state, result, bracket.num_teams, existing))
+            if picture != bracket.playoff_picture:
+                bracket.playoff_picture = picture
+                tags.append(f"bracket:{bracket.share_code}")
+        if tags:
+            revisions.bump_league(db, league_id)
+            db.commit()
+        return tags
+    finally:
+        db.close()
+
+
+class PlayoffPictureUpdater:
+    """Runs update_playoff_pictures in a worker thread after a league's standings move. Requests
+    that arrive while a league is being updated are coalesced into one more run."""
+
+    def __init__(self):
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.pending: Set[str] = set()
+        # Called with the cache tags of the brackets that changed (ConnectionManager.invalidate)
+        self.on_update: Optional[Callable[[List[str]], Awaitable[None]]] = None
+
+    def schedule(self, league_id: str):
+        if league_id in self.tasks:
+            self.pending.add(league_id)
+            return
+        self.tasks[league_id] = asyncio.create_task(self._run(league_id))
+
+    async def _run(self, league_id: str):
+        try:
+            while True:
+                self.pending.discard(league_id)
+                try:
+                    tags = await asyncio.to_thread(update_playoff_pictures, league_id)
+                except Exception as e:
+                    print(f"Playoff picture update failed for league {league_id}: {e}")
+                    tags = []
+                if tags and self.on_update:
+                    await self.on_update(tags)
+                if league_id not in self.pending:
+                    break
+        finally:
+            self.tasks.pop(league_id, None)
+
+    async def stop(self):
+        for task in list(self.tasks.values()):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.tasks.clear()
@@ -0,0 +1,186 @@
+"""
+Tiebreaker-aware standings ranking.
+
+Teams are ranked by win percentage (a tie counts as half a win). Teams level on win percentage
+are separated by the league's tiebreaker chain (League.tiebreakers, default DEFAULT_TIEBREAKERS),
+tried in order:
+
+- head_to_head      win pct in games among the tied teams only
+- division          division record (group_2), only between teams of one division of one conference
+- conference        conference record (group_1), only between teams of one conference
+- common_opponents  win pct against opponents every tied team has played
+- point_diff        points for minus points against
+- points_for        points scored
+
+As soon as a tiebreaker splits a group, every subgroup that is still tied starts over at the
+top of the chain, so a two-way tie left over from a three-way tie is decided head to head
+between those two. Teams nothing separates keep the standings index order.
+
+All game-based tiebreakers read from a ResultsTable built in one pass over the scope's final
+games: a sparse head-to-head matrix plus division and conference records. Resolving a tie of
+k teams is then O(k^2) lookups, so ranking a league is near-linear in its games and teams.
+
+Rankings are cached per league and scope. An entry is reused while the standings rows it was
+computed from are unchanged and leagues.revision has not moved (revisions.py: it is bumped in
+the transaction of every result change, recompute and team group or tiebreaker edit, and is
+shared by all workers).
+"""
+
+import json
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+import models
+import standings
+
+TIEBREAKERS = ("head_to_head", "division", "conference", "common_opponents", "point_diff", "points_for")
+DEFAULT_TIEBREAKERS = ["head_to_head", "division", "conference", "common_opponents", "point_diff"]
+
+# (league id, scope) -> (fingerprint, ranked team ids)
+_cache: Dict[Tuple[str, Hashable], Tuple[Hashable, List[str]]] = {}
+
+
+def win_pct(wins: int, losses: int, ties: int) -> float:
+    played = wins + losses + ties
+    return (wins + ties / 2) / played if played else 0.0
+
+
+def parse_tiebreakers(value: Optional[str]) -> List[str]:
+    """A league's stored tiebreaker chain, falling back to the default"""
+    if not value:
+        return DEFAULT_TIEBREAKERS
+    try:
+        chain = json.loads(value)
+    except ValueError:
+        return DEFAULT_TIEBREAKERS
+    return [name for name in chain if name in TIEBREAKERS]
+
+
+class ResultsTable:
+    """Head-to-head matrix and division/conference records from one pass over final games"""
+
+    def __init__(self, groups: Dict[str, Tuple[Optional[str], Optional[str]]], games: Sequence[tuple]):
+        # h2h[a][b] = [wins, losses, ties] of team a against team b
+        self.h2h: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0, 0]))
+        self.division: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        self.conference: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        self.groups = groups
+        for home, away, home_score, away_score in games:
+            home_score, away_score = home_score or 0, away_score or 0
+            outcome = 0 if home_score > away_score else 1 if home_score < away_score else 2
+            mirrored = (1, 0, 2)[outcome]
+            self.h2h[home][away][outcome] += 1
+            self.h2h[away][home][mirrored] += 1
+            conference_home, division_home = groups.get(home, (None, None))
+            conference_away, division_away = groups.get(away, (None, None))
+            if conference_home and conference_home == conference_away:
+                self.conference[home][outcome] += 1
+                self.conference[away][mirrored] += 1
+                if division_home and division_home == division_away:
+                    self.division[home][outcome] += 1
+                    self.division[away][mirrored] += 1
+
+    def record_against(self, team_id: str, opponents) -> float:
+        wins = losses = ties = 0
+        for opponent in opponents:
+            record = self.h2h[team_id].get(opponent)
+            if record:
+                wins, losses, ties = wins + record[0], losses + record[1], ties + record[2]
+        return win_pct(wins, losses, ties)
+
+
+def tiebreaker_values(name: str, tied: List[str], results: ResultsTable, totals: Dict[str, Dict[str, int]]) -> Optional[Dict[str, float]]:
+    """Each tied team's value for one tiebreaker (higher is better), or None if it does not apply"""
+    if name == "head_to_head":
+        return {team: results.record_against(team, (other for other in tied if other != team)) for team in tied}
+    if name in ("division", "conference"):
+        # Division names repeat across conferences, so a division is a (group_1, group_2) pair
+        labels = {results.groups.get(team, (None, None))[:2 if name == "division" else 1] for team in tied}
+        if len(labels) != 1 or None in next(iter(labels)):
+            return None
+        records = results.division if name == "division" else results.conference
+        return {team: win_pct(*records[team]) for team in tied}
+    if name == "common_opponents":
+        common = set.intersection(*(set(results.h2h[team]) for team in tied)) - set(tied)
+        if not common:
+            return None
+        return {team: results.record_against(team, common) for team in tied}
+    if name == "point_diff":
+        return {team: totals[team]["points_for"] - totals[team]["points_against"] for team in tied}
+    if name == "points_for":
+        return {team: totals[team]["points_for"] for team in tied}
+    return None
+
+
+def break_ties(tied: List[str], chain: List[str], results: ResultsTable, totals: Dict[str, Dict[str, int]]) -> List[str]:
+    if len(tied) < 2:
+        return tied
+    for name in chain:
+        values = tiebreaker_values(name, tied, results, totals)
+        if values is None or len(set(values.values())) == 1:
+            continue
+        ranked = []
+        for value in sorted(set(values.values()), reverse=True):
+            # Subgroups keep the incoming order, so a tie nothing breaks stays in index order
+            ranked += break_ties([team for team in tied if values[team] == value], chain, results, totals)
+        return ranked
+    return tied
+
+
+def rank(team_ids: List[str], totals: Dict[str, Dict[str, int]], chain: List[str], results: ResultsTable) -> List[str]:
+    """team_ids (in standings index order) ranked by win pct, then the tiebreaker chain"""
+    pct = {team: win_pct(totals[team]["wins"], totals[team]["losses"], totals[team]["ties"]) for team in team_ids}
+    ordered = sorted(team_ids, key=lambda team: -pct[team])
+    ranked, start = [], 0
+    for end in range(1, len(ordered) + 1):
+        if end == len(ordered) or pct[ordered[end]] != pct[ordered[start]]:
+            ranked += break_ties(ordered[start:end], chain, results, totals)
+            start = end
+    return ranked
+
+
+def scope_games(db: Session, league_id: str, season_id: Optional[str] = None,
+                record_type_id: Optional[str] = None) -> List[tuple]:
+    """(home, away, home score, away score) of the counted final games a standings scope covers"""
+    game = models.Game
+    query = select(game.home_team_id, game.away_team_id, game.home_score, game.away_score).where(
+        game.league_id == league_id,
+        game.status == "final",
+        or_(game.counts_towards_record.is_(None), game.counts_towards_record == True),
+    )
+    if season_id:
+        query = query.where(game.season_id == season_id)
+    if record_type_id and record_type_id != standings.main_record_type_id(db, league_id):
+        query = query.where(game.record_type_id == record_type_id)
+    return db.execute(query).all()
+
+
+def ranked_rows(db: Session, league_id: str, rows: list, team_id: Callable = lambda row: row.team_id,
+                season_id: Optional[str] = None, record_type_id: Optional[str] = None) -> list:
+    """Standings rows (Team, TeamSeasonStats or TeamRecord, loaded in standings index order)
+    reordered by the league's ranking rules"""
+    if len(rows) < 2:
+        return rows
+    by_team = {team_id(row): row for row in rows}
+    totals = {team: {counter: getattr(row, counter) or 0 for counter in standings.COUNTERS}
+              for team, row in by_team.items()}
+    league = db.query(models.League.tiebreakers, models.League.revision).filter(models.League.id == league_id).first()
+    chain = parse_tiebreakers(league.tiebreakers if league else None)
+
+    key = (league_id, season_id, record_type_id)
+    fingerprint = (league.revision if league else None, tuple(chain),
+                   tuple((team, tuple(values.values())) for team, values in totals.items()))
+    cached = _cache.get(key)
+    if cached and cached[0] == fingerprint:
+        return [by_team[team] for team in cached[1]]
+
+    groups = {team: (group_1, group_2) for team, group_1, group_2 in db.execute(
+        select(models.Team.id, models.Team.group_1, models.Team.group_2).where(models.Team.league_id == league_id)
+    ).all()}
+    results = ResultsTable(groups, scope_games(db, league_id, season_id, record_type_id))
+    order = rank(list(by_team), totals, chain, results)
+    _cache[key] = (fingerprint, order)
+    return [by_team[team] for team in order]
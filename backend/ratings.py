@@ -0,0 +1,278 @@
+"""
+Power ratings: Elo and the Simple Rating System (SRS), materialized in team_ratings.
+
+Every team has a row rating all counted final games of its league (season_id NULL) and one
+per season it has played in. League pages read the rows (GET /api/leagues/{id}/ratings)
+instead of deriving anything from the games.
+
+Elo: teams start at ELO_BASE. A final moves the home team by
+ELO_K * multiplier * (result - expected) and the away team by the opposite, where expected
+includes ELO_HOME_ADVANTAGE and the margin multiplier ln(|margin| + 1) * 2.2 / (0.001 * the
+winner's Elo edge + 2.2) rewards wide wins without letting favourites run away. Ties count
+half and move ratings at the base rate.
+
+SRS: a team's rating is its average margin (mov) plus the average rating of its opponents
+(sos); equivalently, the least squares fit of rating_home - rating_away = margin over the
+games, with ratings centred on zero.
+
+Both are kept up to date in the writer's transaction (standings.apply_result_change calls
+apply_result_change). A game going final updates both teams' Elo exactly and marks its league
+and season scopes, whose SRS is solved again just before the transaction commits (once per
+scope however many games went final), so stored SRS always equals the rebuild's: one more
+game can move every team's rating, so SRS has no exact in-place update. Elo depends on the
+order of games, so a corrected, un-finalized or deleted final cannot be taken back; instead
+the league is marked and rebuilt before the commit as well, once the change has been flushed.
+
+rebuild_league() is the batch path (also run by POST /api/leagues/{id}/ratings/rebuild and
+the standings recompute): Elo is replayed over the finals in the order they ended, and SRS is
+solved per scope by conjugate gradients on the sparse normal equations (the Laplacian of the
+games graph), using edge-list products in NumPy. A league of a few hundred teams and
+thousands of games rebuilds in a few milliseconds.
+"""
+
+import math
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import event, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+import models
+
+ELO_BASE = 1500.0
+ELO_K = float(os.getenv("RATINGS_ELO_K", "20"))
+ELO_HOME_ADVANTAGE = float(os.getenv("RATINGS_ELO_HOME_ADVANTAGE", "50"))
+
+# Session.info keys of the leagues to rebuild and the (league, season) scopes to solve SRS
+# for before the session commits
+REBUILD_KEY = "ratings_rebuild"
+SRS_KEY = "ratings_srs"
+
+
+def elo_change(home_elo: float, away_elo: float, home_score: int, away_score: int) -> float:
+    """Points the home team gains (the away team loses the same)"""
+    edge = home_elo + ELO_HOME_ADVANTAGE - away_elo
+    expected = 1 / (1 + 10 ** (-edge / 400))
+    margin = home_score - away_score
+    if margin == 0:
+        return ELO_K * (0.5 - expected)
+    winner_edge = edge if margin > 0 else -edge
+    multiplier = math.log(abs(margin) + 1) * 2.2 / (winner_edge * 0.001 + 2.2)
+    return ELO_K * multiplier * ((1.0 if margin > 0 else 0.0) - expected)
+
+
+def scope_filter(season_id: Optional[str]):
+    rating = models.TeamRating
+    return rating.season_id.is_(None) if season_id is None else rating.season_id == season_id
+
+
+def apply_result_change(db: Session, league_id: str, before, after):
+    """Update ratings for a game's result moving from before to after (standings.GameResult or
+    None). Does not commit."""
+    if before is None and after is not None:
+        apply_final(db, league_id, after)
+    elif before is not None:
+        mark_for_rebuild(db, league_id)
+
+
+def apply_final(db: Session, league_id: str, result):
+    """Rate a game that just went final, in the league scope and its season's"""
+    if db.info.get(REBUILD_KEY) and league_id in db.info[REBUILD_KEY]:
+        return  # The rebuild before commit covers it
+    for season_id in {None, result.season_id}:
+        rows = {row.team_id: row for row in db.query(models.TeamRating).filter(
+            models.TeamRating.team_id.in_([result.home_team_id, result.away_team_id]),
+            scope_filter(season_id)
+        )}
+        for team_id in (result.home_team_id, result.away_team_id):
+            if team_id not in rows:
+                rows[team_id] = models.TeamRating(team_id=team_id, league_id=league_id, season_id=season_id,
+                                                  elo=ELO_BASE, srs=0.0, mov=0.0, sos=0.0, games=0, margin=0)
+                db.add(rows[team_id])
+        home, away = rows[result.home_team_id], rows[result.away_team_id]
+        change = elo_change(home.elo, away.elo, result.home_score, result.away_score)
+        home.elo, away.elo = home.elo + change, away.elo - change
+        db.info.setdefault(SRS_KEY, set()).add((league_id, season_id))
+    db.flush()
+
+
+def mark_for_rebuild(db: Session, league_id: str):
+    db.info.setdefault(REBUILD_KEY, set()).add(league_id)
+
+
+@event.listens_for(Session, "before_commit")
+def rebuild_marked_leagues(db: Session):
+    leagues = db.info.pop(REBUILD_KEY, None) or set()
+    scopes = db.info.pop(SRS_KEY, None) or set()
+    if leagues or scopes:
+        db.flush()
+        for league_id in leagues:
+            rebuild_league(db, league_id)
+        for league_id, season_id in scopes:
+            if league_id not in leagues:
+                resolve_srs(db, league_id, season_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_marked_leagues(db: Session):
+    db.info.pop(REBUILD_KEY, None)
+    db.info.pop(SRS_KEY, None)
+
+
+def solve_srs(n: int, home: np.ndarray, away: np.ndarray, margin: np.ndarray) -> np.ndarray:
+    """Least squares ratings r with r[home] - r[away] ~ margin, centred on zero in every connected
+    group of teams: conjugate gradients on L r = b, where L is the Laplacian of the games
+    graph (applied from the edge lists) and b each team's total margin"""
+    games = np.bincount(home, minlength=n) + np.bincount(away, minlength=n)
+    b = np.bincount(home, weights=margin, minlength=n) - np.bincount(away, weights=margin, minlength=n)
+
+    def laplacian(r):
+        return games * r - np.bincount(home, weights=r[away], minlength=n) - np.bincount(away, weights=r[home], minlength=n)
+
+    # b sums to zero in every component, so CG from zero converges to the centred solution
+    r = np.zeros(n)
+    residual = b.copy()
+    direction = residual.copy()
+    rs = residual @ residual
+    tolerance = 1e-20 * max(b @ b, 1.0)
+    for _ in range(2 * n + 10):
+        if rs <= tolerance:
+            break
+        product = laplacian(direction)
+        step = rs / (direction @ product)
+        r += step * direction
+        residual -= step * product
+        rs_next = residual @ residual
+        direction = residual + (rs_next / rs) * direction
+        rs = rs_next
+    return r
+
+
+def scope_srs(n: int, index: Dict[str, int], games: list) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(srs, mov, games, margin) of every team over a scope's final games"""
+    home = np.array([index[row.home_team_id] for row in games], dtype=np.int64)
+    away = np.array([index[row.away_team_id] for row in games], dtype=np.int64)
+    margin = np.array([(row.home_score or 0) - (row.away_score or 0) for row in games], dtype=float)
+    played = np.bincount(home, minlength=n) + np.bincount(away, minlength=n)
+    total = np.bincount(home, weights=margin, minlength=n) - np.bincount(away, weights=margin, minlength=n)
+    mov = np.divide(total, played, out=np.zeros(n), where=played > 0)
+    return solve_srs(n, home, away, margin), mov, played, total
+
+
+def league_finals(db: Session, league_id: str, season_id: Optional[str] = None) -> Tuple[List[str], list]:
+    """The league's team ids and the counted final games between them (of one season if
+    given), in the order they ended"""
+    game = models.Game
+    query = select(game.home_team_id, game.away_team_id, game.home_score, game.away_score, game.season_id).where(
+        game.league_id == league_id,
+        game.status == "final",
+        or_(game.counts_towards_record.is_(None), game.counts_towards_record == True),
+    )
+    if season_id is not None:
+        query = query.where(game.season_id == season_id)
+    games = db.execute(query.order_by(game.ended_at, game.scheduled_at, game.id)).all()
+    team_ids = db.execute(select(models.Team.id).where(models.Team.league_id == league_id)).scalars().all()
+    teams = set(team_ids)
+    return team_ids, [row for row in games if row.home_team_id in teams and row.away_team_id in teams]
+
+
+def resolve_srs(db: Session, league_id: str, season_id: Optional[str]):
+    """Solve one scope's SRS again and write it to the scope's rows (a team without one has
+    not played in the scope). Does not commit."""
+    team_ids, games = league_finals(db, league_id, season_id)
+    index = {team_id: i for i, team_id in enumerate(team_ids)}
+    srs, mov, played, total = scope_srs(len(team_ids), index, games)
+    rating = models.TeamRating
+    rows = db.execute(select(rating.id, rating.team_id).where(
+        rating.league_id == league_id, scope_filter(season_id)
+    )).all()
+    now = datetime.utcnow()
+    updates = [{"id": row.id, "srs": float(srs[i]), "mov": float(mov[i]), "sos": float(srs[i] - mov[i]),
+                "games": int(played[i]), "margin": int(total[i]), "updated_at": now}
+               for row in rows for i in (index.get(row.team_id),) if i is not None]
+    if updates:
+        db.execute(update(rating), updates)
+
+
+def rebuild_league(db: Session, league_id: str) -> dict:
+    """Recompute every rating of a league from its final games. Does not commit."""
+    started = time.perf_counter()
+    team_ids, games = league_finals(db, league_id)
+    index = {team_id: i for i, team_id in enumerate(team_ids)}
+
+    rating = models.TeamRating
+    existing = {(row.team_id, row.season_id): row.id for row in db.execute(
+        select(rating.id, rating.team_id, rating.season_id).where(rating.league_id == league_id)
+    ).all()}
+    by_scope: Dict[Optional[str], list] = defaultdict(list)
+    for row in games:
+        by_scope[None].append(row)
+        if row.season_id:
+            by_scope[row.season_id].append(row)
+    scopes = {None} | set(by_scope) | {season_id for _, season_id in existing}
+
+    now = datetime.utcnow()
+    updates: List[dict] = []
+    inserts: List[dict] = []
+    for season_id in scopes:
+        scope_games = by_scope.get(season_id, [])
+        elo = np.full(len(team_ids), ELO_BASE)
+        for row in scope_games:
+            h, a = index[row.home_team_id], index[row.away_team_id]
+            change = elo_change(elo[h], elo[a], row.home_score or 0, row.away_score or 0)
+            elo[h] += change
+            elo[a] -= change
+        srs, mov, played, total = scope_srs(len(team_ids), index, scope_games)
+        for i, team_id in enumerate(team_ids):
+            key = (team_id, season_id)
+            if season_id is not None and not played[i] and key not in existing:
+                continue  # Season rows only for teams that played in the season
+            values = {"elo": float(elo[i]), "srs": float(srs[i]), "mov": float(mov[i]), "sos": float(srs[i] - mov[i]),
+                      "games": int(played[i]), "margin": int(total[i]), "updated_at": now}
+            if key in existing:
+                updates.append({"id": existing[key], **values})
+            else:
+                inserts.append({"id": models.generate_uuid(), "team_id": team_id, "league_id": league_id,
+                                "season_id": season_id, **values})
+    if updates:
+        db.execute(update(rating), updates)
+    if inserts:
+        db.execute(insert(rating), inserts)
+    return {
+        "league_id": league_id,
+        "games": len(games),
+        "scopes": len(scopes),
+        "rows": len(updates) + len(inserts),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def league_ratings(db: Session, league_id: str, season_id: Optional[str] = None, sort: str = "elo") -> List[dict]:
+    """Rating rows of a league scope, best first; teams not rated yet at the starting values"""
+    rows = {row.team_id: row for row in db.query(models.TeamRating).filter(
+        models.TeamRating.league_id == league_id, scope_filter(season_id)
+    )}
+    team_ids = db.execute(select(models.Team.id).where(models.Team.league_id == league_id)).scalars().all()
+    ratings = []
+    for team_id in team_ids:
+        row = rows.get(team_id)
+        if row is None and season_id is not None:
+            continue
+        ratings.append({
+            "team_id": team_id,
+            "season_id": season_id,
+            "elo": row.elo if row else ELO_BASE,
+            "srs": row.srs if row else 0.0,
+            "mov": row.mov if row else 0.0,
+            "sos": row.sos if row else 0.0,
+            "games": row.games if row else 0,
+            "updated_at": row.updated_at if row else None,
+        })
+    ratings.sort(key=lambda entry: (-entry[sort], entry["team_id"]))
+    for rank, entry in enumerate(ratings, 1):
+        entry["rank"] = rank
+    return ratings
@@ -0,0 +1,311 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from fastapi import WebSocket
+
+
+# How long a single viewer may take to accept a frame before it is evicted
+SEND_TIMEOUT_SECONDS = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "2.0"))
+# Frames buffered per viewer before coalescing/eviction kicks in
+SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "32"))
+
+# Message types where a newer frame fully supersedes any older queued one
+COALESCE_TYPES = {"game_update", "viewer_count", "clock"}
+
+# Backplane room for cache invalidations, which have no viewers
+INVALIDATION_ROOM = "cache"
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_message(message: dict) -> str:
+    """Serialize a broadcast payload once so it can be written to every socket as-is"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+class RoomStats:
+    """Fan-out counters for a single room (latency is enqueue -> written to the socket)"""
+
+    def __init__(self):
+        self.broadcasts = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.evicted = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+
+    def record_delivery(self, elapsed_ms: float):
+        self.delivered += 1
+        self.last_ms = elapsed_ms
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "broadcasts": self.broadcasts,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "evicted": self.evicted,
+            "last_ms": round(self.last_ms, 3),
+            "avg_ms": round(self.total_ms / self.delivered, 3) if self.delivered else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class GameRoomState:
+    """Last game snapshot sent to a room, used to compute deltas and serve resyncs"""
+
+    def __init__(self):
+        self.seq = 0
+        self.snapshot: Optional[dict] = None
+        self._full_frame: Optional[str] = None
+
+    def apply(self, data: dict) -> Optional[dict]:
+        """Record a new snapshot and return the message to broadcast (None if nothing changed)"""
+        previous = self.snapshot
+        if previous is None:
+            changes = data
+        else:
+            changes = {key: value for key, value in data.items() if key not in previous or previous[key] != value}
+            if not changes:
+                return None
+        self.seq += 1
+        self.snapshot = data
+        self._full_frame = None
+        if previous is None:
+            return {"type": "game_update", "seq": self.seq, "full": True, "data": data}
+        return {"type": "game_update", "seq": self.seq, "base": self.seq - 1, "data": {"id": data.get("id"), **changes}}
+
+    def full_frame(self) -> Optional[str]:
+        if self.snapshot is None:
+            return None
+        if self._full_frame is None:
+            self._full_frame = encode_message({"type": "game_update", "seq": self.seq, "full": True, "data": self.snapshot})
+        return self._full_frame
+
+
+class ClientConnection:
+    """A viewer socket with its own bounded outbound queue, drained by a dedicated writer task"""
+
+    def __init__(self, websocket: WebSocket, room: str, manager: "ConnectionManager"):
+        self.websocket = websocket
+        self.room = room
+        self.manager = manager
+        # (message type, encoded frame, enqueue timestamp)
+        self.queue: Deque[Tuple[Optional[str], str, float]] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._writer())
+
+    def stop(self):
+        if self.task and self.task is not asyncio.current_task():
+            self.task.cancel()
+
+    def enqueue(self, kind: Optional[str], text: str, stats: RoomStats,
+                resync: Optional[Callable[[], Optional[str]]] = None) -> bool:
+        """Queue a frame without blocking. Returns False if the viewer is too far behind."""
+        if len(self.queue) >= self.manager.queue_size:
+            if kind not in COALESCE_TYPES:
+                return False
+            # Only the latest state of this type matters; drop the stale frames. Deltas can't
+            # simply be dropped, so they are replaced by a full snapshot via resync()
+            before = len(self.queue)
+            self.queue = deque(item for item in self.queue if item[0] != kind)
+            stats.coalesced += before - len(self.queue)
+            if len(self.queue) >= self.manager.queue_size:
+                return False
+            if resync is not None:
+                text = resync() or text
+        self.queue.append((kind, text, time.perf_counter()))
+        self.wakeup.set()
+        return True
+
+    async def _writer(self):
+        while True:
+            while not self.queue:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+            kind, text, enqueued_at = self.queue.popleft()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(text), timeout=self.manager.send_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await self.manager.evict(self)
+                return
+            stats = self.manager.room_stats.get(self.room)
+            if stats:
+                stats.record_delivery((time.perf_counter() - enqueued_at) * 1000)
+
+
+# WebSocket connection manager
+class ConnectionManager:
+    def __init__(self, backplane, send_timeout: float = SEND_TIMEOUT_SECONDS, queue_size: int = SEND_QUEUE_SIZE):
+        # Fans broadcasts out to every worker process (see backplane.py)
+        self.backplane = backplane
+        self.active_connections: Dict[str, Dict[WebSocket, ClientConnection]] = {}
+        self.room_stats: Dict[str, RoomStats] = {}
+        self.game_states: Dict[str, GameRoomState] = {}
+        self.send_timeout = send_timeout
+        self.queue_size = queue_size
+        self._background: Set[asyncio.Task] = set()
+        # Called with (room, data) for every game_state seen by this worker, viewers or not
+        self.game_state_hooks: List[Callable[[str, dict], None]] = []
+        # Called with (room, envelope) for every backplane event this worker receives (see response_cache.py)
+        self.delivery_hooks: List[Callable[[str, dict], None]] = []
+
+    async def start(self):
+        await self.backplane.start(self._deliver)
+
+    async def stop(self):
+        await self.backplane.stop()
+
+    async def connect(self, websocket: WebSocket, room: str):
+        await websocket.accept()
+        if room not in self.active_connections:
+            self.active_connections[room] = {}
+            self.room_stats[room] = RoomStats()
+        connection = ClientConnection(websocket, room, self)
+        self.active_connections[room][websocket] = connection
+        connection.start()
+        # Late joiners start from the current snapshot so later deltas apply cleanly
+        self.send_snapshot(websocket, room)
+        # Broadcast updated viewer count
+        await self.broadcast_viewer_count(room)
+
+    def disconnect(self, websocket: WebSocket, room: str):
+        if room in self.active_connections:
+            connection = self.active_connections[room].pop(websocket, None)
+            if connection:
+                connection.stop()
+            if not self.active_connections[room]:
+                del self.active_connections[room]
+                self.room_stats.pop(room, None)
+                self.game_states.pop(room, None)
+
+    async def evict(self, connection: ClientConnection):
+        """Drop a viewer that errored or can't keep up; it is expected to reconnect and refetch"""
+        stats = self.room_stats.get(connection.room)
+        if stats:
+            stats.evicted += 1
+        self.disconnect(connection.websocket, connection.room)
+        try:
+            # 1013 = "try again later"
+            await asyncio.wait_for(connection.websocket.close(code=1013), timeout=self.send_timeout)
+        except Exception:
+            pass
+
+    def _evict_later(self, connection: ClientConnection):
+        task = asyncio.create_task(self.evict(connection))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def get_viewer_count(self, room: str) -> int:
+        if room in self.active_connections:
+            return len(self.active_connections[room])
+        return 0
+
+    async def broadcast_viewer_count(self, room: str):
+        # Publish this worker's share; every worker then announces the total it sees at delivery
+        # time, so a late bus event can't overwrite a newer count with a stale one
+        await self.backplane.set_presence(room, self.get_viewer_count(room))
+        await self.backplane.publish(room, {"kind": "presence"})
+
+    async def broadcast(self, room: str, message: dict):
+        """Send a message to every viewer of a room, on every worker"""
+        await self.backplane.publish(room, {"kind": "broadcast", "message": message})
+
+    async def broadcast_game_state(self, room: str, data: dict):
+        """Broadcast a game snapshot to a room on every worker; each worker sends it as a delta"""
+        await self.backplane.publish(room, {"kind": "game_state", "data": data})
+
+    async def invalidate(self, tags: List[str]):
+        """Tell every worker that cached responses tagged with any of tags are out of date"""
+        await self.backplane.publish(INVALIDATION_ROOM, {"kind": "invalidate", "tags": tags})
+
+    async def _deliver(self, room: str, envelope: dict):
+        kind = envelope.get("kind")
+        for hook in self.delivery_hooks:
+            hook(room, envelope)
+        if kind == "game_state":
+            for hook in self.game_state_hooks:
+                hook(room, envelope["data"])
+        if room not in self.active_connections:
+            return
+        if kind == "broadcast":
+            await self.broadcast_local(room, envelope["message"])
+        elif kind == "game_state":
+            await self.broadcast_game_state_local(room, envelope["data"])
+        elif kind == "presence":
+            count = await self.backplane.viewer_count(room)
+            await self.broadcast_local(room, {"type": "viewer_count", "count": count})
+
+    async def broadcast_local(self, room: str, message: dict, resync: Optional[Callable[[], Optional[str]]] = None):
+        """Encode once and hand the frame to every local viewer's queue; never waits on a socket"""
+        connections = self.active_connections.get(room)
+        if not connections:
+            return
+        text = encode_message(message)
+        kind = message.get("type")
+        stats = self.room_stats.setdefault(room, RoomStats())
+        stats.broadcasts += 1
+        lagging = [conn for conn in connections.values() if not conn.enqueue(kind, text, stats, resync)]
+        for conn in lagging:
+            self._evict_later(conn)
+
+    async def broadcast_game_state_local(self, room: str, data: dict):
+        """Send a game snapshot as a versioned delta against the last one sent to the room.
+
+        Every message carries a per-room ``seq``. The first message (and any resync) is a full
+        snapshot flagged ``full``; later ones carry ``base`` (the seq they apply on top of) and
+        only the fields that changed, plus ``id``.
+        """
+        if room not in self.active_connections:
+            return
+        state = self.game_states.setdefault(room, GameRoomState())
+        message = state.apply(data)
+        if message is not None:
+            await self.broadcast_local(room, message, resync=state.full_frame)
+
+    def send_snapshot(self, websocket: WebSocket, room: str):
+        """Queue the room's current full game snapshot to a single viewer (join or resync)"""
+        state = self.game_states.get(room)
+        connection = self.active_connections.get(room, {}).get(websocket)
+        frame = state.full_frame() if state else None
+        if connection and frame:
+            if not connection.enqueue("game_update", frame, self.room_stats.setdefault(room, RoomStats())):
+                self._evict_later(connection)
+
+    def send_personal(self, websocket: WebSocket, room: str, message: dict):
+        """Queue a message to a single local socket, in order with its broadcasts"""
+        connection = self.active_connections.get(room, {}).get(websocket)
+        if connection and not connection.enqueue(message.get("type"), encode_message(message), self.room_stats.setdefault(room, RoomStats())):
+            self._evict_later(connection)
+
+    def get_game_seq(self, room: str) -> int:
+        state = self.game_states.get(room)
+        return state.seq if state else 0
+
+    def get_stats(self) -> dict:
+        """Per-room viewer counts, queue depth and fan-out latency"""
+        return {
+            room: {
+                "viewers": len(connections),
+                "max_queue_depth": max((len(c.queue) for c in connections.values()), default=0),
+                **self.room_stats.get(room, RoomStats()).to_dict(),
+            }
+            for room, connections in self.active_connections.items()
+        }
@@ -0,0 +1,92 @@
+"""
+Rebuild team, season and record-type standings from final games (see standings.recompute_league).
+Use it after a bad edit, or to check that the incrementally maintained counters are right.
+
+Usage:
+  python recompute_standings.py LEAGUE_ID [LEAGUE_ID ...]   rebuild these leagues
+  python recompute_standings.py --all                       rebuild every league
+  python recompute_standings.py --all --dry-run             only report drifted counters
+  python recompute_standings.py --bench 10000               time a rebuild of a synthetic
+                                                            league in a temp database
+"""
+
+import argparse
+import os
+import random
+import tempfile
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+import models
+import standings
+from database import Base, SessionLocal, make_engine
+
+
+def report(result: dict):
+    print(f"League {result['league_id']}: {result['rows']} rows, {len(result['mismatches'])} "
+          f"{'out of date' if result['dry_run'] else 'fixed'} in {result['elapsed_ms']} ms")
+    for mismatch in result["mismatches"][:20]:
+        print(f"  {mismatch['table']} {mismatch['id'] or '(missing)'}: {mismatch['found']} -> {mismatch['expected']}")
+
+
+def bench(games: int, teams: int = 32):
+    """Rebuild a league with `games` final games spread over 3 seasons and 2 record types"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        league = models.League(name="Bench", sport="football", season="2025")
+        db.add(league)
+        db.flush()
+        record_types = [models.RecordType(league_id=league.id, name="Overall", is_main=True),
+                        models.RecordType(league_id=league.id, name="Conference", sort_order=1)]
+        seasons = [models.Season(league_id=league.id, name=f"S{i}") for i in range(3)]
+        team_rows = [models.Team(league_id=league.id, name=f"T{i}") for i in range(teams)]
+        db.add_all(record_types + seasons + team_rows)
+        db.flush()
+        rng = random.Random(1)
+        rows = []
+        for i in range(games):
+            home, away = rng.sample(team_rows, 2)
+            rows.append({
+                "share_code": f"{i:08X}", "league_id": league.id, "home_team_id": home.id, "away_team_id": away.id,
+                "season_id": rng.choice(seasons).id, "record_type_id": rng.choice([None, record_types[1].id]),
+                "home_score": rng.randint(0, 50), "away_score": rng.randint(0, 50), "status": "final",
+            })
+        db.execute(insert(models.Game), rows)
+        db.commit()
+
+        first = standings.recompute_league(db, league.id)
+        again = standings.recompute_league(db, league.id, dry_run=True)
+        print(f"{games} games, {teams} teams: rebuilt {first['rows']} rows ({len(first['mismatches'])} changed) "
+              f"in {first['elapsed_ms']} ms; verify pass {again['elapsed_ms']} ms, {len(again['mismatches'])} mismatches")
+        db.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("league_ids", nargs="*")
+    parser.add_argument("--all", action="store_true", help="rebuild every league")
+    parser.add_argument("--dry-run", action="store_true", help="report drifted counters without fixing them")
+    parser.add_argument("--bench", type=int, metavar="GAMES", help="benchmark on a synthetic league instead")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench)
+        return
+
+    db = SessionLocal()
+    try:
+        league_ids = [league.id for league in db.query(models.League.id).all()] if args.all else args.league_ids
+        if not league_ids:
+            parser.error("give league ids or --all")
+        for league_id in league_ids:
+            report(standings.recompute_league(db, league_id, dry_run=args.dry_run))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
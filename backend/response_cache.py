@@ -0,0 +1,186 @@
+"""
+In-process cache of serialized responses for the public share-code GETs.
+
+Every viewer page load and WebSocket reconnect fetches its league, game, bracket, scoreboard
+or standalone game by share code. The first request for a code builds the response as usual;
+its JSON bytes are kept here under a key like "bracket/ABCD1234" together with a strong ETag,
+and later requests are answered from those bytes (or with 304 Not Modified when the client
+already holds that ETag) without touching the database or re-validating the schema.
+
+Entries carry tags naming what they were built from: the room of the share code
+("game:ABCD1234", "bracket:...", "scoreboard:...") and, for league data, "league:<league id>".
+Entries are dropped exactly when something they depend on is written:
+
+- every broadcast and game_state published to a room invalidates that room's tag, so the
+  update paths that already notify viewers need nothing extra;
+- writes that notify nobody (league/team/bracket edits, deletes, scoreboard settings) call
+  ConnectionManager.invalidate() with the affected tags.
+
+Both arrive through the backplane, so every worker drops its copy (see envelope_tags).
+A response built while one of its tags is being invalidated is served but not stored, so a
+slow read can never put a pre-write body back into the cache.
+
+Entries also expire after RESPONSE_CACHE_TTL_SECONDS and the least recently used entry is
+evicted beyond RESPONSE_CACHE_MAX_ENTRIES (0 disables the cache).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from fastapi import Response
+
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+
+# Room messages that do not reflect a write (the clock ticks are derived from stored fields)
+VOLATILE_TYPES = {"clock", "viewer_count"}
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    tags: tuple
+    expires_at: float
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header names this ETag (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+def envelope_tags(room: str, envelope: dict) -> List[str]:
+    """Cache tags made stale by a backplane event"""
+    kind = envelope.get("kind")
+    if kind == "invalidate":
+        return envelope["tags"]
+    if kind == "game_state":
+        return [room]
+    if kind == "broadcast" and envelope["message"].get("type") not in VOLATILE_TYPES:
+        return [room]
+    return []
+
+
+class ResponseCache:
+    """LRU + TTL map of key -> CachedResponse with a tag index for invalidation.
+
+    Handlers run in the threadpool while invalidations come from the event loop, so every
+    method takes the lock."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.keys_by_tag: Dict[str, set] = {}
+        # tag -> monotonic time it was last invalidated, to reject fills that raced a write
+        self.invalidated_at: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.stale_fills = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def begin(self) -> float:
+        """Call before reading what a response is built from; pass the result to put()"""
+        return time.monotonic()
+
+    def put(self, key: str, body: bytes, tags: Optional[Iterable[str]], started: float) -> CachedResponse:
+        """Wrap a freshly built body, storing it unless tags is None or one of them was
+        invalidated since started"""
+        now = time.monotonic()
+        entry = CachedResponse(body, make_etag(body), tuple(tags or ()), now + self.ttl_seconds)
+        if tags is None or not self.max_entries:
+            return entry
+        with self.lock:
+            if any(self.invalidated_at.get(tag, 0.0) >= started for tag in entry.tags):
+                self.stale_fills += 1
+                return entry
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = entry
+            for tag in entry.tags:
+                self.keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+        return entry
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying any of tags; returns how many were dropped"""
+        now = time.monotonic()
+        dropped = 0
+        with self.lock:
+            for tag in tags:
+                self.invalidated_at[tag] = now
+                for key in list(self.keys_by_tag.get(tag, ())):
+                    self._remove(key)
+                    dropped += 1
+            self.invalidations += dropped
+            if len(self.invalidated_at) > 4 * max(self.max_entries, 1000):
+                # Only fills still in flight care about old invalidations
+                cutoff = now - self.ttl_seconds
+                self.invalidated_at = {tag: at for tag, at in self.invalidated_at.items() if at > cutoff}
+        return dropped
+
+    def _remove(self, key: str):
+        entry = self.entries.pop(key)
+        for tag in entry.tags:
+            keys = self.keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.keys_by_tag[tag]
+
+    def respond(self, entry: CachedResponse, if_none_match: Optional[str]) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, entry.etag):
+            with self.lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "stale_fills": self.stale_fills,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,43 @@
+"""
+Per-league change counter behind the ETags of the league collection GETs.
+
+League pages refetch /api/leagues/{id}/games, /teams, /brackets, /standings and /team-records
+on every visit. leagues.revision is incremented, in the writer's own transaction, by every
+write that can change one of those responses: games (including live-state flushes and clock
+expiry), teams, brackets and their matches, seasons, record types, standings and tiebreaker
+settings. The counter lives in the database, so it is shared by all workers and survives
+restarts.
+
+A GET first reads the revision (one primary key lookup) and answers 304 Not Modified when the
+client's If-None-Match already names it, without loading or serializing anything else.
+"""
+
+from typing import Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+import models
+
+# Shared caches (a local reverse proxy) may keep the body but must revalidate it on every request
+CACHE_CONTROL = "public, no-cache"
+
+
+def bump_league(db: Session, league_id: Optional[str]):
+    """Note a change to a league's collections. Does not commit."""
+    if league_id is None:
+        return
+    db.execute(
+        update(models.League)
+        .where(models.League.id == league_id)
+        .values(revision=func.coalesce(models.League.revision, 0) + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def league_etag(db: Session, league_id: str) -> Optional[str]:
+    """Strong ETag for the league's collections as of now, or None if the league does not exist"""
+    row = db.query(models.League.revision).filter(models.League.id == league_id).first()
+    if row is None:
+        return None
+    return f'"{league_id}.{row.revision or 0}"'
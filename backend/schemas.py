@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, EmailStr
 
 
@@ -81,6 +81,7 @@ class LeagueUpdate(BaseModel):
     game_unit_label_3: Optional[str] = None
     penalties: Optional[list] = None
     mechanics: Optional[dict] = None
+    tiebreakers: Optional[list] = None  # Standings tiebreaker chain, see rankings.TIEBREAKERS
 
 
 class League(LeagueBase):
@@ -90,6 +91,7 @@ class League(LeagueBase):
     groups: Optional[str] = None  # Stored as JSON string in DB
     penalties: Optional[str] = None  # Stored as JSON string in DB
     mechanics: Optional[str] = None  # Stored as JSON string in DB
+    tiebreakers: Optional[str] = None  # Stored as JSON string in DB
     is_finished: bool = False
     created_at: datetime
     updated_at: datetime
@@ -144,6 +146,19 @@ class TeamSeasonStats(TeamSeasonStatsBase):
         from_attributes = True
 
 
+class TeamRating(BaseModel):
+    """A row of GET /api/leagues/{id}/ratings (see ratings.py)"""
+    team_id: str
+    season_id: Optional[str] = None
+    rank: int
+    elo: float
+    srs: float
+    mov: float
+    sos: float
+    games: int
+    updated_at: Optional[datetime] = None
+
+
 # RecordType Schemas
 class RecordTypeBase(BaseModel):
     name: str  # e.g., "Overall", "Conference", "Division"
@@ -272,6 +287,34 @@ class GameCreate(GameBase):
     season_id: Optional[str] = None  # Will be auto-set to current season if not provided
 
 
+class ScheduleSpec(BaseModel):
+    """Schedule generator for POST /api/leagues/{id}/games/bulk (see scheduling.py)"""
+    team_ids: Optional[List[str]] = None  # Default: every team in the league
+    double: bool = False  # Play everyone twice, home and away
+    # Meetings per pair of teams; conferences are group_1 and divisions group_2 within them
+    other_meetings: Optional[int] = None  # Default: 2 if double else 1
+    conference_meetings: Optional[int] = None  # Default: other_meetings
+    division_meetings: Optional[int] = None  # Default: conference_meetings
+    start_at: Optional[datetime] = None  # Kickoff of the first round; later rounds follow every interval_days
+    interval_days: int = 7
+    first_game_unit: int = 1  # game_unit of the first round, e.g. 1 for "Week 1"
+    game_unit_type: int = 1
+    record_type_id: Optional[str] = None
+
+
+class GameBulkCreate(BaseModel):
+    season_id: Optional[str] = None  # Default: the league's current season
+    games: List[GameBase] = []
+    generate: Optional[ScheduleSpec] = None  # Generated games are added after `games`
+
+
+class GameBulkResult(BaseModel):
+    created: int
+    season_id: Optional[str] = None
+    ids: List[str]  # In request order, generated games last
+    share_codes: List[str]
+
+
 class GameUpdate(BaseModel):
     home_team_id: Optional[str] = None
     away_team_id: Optional[str] = None
@@ -299,12 +342,11 @@ class GameUpdate(BaseModel):
     display_state: Optional[str] = None
 
 
-class GameWithTeams(BaseModel):
+class GameResponseBase(BaseModel):
+    """Game fields shared by the embedded-team and team-id response shapes"""
     id: str
     league_id: str
     season_id: Optional[str] = None
-    home_team: Team
-    away_team: Team
     home_score: int
     away_score: int
     status: str
@@ -335,6 +377,22 @@ class GameWithTeams(BaseModel):
         from_attributes = True
 
 
+class GameWithTeams(GameResponseBase):
+    home_team: Team
+    away_team: Team
+
+
+class GameWithTeamIds(GameResponseBase):
+    home_team_id: str
+    away_team_id: str
+
+
+class LeagueGames(BaseModel):
+    """Normalized game list: each team appears once in `teams`, games refer to it by id"""
+    games: List[GameWithTeamIds]
+    teams: Dict[str, Team]
+
+
 # Bracket Schemas
 class BracketBase(BaseModel):
     name: str
@@ -0,0 +1,255 @@
+"""
+Incremental standings.
+
+Team totals (league standings), TeamSeasonStats (season standings) and TeamRecord (per record
+type) are aggregates over final games. Instead of recounting, every write that can change a
+game's result snapshots the result before and after (game_result) and apply_result_change()
+adds the difference to the affected rows, in the caller's transaction. A game going final adds
+its result, a score correction on a final game swaps the old result for the new one, and
+un-finalizing or deleting a final game takes it back out.
+
+A final game counts when counts_towards_record is set. It then counts towards the teams'
+totals, their season stats, the league's main ("Overall") record and, when record_type_id names
+another record type, that record too.
+
+Standings are read in standings_order(). Each aggregate table has an index in that order
+(models.py), so SQLite keeps the order up to date as counters change and a standings query
+walks the index instead of sorting.
+
+recompute_league() is the repair path: it rebuilds all three aggregates of a league from its
+final games in one grouped query, reports where the incrementally maintained counters
+had drifted, and (unless it is a dry run) overwrites them with bulk UPDATEs. It replaces any
+manual edits of team records too, and rebuilds the league's power ratings (ratings.py).
+"""
+
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import case, func, insert, or_, select, union_all, update
+from sqlalchemy.orm import Session
+
+import models
+import ratings
+import revisions
+
+COUNTERS = ("wins", "losses", "ties", "points_for", "points_against")
+
+class GameResult(NamedTuple):
+    """What a final game contributes to standings"""
+    home_team_id: str
+    away_team_id: str
+    home_score: int
+    away_score: int
+    season_id: Optional[str]
+    record_type_id: Optional[str]
+
+
+def game_result(game: models.Game) -> Optional[GameResult]:
+    """The game's current contribution to standings, or None if it contributes nothing"""
+    if game.status != "final" or game.counts_towards_record is False:
+        return None
+    return GameResult(game.home_team_id, game.away_team_id, game.home_score or 0, game.away_score or 0,
+                      game.season_id, game.record_type_id)
+
+
+def team_deltas(result: GameResult, sign: int) -> List[Tuple[str, Dict[str, int]]]:
+    """[(team id, counter deltas)] for the home and away team"""
+    home, away = result.home_score, result.away_score
+    won, lost, tied = int(home > away), int(home < away), int(home == away)
+    return [
+        (result.home_team_id, {"wins": sign * won, "losses": sign * lost, "ties": sign * tied,
+                               "points_for": sign * home, "points_against": sign * away}),
+        (result.away_team_id, {"wins": sign * lost, "losses": sign * won, "ties": sign * tied,
+                               "points_for": sign * away, "points_against": sign * home}),
+    ]
+
+
+def main_record_type_id(db: Session, league_id: str) -> Optional[str]:
+    return db.query(models.RecordType.id).filter(
+        models.RecordType.league_id == league_id,
+        models.RecordType.is_main == True
+    ).scalar()
+
+
+def apply_result_change(db: Session, league_id: str, before: Optional[GameResult], after: Optional[GameResult]):
+    """Move the standings from a game's old result to its new one (either may be None). Does not commit."""
+    if before == after:
+        return
+    main_id = main_record_type_id(db, league_id)
+    # (model, key filter) -> summed deltas, so a team touched twice gets one UPDATE
+    changes: Dict[tuple, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    for result, sign in ((before, -1), (after, 1)):
+        if result is None:
+            continue
+        record_types = {main_id, result.record_type_id} - {None}
+        for team_id, deltas in team_deltas(result, sign):
+            targets = [(models.Team, (("id", team_id),))]
+            if result.season_id:
+                targets.append((models.TeamSeasonStats, (("team_id", team_id), ("season_id", result.season_id))))
+            for record_type_id in record_types:
+                targets.append((models.TeamRecord, (("team_id", team_id), ("record_type_id", record_type_id))))
+            for target in targets:
+                for counter, delta in deltas.items():
+                    changes[target][counter] += delta
+    for (model, keys), deltas in changes.items():
+        add_counters(db, model, dict(keys), deltas)
+    ratings.apply_result_change(db, league_id, before, after)
+
+
+def add_counters(db: Session, model, keys: dict, deltas: Dict[str, int]):
+    """counter += delta on the row matching keys, creating the row for a missing stats/record entry"""
+    deltas = {counter: delta for counter, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    query = db.query(model).filter(*(getattr(model, key) == value for key, value in keys.items()))
+    updated = query.update(
+        {getattr(model, counter): func.coalesce(getattr(model, counter), 0) + delta for counter, delta in deltas.items()},
+        synchronize_session=False
+    )
+    if not updated and model is not models.Team:
+        # Teams added after the season/record type was created have no row yet. A missing row
+        # never counted the result being taken out, so only an added result creates one.
+        if all(delta > 0 for delta in deltas.values()):
+            db.add(model(**keys, **{counter: deltas.get(counter, 0) for counter in COUNTERS}))
+            db.flush()
+        elif any(delta > 0 for delta in deltas.values()):
+            # A correction whose old result was never counted here: the summed deltas can't be split
+            print(f"No {model.__tablename__} row for {keys}; run the standings recompute to add it")
+
+
+def remove_game_results(db: Session, games: List[models.Game]):
+    """Take games that are about to be deleted out of the standings. Does not commit."""
+    for game in games:
+        apply_result_change(db, game.league_id, game_result(game), None)
+
+
+def standings_order(model) -> tuple:
+    """ORDER BY for a standings query: most wins, fewest losses, best point differential.
+    Must match the standings indexes in models.py for SQLite to read rows in index order."""
+    return (model.wins.desc(), model.losses, model.points_against - model.points_for)
+
+
+
+def result_sides(league_id: str):
+    """Subquery with one row per team per counted final game of the league: team_id,
+    season_id, record_type_id and that game's counter values for the team"""
+    game = models.Game
+    counted = [
+        game.league_id == league_id,
+        game.status == "final",
+        or_(game.counts_towards_record.is_(None), game.counts_towards_record == True),
+    ]
+    sides = []
+    for team_id, scored, allowed in ((game.home_team_id, game.home_score, game.away_score),
+                                     (game.away_team_id, game.away_score, game.home_score)):
+        scored, allowed = func.coalesce(scored, 0), func.coalesce(allowed, 0)
+        sides.append(select(
+            team_id.label("team_id"),
+            game.season_id.label("season_id"),
+            game.record_type_id.label("record_type_id"),
+            case((scored > allowed, 1), else_=0).label("wins"),
+            case((scored < allowed, 1), else_=0).label("losses"),
+            case((scored == allowed, 1), else_=0).label("ties"),
+            scored.label("points_for"),
+            allowed.label("points_against"),
+        ).where(*counted))
+    return union_all(*sides).subquery("sides")
+
+
+def aggregate(db: Session, league_id: str, main_id: Optional[str]) -> Tuple[dict, dict, dict]:
+    """Totals per team, per (team, season) and per (team, non-main record type). One grouped
+    query over the games at (team, season, record type) grain; the few resulting groups are
+    rolled up into the three targets here."""
+    sides = result_sides(league_id)
+    group_by = (sides.c.team_id, sides.c.season_id, sides.c.record_type_id)
+    rows = db.execute(
+        select(*group_by, *(func.sum(getattr(sides.c, counter)) for counter in COUNTERS)).group_by(*group_by)
+    ).all()
+    overall, by_season, by_record_type = (defaultdict(lambda: dict.fromkeys(COUNTERS, 0)) for _ in range(3))
+    for team_id, season_id, record_type_id, *sums in rows:
+        targets = [overall[(team_id,)]]
+        if season_id is not None:
+            targets.append(by_season[(team_id, season_id)])
+        if record_type_id is not None and record_type_id != main_id:
+            targets.append(by_record_type[(team_id, record_type_id)])
+        for totals in targets:
+            for counter, value in zip(COUNTERS, sums):
+                totals[counter] += value or 0
+    return dict(overall), dict(by_season), dict(by_record_type)
+
+
+def recompute_league(db: Session, league_id: str, dry_run: bool = False) -> dict:
+    """Rebuild a league's standings from its final games. Commits unless dry_run.
+    Returns row counts, elapsed time and the counters that differed from the rebuilt values."""
+    started = time.perf_counter()
+    main_id = main_record_type_id(db, league_id)
+    overall, by_season, by_record_type = aggregate(db, league_id, main_id)
+
+    zero = dict.fromkeys(COUNTERS, 0)
+    counters = [getattr(models.Team, counter) for counter in COUNTERS]
+    teams = db.execute(select(models.Team.id, *counters).where(models.Team.league_id == league_id)).all()
+    # (model, row id, expected counters, current counters) for every existing row
+    rows = [(models.Team, row[0], overall.get((row[0],), zero), row[1:]) for row in teams]
+    team_ids = {row[0] for row in teams}
+
+    stats = models.TeamSeasonStats
+    season_rows = db.execute(
+        select(stats.id, stats.team_id, stats.season_id, *(getattr(stats, counter) for counter in COUNTERS))
+        .join(models.Season, models.Season.id == stats.season_id)
+        .where(models.Season.league_id == league_id)
+    ).all()
+    rows += [(stats, row[0], by_season.get((row[1], row[2]), zero), row[3:]) for row in season_rows]
+    existing_stats = {(row[1], row[2]) for row in season_rows}
+    # Rows the incremental path would have created on demand: (model, keys, expected counters)
+    missing = [(stats, {"team_id": team_id, "season_id": season_id}, totals)
+               for (team_id, season_id), totals in by_season.items()
+               if team_id in team_ids and (team_id, season_id) not in existing_stats]
+
+    records = models.TeamRecord
+    record_rows = db.execute(
+        select(records.id, records.team_id, records.record_type_id, *(getattr(records, counter) for counter in COUNTERS))
+        .join(models.RecordType, models.RecordType.id == records.record_type_id)
+        .where(models.RecordType.league_id == league_id)
+    ).all()
+    for row in record_rows:
+        # The main record holds every counted game, other record types only their own games
+        expected = overall.get((row[1],), zero) if row[2] == main_id else by_record_type.get((row[1], row[2]), zero)
+        rows.append((records, row[0], expected, row[3:]))
+    existing_records = {(row[1], row[2]) for row in record_rows}
+    expected_records = dict(by_record_type)
+    if main_id:
+        expected_records.update({(team_id, main_id): overall.get((team_id,), zero) for team_id in team_ids})
+    missing += [(records, {"team_id": team_id, "record_type_id": record_type_id}, totals)
+                for (team_id, record_type_id), totals in expected_records.items()
+                if team_id in team_ids and (team_id, record_type_id) not in existing_records]
+
+    mismatches = []
+    updates = defaultdict(list)
+    for model, row_id, expected, current in rows:
+        expected = {counter: int(expected[counter] or 0) for counter in COUNTERS}
+        if tuple(expected.values()) != tuple(value or 0 for value in current):
+            mismatches.append({"table": model.__tablename__, "id": row_id, "expected": expected,
+                               "found": dict(zip(COUNTERS, current))})
+            updates[model].append({"id": row_id, **expected})
+    for model, keys, totals in missing:
+        mismatches.append({"table": model.__tablename__, "id": None, **keys,
+                           "expected": {counter: int(totals[counter] or 0) for counter in COUNTERS}, "found": None})
+
+    if not dry_run:
+        for model, params in updates.items():
+            db.execute(update(model), params)
+        for model in {model for model, _, _ in missing}:
+            db.execute(insert(model), [{**keys, **{counter: int(totals[counter] or 0) for counter in COUNTERS}}
+                                       for missing_model, keys, totals in missing if missing_model is model])
+        ratings.rebuild_league(db, league_id)
+        revisions.bump_league(db, league_id)
+        db.commit()
+
+    return {
+        "league_id": league_id,
+        "rows": len(rows),
+        "mismatches": mismatches,
+        "dry_run": dry_run,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
@@ -232,10 +232,26 @@ export function createWebSocket(type, shareCode, onMessage) {
   const wsUrl = `${protocol}//${window.location.host}/ws/${type}/${shareCode}`;
   
   const ws = new WebSocket(wsUrl);
+  // game_update messages are versioned deltas; track the last applied seq so gaps trigger a resync
+  let lastSeq = null;
+  // After a resync, deltas are dropped until the full snapshot arrives
+  let awaitingFull = false;
   
   ws.onmessage = (event) => {
     try {
       const data = JSON.parse(event.data);
+      if (data.type === 'game_update' && data.seq !== undefined) {
+        if (!data.full) {
+          if (awaitingFull) return;
+          if (lastSeq !== null && data.base !== lastSeq) {
+            awaitingFull = true;
+            ws.send(JSON.stringify({ type: 'resync' }));
+            return;
+          }
+        }
+        awaitingFull = false;
+        lastSeq = data.seq;
+      }
       onMessage(data);
     } catch (e) {
       console.error('WebSocket message parse error:', e, event.data);
@@ -249,6 +265,62 @@ export function createWebSocket(type, shareCode, onMessage) {
   return ws;
 }
 
+// Controller connection: an authenticated game socket that carries updates instead of PUT requests.
+// update() resolves with the server ack ({ seq }) or rejects with the nack detail.
+export function createGameController(shareCode, onMessage) {
+  const pending = new Map();
+  let nextRef = 1;
+  let ready = false;
+  let pingTimer = null;
+
+  const ws = createWebSocket('game', shareCode, (message) => {
+    if (message.type === 'auth_ok') {
+      ready = true;
+      // Pings on the controller socket are this controller's heartbeat
+      clearInterval(pingTimer);
+      pingTimer = setInterval(() => {
+        if (ws.readyState === WebSocket.OPEN) ws.send(JSON.stringify({ type: 'ping' }));
+      }, (message.ping_interval || 5) * 1000);
+    } else if (message.type === 'auth_error') {
+      ready = false;
+    } else if (message.type === 'pong') {
+      return;
+    } else if (message.type === 'ack' || message.type === 'nack') {
+      const entry = pending.get(message.ref);
+      if (!entry) return;
+      pending.delete(message.ref);
+      if (message.type === 'ack') {
+        entry.resolve(message);
+      } else {
+        entry.reject(new Error(typeof message.detail === 'string' ? message.detail : 'Update rejected'));
+      }
+    } else {
+      onMessage(message);
+    }
+  });
+
+  ws.addEventListener('open', () => {
+    ws.send(JSON.stringify({ type: 'auth', token: localStorage.getItem('token') }));
+  });
+  ws.addEventListener('close', () => {
+    ready = false;
+    clearInterval(pingTimer);
+    pending.forEach((entry) => entry.reject(new Error('Connection closed')));
+    pending.clear();
+  });
+
+  return {
+    isReady: () => ready && ws.readyState === WebSocket.OPEN,
+    update: (data) => new Promise((resolve, reject) => {
+      const ref = nextRef++;
+      pending.set(ref, { resolve, reject });
+      ws.send(JSON.stringify({ type: 'update', ref, data }));
+    }),
+    // 1000 tells the server this controller left on purpose (no tech difficulties)
+    close: () => ws.close(1000),
+  };
+}
+
 // Invite API
 export const inviteApi = {
   send: (data) => fetchApi('/invites', { method: 'POST', body: JSON.stringify(data) }),
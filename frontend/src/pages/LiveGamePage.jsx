@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback, useRef } from 'react'
+import { useState, useEffect, useCallback, useRef, useMemo } from 'react'
 import { useParams } from 'react-router-dom'
 import { Plus, Minus, Play, Square, Share2, Copy, Check, Trophy, RotateCcw, Flag, Pause, Volume2, Bell, Search, X, Eye, EyeOff, Video, Upload, Trash2, Zap, Send, Settings, Keyboard } from 'lucide-react'
 import { Button } from '@/components/ui/button'
@@ -20,7 +20,7 @@ import {
   DialogHeader,
   DialogTitle,
 } from '@/components/ui/dialog'
-import { gameApi, standaloneGameApi, teamApi, bracketApi, createWebSocket, inviteApi } from '@/lib/api'
+import { gameApi, standaloneGameApi, teamApi, bracketApi, createGameController, inviteApi } from '@/lib/api'
 import { useAuth } from '@/lib/auth'
 import { GameScoreboardDisplay } from '@/components/GameScoreboardDisplay'
 import { HelpButton, FirstTimeTutorial } from '@/components/HelpTips'
@@ -94,7 +94,15 @@ export default function LiveGamePage({ standalone = false }) {
   const [copied, setCopied] = useState(false)
   
   // Use appropriate API based on standalone prop
-  const api = standalone ? standaloneGameApi : gameApi
+  const baseApi = standalone ? standaloneGameApi : gameApi
+  const controllerRef = useRef(null)
+  // Send updates over the authenticated game socket when it's connected, falling back to PUT
+  const api = useMemo(() => ({
+    ...baseApi,
+    update: (id, data) => controllerRef.current?.isReady()
+      ? controllerRef.current.update(data)
+      : baseApi.update(id, data),
+  }), [baseApi])
   
   // Timer state
   const [timerRunning, setTimerRunning] = useState(false)
@@ -334,10 +342,8 @@ export default function LiveGamePage({ standalone = false }) {
           if (currentSeconds > 0) {
             // Mark that timer should resume - will be handled after component mounts
             data._shouldResumeTimer = true
-          } else {
-            // Timer ran out while away, stop it
-            api.update(gameId, { game_time: '0:00', timer_running: false }).catch(() => {})
           }
+          // If it ran out while away, the server has already stopped it at 0:00
         } else {
           // Invalid elapsed time, stop the timer
           api.update(gameId, { timer_running: false }).catch(() => {})
@@ -493,7 +499,7 @@ export default function LiveGamePage({ standalone = false }) {
   useEffect(() => {
     if (!game?.share_code) return
 
-    const ws = createWebSocket('game', game.share_code, (message) => {
+    const controller = createGameController(game.share_code, (message) => {
       // Controller is the source of truth for game_time and play_clock - ALWAYS ignore from WebSocket
       // This prevents the clocks from jumping around due to stale updates
       if (message.type === 'game_update') {
@@ -507,8 +513,12 @@ export default function LiveGamePage({ standalone = false }) {
         })
       }
     })
+    controllerRef.current = controller
 
-    return () => ws.close()
+    return () => {
+      controllerRef.current = null
+      controller.close()
+    }
   }, [game?.share_code])
 
   // Countdown timer for scheduled games and pregame state
@@ -1326,7 +1336,7 @@ export default function LiveGamePage({ standalone = false }) {
     if (newSeconds <= 0) {
       timerRunningRef.current = false
       setTimerRunning(false)
-      api.update(gameId, { game_time: '0:00', timer_running: false }).catch(() => {})
+      // The server's game clock stops and persists the timer at 0:00 on its own
       if (['Q1', 'Q2', 'Q3'].includes(currentGame.quarter)) {
         setGameStatus('end-quarter')
       } else if (currentGame.quarter === 'Q4') {
@@ -1353,12 +1363,6 @@ export default function LiveGamePage({ standalone = false }) {
       return
     }
     
-    // Sync to server periodically (every 5 seconds) to trigger WebSocket broadcasts
-    // Backend calculates live time from timer_started_at, so we don't send game_time
-    if (newSeconds % 5 === 0) {
-      api.update(gameId, { quarter: currentGame.quarter }).catch(() => {})
-    }
-    
     // Schedule next tick
     if (timerRunningRef.current) {
       setTimeout(doGameTick, 1000)
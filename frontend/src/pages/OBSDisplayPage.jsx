@@ -48,6 +48,9 @@ export default function OBSDisplayPage() {
     const ws = createWebSocket('game', code, (message) => {
       if (message.type === 'game_update') {
         setGame((prev) => ({ ...prev, ...message.data }))
+      } else if (message.type === 'clock') {
+        // The server runs the game clock and ticks it to every display
+        setGame((prev) => prev ? { ...prev, game_time: message.game_time, timer_running: message.running } : prev)
       } else if (message.type === 'viewer_count') {
         setViewerCount(message.count)
       }
@@ -56,27 +59,6 @@ export default function OBSDisplayPage() {
     return () => ws.close()
   }, [code])
 
-  // Check heartbeat every 5 seconds to detect controller crash
-  useEffect(() => {
-    if (!game?.id || game?.status !== 'live') return
-    
-    const checkHeartbeat = async () => {
-      try {
-        await gameApi.checkHeartbeat(game.id)
-        // The server will automatically set tech difficulties if heartbeat timed out
-        // and broadcast the update via WebSocket
-      } catch (err) {
-        console.error('Heartbeat check failed:', err)
-      }
-    }
-    
-    // Check immediately and then every 5 seconds
-    checkHeartbeat()
-    const interval = setInterval(checkHeartbeat, 5000)
-    
-    return () => clearInterval(interval)
-  }, [game?.id, game?.status])
-
   // Handle fade effect when scores change
   useEffect(() => {
     if (!game || !fade) return
@@ -94,39 +76,6 @@ export default function OBSDisplayPage() {
     }
   }, [game?.home_score, game?.away_score, fade, prevScores])
 
-  // Live clock calculation - update every second when timer is running
-  const [liveGameTime, setLiveGameTime] = useState(null)
-  
-  useEffect(() => {
-    if (!game?.timer_running || !game?.timer_started_at || game?.timer_started_seconds === null) {
-      setLiveGameTime(null)
-      return
-    }
-    
-    const calculateLiveTime = () => {
-      const startedAt = new Date(game.timer_started_at)
-      const now = new Date()
-      const elapsedSeconds = Math.floor((now - startedAt) / 1000)
-      // Sanity check: elapsed time should be positive and reasonable
-      if (elapsedSeconds < 0 || elapsedSeconds > 86400) {
-        setLiveGameTime(null)
-        return
-      }
-      const currentSeconds = Math.max(0, game.timer_started_seconds - elapsedSeconds)
-      const mins = Math.floor(currentSeconds / 60)
-      const secs = currentSeconds % 60
-      setLiveGameTime(`${mins}:${secs.toString().padStart(2, '0')}`)
-    }
-    
-    // Calculate immediately
-    calculateLiveTime()
-    
-    // Update every second
-    const interval = setInterval(calculateLiveTime, 1000)
-    
-    return () => clearInterval(interval)
-  }, [game?.timer_running, game?.timer_started_at, game?.timer_started_seconds])
-
   if (loading) {
     return <div className="min-h-screen bg-transparent" />
   }
@@ -152,7 +101,7 @@ export default function OBSDisplayPage() {
     return `${mins}:${secs.toString().padStart(2, '0')}`
   }
 
-  const timerDisplay = game.simple_mode ? formatTimer(game.timer_seconds) : (liveGameTime || game.game_time)
+  const timerDisplay = game.simple_mode ? formatTimer(game.timer_seconds) : game.game_time
 
   // Fade transition style
   const fadeStyle = fade ? {
@@ -469,14 +418,11 @@ export default function OBSDisplayPage() {
      game.quarter === 'Halftime' ? 'halftime-show' : null)
 
   // DEFAULT LAYOUT - Same as share page display, just no background, wider to reduce height
-  // Create game object with live time
-  const gameWithLiveTime = liveGameTime ? { ...game, game_time: liveGameTime } : game
-
   return (
     <div className="min-h-screen flex items-center justify-center p-4" style={fadeStyle}>
       <div className="max-w-6xl w-full">
         <GameScoreboardDisplay 
-          game={gameWithLiveTime}
+          game={game}
           displayState={displayState}
           possession={displayState.possession || game.possession}
           down={displayState.down || game.down}
@@ -57,6 +57,9 @@ export default function SharePage() {
         setViewerCount(message.count)
       } else if (type === 'game' && message.type === 'game_update') {
         setData((prev) => ({ ...prev, ...message.data }))
+      } else if (type === 'game' && message.type === 'clock') {
+        // The server runs the game clock and ticks it to every viewer
+        setData((prev) => ({ ...prev, game_time: message.game_time, timer_running: message.running }))
       } else if (type === 'scoreboard') {
         if (message.type === 'player_updated') {
           setData((prev) => ({
@@ -138,39 +141,6 @@ export default function SharePage() {
 }
 
 function SharedGame({ game, viewerCount }) {
-  const [liveGameTime, setLiveGameTime] = useState(null)
-  
-  // Live clock calculation - update every second when timer is running
-  useEffect(() => {
-    if (!game?.timer_running || !game?.timer_started_at || game?.timer_started_seconds === null) {
-      setLiveGameTime(null)
-      return
-    }
-    
-    const calculateLiveTime = () => {
-      const startedAt = new Date(game.timer_started_at)
-      const now = new Date()
-      const elapsedSeconds = Math.floor((now - startedAt) / 1000)
-      // Sanity check: elapsed time should be positive and reasonable
-      if (elapsedSeconds < 0 || elapsedSeconds > 86400) {
-        setLiveGameTime(null)
-        return
-      }
-      const currentSeconds = Math.max(0, game.timer_started_seconds - elapsedSeconds)
-      const mins = Math.floor(currentSeconds / 60)
-      const secs = currentSeconds % 60
-      setLiveGameTime(`${mins}:${secs.toString().padStart(2, '0')}`)
-    }
-    
-    // Calculate immediately
-    calculateLiveTime()
-    
-    // Update every second
-    const interval = setInterval(calculateLiveTime, 1000)
-    
-    return () => clearInterval(interval)
-  }, [game?.timer_running, game?.timer_started_at, game?.timer_started_seconds])
-
   // Parse display state from JSON - handle both string and object
   let displayState = {}
   try {
@@ -189,13 +159,10 @@ function SharedGame({ game, viewerCount }) {
      game.quarter === 'Final' ? 'final' : 
      game.quarter === 'Halftime' ? 'halftime-show' : null)
 
-  // Create game object with live time
-  const gameWithLiveTime = liveGameTime ? { ...game, game_time: liveGameTime } : game
-
   return (
     <div className="max-w-2xl mx-auto space-y-4">
       <GameScoreboardDisplay 
-        game={gameWithLiveTime}
+        game={game}
         displayState={displayState}
         possession={game.possession}
         down={game.down}